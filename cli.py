@@ -88,5 +88,67 @@ def checkin_example_data():
         initialize_checkin_data(db=session)
 
 
+@app.command()
+def benchmark_rate_limiter(
+    requests: int = 20000, keys: int = 1000, with_postgres: bool = False
+):
+    from scripts.benchmark_rate_limiter import benchmark_rate_limiter
+
+    benchmark_rate_limiter(requests=requests, keys=keys, with_postgres=with_postgres)
+
+
+@app.command()
+def benchmark_rate_limiter_algorithms(
+    keys: int = 100_000, limit: int = 100, requests_per_key: int = 20
+):
+    from scripts.benchmark_rate_limiter import benchmark_rate_limiter_algorithms
+
+    benchmark_rate_limiter_algorithms(
+        keys=keys, limit=limit, requests_per_key=requests_per_key
+    )
+
+
+@app.command()
+def benchmark_path_matcher(patterns: int = 300, paths: int = 10000):
+    from scripts.benchmark_rate_limiter import benchmark_path_matcher
+
+    benchmark_path_matcher(patterns=patterns, paths=paths)
+
+
+@app.command()
+def benchmark_middleware(requests: int = 5000, concurrency: int = 20):
+    from scripts.benchmark_middleware import benchmark_middleware
+
+    benchmark_middleware(requests=requests, concurrency=concurrency)
+
+
+@app.command()
+def benchmark_token_lookup(rows: int = 1_000_000, lookups: int = 200):
+    from scripts.benchmark_token_lookup import benchmark_token_lookup
+
+    benchmark_token_lookup(rows=rows, lookups=lookups)
+
+
+@app.command()
+def benchmark_statement_cache(calls: int = 2000):
+    from scripts.benchmark_statement_cache import benchmark_statement_cache
+
+    benchmark_statement_cache(calls=calls)
+
+
+@app.command()
+def benchmark_schedule_search(schedules: int = 10_000, runs: int = 20):
+    from scripts.benchmark_schedule_search import benchmark_schedule_search
+
+    benchmark_schedule_search(schedules=schedules, runs=runs)
+
+
+@app.command()
+def benchmark_import_time(module: str = "main", runs: int = 5, top: int = 15):
+    from scripts.benchmark_import_time import benchmark_import_time
+
+    benchmark_import_time(module=module, runs=runs, top=top)
+
+
 if __name__ == "__main__":
     app()
@@ -0,0 +1,124 @@
+import threading
+import time
+from bisect import bisect_left
+from typing import Optional
+
+from sqlalchemy import exc
+from sqlalchemy.pool import QueuePool
+
+# Upper bounds in milliseconds of the checkout wait histogram buckets
+WAIT_BUCKETS_MS = (1, 5, 10, 50, 100, 500, 1000, 5000)
+
+
+class PoolMetrics:
+    """
+    Checkout counters of one connection pool
+
+    A checkout is timed from asking the pool for a connection until one is
+    handed out, so it includes waiting for a free connection and opening a
+    new one.
+    """
+
+    def __init__(self):
+        self.checkouts = 0
+        self.timeouts = 0
+        self.waiting = 0
+        self.wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+        self.wait_histogram = [0] * (len(WAIT_BUCKETS_MS) + 1)
+        self.last_timeout_at: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def start_wait(self) -> None:
+        with self._lock:
+            self.waiting += 1
+
+    def fail_wait(self, timed_out: bool) -> None:
+        with self._lock:
+            self.waiting -= 1
+            if timed_out:
+                self.timeouts += 1
+                self.last_timeout_at = time.monotonic()
+
+    def end_wait(self, seconds: float) -> None:
+        with self._lock:
+            self.waiting -= 1
+            self.checkouts += 1
+            self.wait_seconds += seconds
+            self.max_wait_seconds = max(self.max_wait_seconds, seconds)
+            self.wait_histogram[bisect_left(WAIT_BUCKETS_MS, seconds * 1000)] += 1
+
+    def snapshot(self, pool: "_InstrumentedPool") -> dict:
+        with self._lock:
+            histogram = {
+                f"le_{bound}ms": count
+                for bound, count in zip(WAIT_BUCKETS_MS, self.wait_histogram)
+            }
+            histogram["inf"] = self.wait_histogram[-1]
+            counters = {
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "waiting": self.waiting,
+                "wait_seconds": self.wait_seconds,
+                "max_wait_seconds": self.max_wait_seconds,
+                "wait_histogram": histogram,
+                "seconds_since_timeout": None
+                if self.last_timeout_at is None
+                else time.monotonic() - self.last_timeout_at,
+            }
+
+        # No capacity with max_overflow=-1, the pool opens as many as asked
+        capacity = None
+        if pool.max_overflow >= 0:
+            capacity = pool.size() + pool.max_overflow
+        checked_out = pool.checkedout()
+        return {
+            "size": pool.size(),
+            "capacity": capacity,
+            "checked_out": checked_out,
+            # overflow() starts at -pool_size, it counts connections beyond it
+            "overflow": max(pool.overflow(), 0),
+            "saturated": capacity is not None and checked_out >= capacity,
+            **counters,
+        }
+
+
+class _InstrumentedPool:
+    metrics: Optional[PoolMetrics] = None
+
+    def __init__(self, *args, max_overflow: int = 10, **kwargs):
+        super().__init__(*args, max_overflow=max_overflow, **kwargs)
+        self.max_overflow = max_overflow
+
+    def connect(self):
+        metrics = self.metrics
+        if metrics is None:
+            return super().connect()
+
+        metrics.start_wait()
+        start = time.perf_counter()
+        try:
+            connection = super().connect()
+        except BaseException as e:
+            metrics.fail_wait(timed_out=isinstance(e, exc.TimeoutError))
+            raise
+        metrics.end_wait(time.perf_counter() - start)
+        return connection
+
+    def recreate(self):
+        # engine.dispose() replaces the pool, keep counting on the new one
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        return pool
+
+
+class InstrumentedQueuePool(_InstrumentedPool, QueuePool):
+    """QueuePool recording checkouts in `metrics`"""
+
+
+def instrument(engine) -> PoolMetrics:
+    """Attach a new PoolMetrics to the instrumented pool of `engine`"""
+    pool = engine.pool
+    metrics = PoolMetrics()
+    pool.metrics = metrics
+    return metrics
@@ -1,4 +1,6 @@
-from fastapi_mail import ConnectionConfig, FastMail, MessageSchema
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
 from settings import (
     MAIL_USERNAME,
     MAIL_PASSWORD,
@@ -11,58 +13,64 @@ from settings import (
     USE_CREDENTIALS,
 )
 
+if TYPE_CHECKING:
+    from fastapi_mail import ConnectionConfig
 
-conf_static = ConnectionConfig(
-    MAIL_USERNAME=MAIL_USERNAME,
-    MAIL_PASSWORD=MAIL_PASSWORD,
-    MAIL_FROM=MAIL_FROM,
-    MAIL_PORT=MAIL_PORT,
-    MAIL_SERVER=MAIL_SERVER,
-    MAIL_FROM_NAME=MAIL_FROM_NAME,
-    MAIL_STARTTLS=MAIL_TLS,
-    MAIL_SSL_TLS=MAIL_SSL,
-    USE_CREDENTIALS=USE_CREDENTIALS,
-    TEMPLATE_FOLDER="./core/mail_templates/",
-)
 
+@lru_cache(maxsize=None)
+def get_mail_config() -> "ConnectionConfig":
+    # fastapi_mail is slow to import, it is loaded with the first email
+    from fastapi_mail import ConnectionConfig
 
-async def try_send_email(recipient: str, name: str = "User"):
-    """
-    Function untuk kirim email \n
-    """
-    fm = FastMail(conf_static)
+    return ConnectionConfig(
+        MAIL_USERNAME=MAIL_USERNAME,
+        MAIL_PASSWORD=MAIL_PASSWORD,
+        MAIL_FROM=MAIL_FROM,
+        MAIL_PORT=MAIL_PORT,
+        MAIL_SERVER=MAIL_SERVER,
+        MAIL_FROM_NAME=MAIL_FROM_NAME,
+        MAIL_STARTTLS=MAIL_TLS,
+        MAIL_SSL_TLS=MAIL_SSL,
+        USE_CREDENTIALS=USE_CREDENTIALS,
+        TEMPLATE_FOLDER="./core/mail_templates/",
+    )
+
+
+async def _send(recipient: str, subject: str, template_body: dict, template_name: str):
+    from fastapi_mail import FastMail, MessageSchema
+
+    fm = FastMail(get_mail_config())
     await fm.send_message(
         message=MessageSchema(
-            subject="Test email",
+            subject=subject,
             recipients=[recipient],
-            template_body={"name": name},
+            template_body=template_body,
             subtype="html",
         ),
-        template_name="test_email.html",
+        template_name=template_name,
     )
 
 
+async def try_send_email(recipient: str, name: str = "User"):
+    """
+    Function untuk kirim email \n
+    """
+    await _send(recipient, "Test email", {"name": name}, "test_email.html")
+
+
 async def send_email_verfication(recipient: str, activation_link: str):
-    fm = FastMail(conf_static)
-    await fm.send_message(
-        message=MessageSchema(
-            subject="Activate your account",
-            recipients=[recipient],
-            template_body={"activation_link": activation_link},
-            subtype="html",
-        ),
-        template_name="email_verification.html",
+    await _send(
+        recipient,
+        "Activate your account",
+        {"activation_link": activation_link},
+        "email_verification.html",
     )
 
 
 async def send_reset_password_email(recipient: str, reset_link: str):
-    fm = FastMail(conf_static)
-    await fm.send_message(
-        message=MessageSchema(
-            subject="Reset your password",
-            recipients=[recipient],
-            template_body={"reset_link": reset_link},
-            subtype="html",
-        ),
-        template_name="reset_password.html",
+    await _send(
+        recipient,
+        "Reset your password",
+        {"reset_link": reset_link},
+        "reset_password.html",
     )
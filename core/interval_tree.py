@@ -0,0 +1,58 @@
+from typing import Any, Generic, Iterable, TypeVar
+
+T = TypeVar("T")
+
+
+class IntervalTree(Generic[T]):
+    """
+    Static interval tree of half-open [start, end) intervals
+
+    The intervals are sorted by start and the middle one of every slice is
+    the root of its subtree, so the tree is balanced without rotations.
+    Each root keeps the latest end in its subtree, a query skips subtrees
+    that end before it starts and everything right of a root that starts
+    after it ends: O(log n + k) per query instead of a scan. Empty
+    intervals, start >= end, overlap nothing, like empty Postgres ranges.
+    """
+
+    def __init__(self, intervals: Iterable[tuple[Any, Any, T]]):
+        nodes = sorted(
+            (interval for interval in intervals if interval[0] < interval[1]),
+            key=lambda interval: interval[0],
+        )
+        self._starts = [start for start, _, _ in nodes]
+        self._ends = [end for _, end, _ in nodes]
+        self._values = [value for _, _, value in nodes]
+        self._max_ends = list(self._ends)
+        if nodes:
+            self._build(0, len(nodes))
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def _build(self, lo: int, hi: int) -> Any:
+        mid = (lo + hi) // 2
+        for child in ((lo, mid), (mid + 1, hi)):
+            if child[0] < child[1]:
+                self._max_ends[mid] = max(self._max_ends[mid], self._build(*child))
+        return self._max_ends[mid]
+
+    def overlapping(self, start: Any, end: Any) -> list[T]:
+        """Values of the intervals overlapping [start, end), by start"""
+        found: list[T] = []
+        if start < end and self._values:
+            self._search(0, len(self._values), start, end, found)
+        return found
+
+    def _search(self, lo: int, hi: int, start: Any, end: Any, found: list) -> None:
+        mid = (lo + hi) // 2
+        if self._max_ends[mid] <= start:
+            return
+        if lo < mid:
+            self._search(lo, mid, start, end, found)
+        if self._starts[mid] >= end:
+            return
+        if self._ends[mid] > start:
+            found.append(self._values[mid])
+        if mid + 1 < hi:
+            self._search(mid + 1, hi, start, end, found)
@@ -0,0 +1,213 @@
+import asyncio
+import sys
+import threading
+import time
+import traceback
+from collections import Counter, deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from core.log import logger
+
+# "METHOD path" of the request a task is serving, set by LoopMonitorMiddleware
+current_route: ContextVar[Optional[str]] = ContextVar("current_route", default=None)
+
+
+def _percentile(ordered: list[float], percent: float) -> float:
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, int(len(ordered) * percent / 100))]
+
+
+class LoopLagMonitor:
+    """
+    Measure event loop lag and catch whatever blocks the loop
+
+    A probe task sleeps `interval` seconds in a loop, how late it wakes up
+    is the lag. A watchdog thread notices when the probe is more than
+    `threshold` seconds late, and while the loop is still blocked samples
+    the stack of the loop thread and the route of the running task. The
+    stack sampled most often is reported, so a short hiccup right before
+    the blocking call isn't blamed for it. Reports are logged and kept in
+    `blocked` (the last `max_reports`).
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.1,
+        interval: float = 0.05,
+        max_samples: int = 10000,
+        max_reports: int = 50,
+    ):
+        self.threshold = threshold
+        self.interval = interval
+        self.samples: deque[float] = deque(maxlen=max_samples)
+        self.blocked: deque[dict] = deque(maxlen=max_reports)
+        self.blocked_count = 0
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread_id: Optional[int] = None
+        self._task: Optional[asyncio.Task] = None
+        self._watchdog: Optional[threading.Thread] = None
+        self._stopped = threading.Event()
+        self._heartbeat = 0.0
+        self._pending: Optional[dict] = None
+        self._lock = threading.Lock()
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        """Start monitoring the running event loop"""
+        loop = asyncio.get_running_loop()
+        if self.running and self._loop is loop:
+            return
+        if self.running:
+            self._task.cancel()
+        self._loop = loop
+        self._loop_thread_id = threading.get_ident()
+        self._heartbeat = time.monotonic()
+        self._task = loop.create_task(self._probe(), name="loop-lag-monitor")
+        if self._watchdog is None or not self._watchdog.is_alive():
+            self._stopped.clear()
+            self._watchdog = threading.Thread(
+                target=self._watch, name="loop-lag-watchdog", daemon=True
+            )
+            self._watchdog.start()
+
+    async def stop(self) -> None:
+        self._stopped.set()
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _probe(self) -> None:
+        while True:
+            start = time.monotonic()
+            await asyncio.sleep(self.interval)
+            now = time.monotonic()
+            lag = max(0.0, now - start - self.interval)
+            with self._lock:
+                self.samples.append(lag)
+                self._heartbeat = now
+                if self._pending is not None:
+                    # The stall is over, now its length is known
+                    self._pending["duration"] = lag
+                    logger.warning(
+                        f"event loop blocked for {lag * 1000:.0f}ms"
+                        f" in {self._pending['route']}\n{self._pending['stack']}"
+                    )
+                    self._pending = None
+
+    def _watch(self) -> None:
+        while not self._stopped.wait(min(self.threshold, self.interval) / 2):
+            with self._lock:
+                late = time.monotonic() - self._heartbeat - self.interval
+                if late <= self.threshold:
+                    continue
+                if self._pending is None:
+                    self._pending = {"route": None, "stacks": Counter()}
+                    self.blocked.append(self._pending)
+                    self.blocked_count += 1
+                self._sample(self._pending, late)
+
+    def _sample(self, report: dict, late: float) -> None:
+        frame = sys._current_frames().get(self._loop_thread_id)
+        stack = "".join(traceback.format_stack(frame)) if frame is not None else ""
+        report["stacks"][stack] += 1
+        report["stack"] = report["stacks"].most_common(1)[0][0]
+        report["duration"] = late
+        # Read only access from this thread, good enough for a diagnostic
+        task = asyncio.current_task(self._loop)
+        if task is not None:
+            report["route"] = task.get_context().get(current_route) or report["route"]
+
+    def reset(self) -> None:
+        with self._lock:
+            self.samples.clear()
+            self.blocked.clear()
+            self.blocked_count = 0
+
+    def stats(self) -> dict:
+        """Lag percentiles in milliseconds and the recent blocking calls"""
+        with self._lock:
+            ordered = sorted(self.samples)
+            blocked = [dict(report) for report in self.blocked]
+            blocked_count = self.blocked_count
+        return {
+            "threshold_ms": self.threshold * 1000,
+            "samples": len(ordered),
+            "lag_ms": {
+                "p50": _percentile(ordered, 50) * 1000,
+                "p95": _percentile(ordered, 95) * 1000,
+                "p99": _percentile(ordered, 99) * 1000,
+                "max": (ordered[-1] if ordered else 0.0) * 1000,
+            },
+            "blocked_count": blocked_count,
+            "blocked": [
+                {
+                    "route": report["route"],
+                    "duration_ms": report["duration"] * 1000,
+                    "stack": report["stack"],
+                }
+                for report in blocked
+            ],
+        }
+
+
+class LoopMonitorMiddleware:
+    """
+    Set `current_route` for every request, so blocking calls can be
+    attributed, and start the monitor on the loop serving the requests
+    """
+
+    def __init__(self, app: ASGIApp, monitor: LoopLagMonitor):
+        self.app = app
+        self.monitor = monitor
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        self.monitor.start()
+        token = current_route.set(f"{scope['method']} {scope['path']}")
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            current_route.reset(token)
+
+
+@contextmanager
+def assert_no_blocking(app: ASGIApp, threshold: float = 0.05) -> Iterator:
+    """
+    TestClient for `app` that fails the test when a request blocks the
+    event loop for longer than `threshold` seconds
+
+        with assert_no_blocking(app) as client:
+            client.get("/schedule/")
+    """
+    from fastapi.testclient import TestClient
+
+    monitor = LoopLagMonitor(threshold=threshold, interval=threshold / 5)
+    with TestClient(LoopMonitorMiddleware(app, monitor)) as client:
+        yield client
+        client.portal.call(monitor.stop)
+
+    # Every stall is reported, on a busy machine the first one may be the
+    # test runner starving the loop rather than the handler
+    if monitor.blocked:
+        raise AssertionError(
+            "\n".join(
+                f"{report['route']} blocked the event loop for"
+                f" {report['duration'] * 1000:.0f}ms\n{report['stack']}"
+                for report in monitor.blocked
+            )
+        )
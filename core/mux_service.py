@@ -3,11 +3,10 @@ import hashlib
 import hmac
 import time
 from datetime import datetime, timedelta
+from functools import cached_property
 from typing import Dict, Optional, Tuple
 
 import jwt
-import mux_python
-from mux_python.rest import ApiException
 
 import settings
 from core.log import logger
@@ -24,14 +23,19 @@ class MuxService:
     """
 
     def __init__(self):
+        self.stream_url = "rtmps://global-live.mux.com:443/app/"
+
+    @cached_property
+    def live_streams_api(self):
+        # mux_python is imported on first use, it is slow to import and only
+        # the stream endpoints need it
+        import mux_python
+
         configuration = mux_python.Configuration()
         configuration.username = settings.MUX_TOKEN_ID
         configuration.password = settings.MUX_TOKEN_SECRET
 
-        self.live_streams_api = mux_python.LiveStreamsApi(
-            mux_python.ApiClient(configuration)
-        )
-        self.stream_url = "rtmps://global-live.mux.com:443/app/"
+        return mux_python.LiveStreamsApi(mux_python.ApiClient(configuration))
 
     def create_live_stream(
         self, is_public: bool = True
@@ -48,6 +52,9 @@ class MuxService:
         Raises:
             ApiException: If Mux API call fails
         """
+        import mux_python
+        from mux_python.rest import ApiException
+
         try:
             playback_policy = (
                 mux_python.PlaybackPolicy.PUBLIC
@@ -98,6 +105,8 @@ class MuxService:
         Raises:
             ApiException: If Mux API call fails
         """
+        from mux_python.rest import ApiException
+
         try:
             live_stream = self.live_streams_api.get_live_stream(stream_id)
             return {
@@ -124,6 +133,8 @@ class MuxService:
         Raises:
             ApiException: If Mux API call fails
         """
+        from mux_python.rest import ApiException
+
         try:
             self.live_streams_api.delete_live_stream(stream_id)
             logger.info(f"Deleted Mux live stream: {stream_id}")
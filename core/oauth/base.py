@@ -2,7 +2,8 @@ from datetime import datetime, timedelta
 import secrets
 import traceback
 from abc import ABC, abstractmethod
-from typing import Optional, Tuple, TypedDict, Union
+from functools import cached_property
+from typing import TYPE_CHECKING, Optional, Tuple, TypedDict, Union
 from fastapi import HTTPException, Request
 from fastapi.responses import RedirectResponse
 import jwt
@@ -10,9 +11,11 @@ import pytz
 from sqlalchemy import or_, select
 from models.User import User
 from settings import ALGORITHM, FRONTEND_BASE_URL, SECRET_KEY, TZ
-from authlib.integrations.starlette_client import OAuth
 from sqlalchemy.orm import Session
 
+if TYPE_CHECKING:
+    from authlib.integrations.starlette_client import OAuth
+
 
 class UserInfoResponse(TypedDict):
     id: str
@@ -38,12 +41,17 @@ class OAuthTokenResponse(TypedDict, total=False):
 class BaseOAuthService(ABC):
     """Base OAuth service that must be inherited by all OAuth providers."""
 
-    def __init__(self):
-        self.oauth = OAuth()
-        self._register_provider()
+    @cached_property
+    def oauth(self) -> "OAuth":
+        """authlib registry, created and registered on first use"""
+        from authlib.integrations.starlette_client import OAuth
+
+        oauth = OAuth()
+        self._register_provider(oauth)
+        return oauth
 
     @abstractmethod
-    def _register_provider(self):
+    def _register_provider(self, oauth: "OAuth"):
         """Register OAuth providers using authlib."""
         pass
 
@@ -13,12 +13,12 @@ class OAuthGithubService(BaseOAuthService):
     def _get_provider_name(self) -> str:
         return "github"
 
-    def _register_provider(self):
+    def _register_provider(self, oauth):
         if not GITHUB_CLIENT_SECRET or not GITHUB_CLIENT_ID:
             print("Warning: GitHub OAuth not configured - missing credentials")
             return
 
-        self.oauth.register(
+        oauth.register(
             name="github",
             client_id=GITHUB_CLIENT_ID,
             client_secret=GITHUB_CLIENT_SECRET,
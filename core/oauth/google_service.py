@@ -13,12 +13,12 @@ class OAuthGoogleService(BaseOAuthService):
     def _get_provider_name(self) -> str:
         return "google"
 
-    def _register_provider(self):
+    def _register_provider(self, oauth):
         if not GOOGLE_CLIENT_SECRET or not GOOGLE_CLIENT_ID:
             print("Warning: Google OAuth not configured - missing credentials")
             return
 
-        self.oauth.register(
+        oauth.register(
             name="google",
             client_id=GOOGLE_CLIENT_ID,
             client_secret=GOOGLE_CLIENT_SECRET,
@@ -0,0 +1,95 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, TypeVar
+
+import bcrypt
+
+from settings import BCRYPT_MAX_THREADS, BCRYPT_ROUNDS
+
+T = TypeVar("T")
+
+
+class PasswordHasher:
+    """
+    bcrypt off the event loop, in a thread pool of its own
+
+    bcrypt releases the GIL, so hashing in threads keeps the worker serving
+    other requests. The pool size caps how many hashes run at once, so a
+    login storm queues here instead of taking over the default threadpool
+    the sync endpoints and database calls run in. Time spent waiting for a
+    thread is recorded in `stats()`.
+    """
+
+    def __init__(self, rounds: int = 12, max_threads: int = 4):
+        self.rounds = rounds
+        self.max_threads = max_threads
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_threads, thread_name_prefix="bcrypt"
+        )
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.waiting = 0
+        self.queue_seconds = 0.0
+        self.max_queue_seconds = 0.0
+        self.hash_seconds = 0.0
+
+    def hash(self, password: str) -> str:
+        return bcrypt.hashpw(password.encode(), bcrypt.gensalt(self.rounds)).decode()
+
+    def verify(self, hash: str, password: str) -> bool:
+        try:
+            return bcrypt.checkpw(password.encode(), hash.encode())
+        except Exception:
+            return False
+
+    def needs_rehash(self, hash: str) -> bool:
+        """Whether `hash` was made with another work factor than `rounds`"""
+        try:
+            return int(hash.split("$")[2]) != self.rounds
+        except (IndexError, ValueError):
+            return False
+
+    async def hash_async(self, password: str) -> str:
+        return await self._run(self.hash, password)
+
+    async def verify_async(self, hash: str, password: str) -> bool:
+        return await self._run(self.verify, hash, password)
+
+    async def _run(self, func: Callable[..., T], *args) -> T:
+        submitted = time.perf_counter()
+        with self._lock:
+            self.waiting += 1
+
+        def measured() -> T:
+            started = time.perf_counter()
+            with self._lock:
+                self.waiting -= 1
+                queued = started - submitted
+                self.queue_seconds += queued
+                self.max_queue_seconds = max(self.max_queue_seconds, queued)
+            try:
+                return func(*args)
+            finally:
+                with self._lock:
+                    self.calls += 1
+                    self.hash_seconds += time.perf_counter() - started
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, measured)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "rounds": self.rounds,
+                "max_threads": self.max_threads,
+                "calls": self.calls,
+                "waiting": self.waiting,
+                "queue_seconds": self.queue_seconds,
+                "max_queue_seconds": self.max_queue_seconds,
+                "hash_seconds": self.hash_seconds,
+            }
+
+
+password_hasher = PasswordHasher(rounds=BCRYPT_ROUNDS, max_threads=BCRYPT_MAX_THREADS)
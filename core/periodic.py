@@ -0,0 +1,43 @@
+import asyncio
+from typing import Awaitable, Callable, Optional
+
+from core.log import logger
+
+
+class PeriodicTask:
+    """
+    Run a coroutine function every `interval` seconds on the event loop
+
+    Meant to be started and stopped from the application lifespan. A failing
+    run is logged and the next run happens as scheduled.
+    """
+
+    def __init__(
+        self, name: str, func: Callable[[], Awaitable[object]], interval: float
+    ):
+        self.name = name
+        self.func = func
+        self.interval = interval
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name=self.name)
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                await self.func()
+            except Exception:
+                logger.exception(f"periodic task {self.name} failed")
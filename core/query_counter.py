@@ -0,0 +1,142 @@
+import re
+import threading
+import time
+from collections import Counter
+from contextvars import ContextVar
+from typing import Callable, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from core.log import logger
+
+_PLACEHOLDER = re.compile(r"%\(\w+\)s|\$\d+|\?")
+_PLACEHOLDER_LIST = re.compile(r"\?(?:\s*,\s*\?)+")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def statement_shape(statement: str) -> str:
+    """`statement` with its placeholders and IN lists collapsed to `?`"""
+    shape = _PLACEHOLDER.sub("?", statement)
+    shape = _PLACEHOLDER_LIST.sub("?", shape)
+    return _WHITESPACE.sub(" ", shape).strip()
+
+
+class QueryStats:
+    """Statements run while serving one request, or in a test's assert_max_queries"""
+
+    def __init__(self):
+        self.count = 0
+        self.seconds = 0.0
+        self.shapes: Counter[str] = Counter()
+        self._lock = threading.Lock()
+
+    def record(self, statement: str, seconds: float) -> None:
+        shape = statement_shape(statement)
+        with self._lock:
+            self.count += 1
+            self.seconds += seconds
+            self.shapes[shape] += 1
+
+    def repeated(self, threshold: int) -> dict[str, int]:
+        """Statement shapes run at least `threshold` times, likely an N+1"""
+        with self._lock:
+            return {
+                shape: count
+                for shape, count in self.shapes.most_common()
+                if count >= threshold
+            }
+
+    def server_timing(self) -> str:
+        return f'db;dur={self.seconds * 1000:.1f};desc="{self.count} queries"'
+
+    def summary(self) -> str:
+        with self._lock:
+            return "\n".join(
+                f"{count}x {shape}" for shape, count in self.shapes.most_common()
+            )
+
+
+# Stats of the request being served, set by QueryStatsMiddleware. Sync
+# endpoints run in a copy of the context, they record into the same object.
+current_query_stats: ContextVar[Optional[QueryStats]] = ContextVar(
+    "current_query_stats", default=None
+)
+
+
+class QueryListener:
+    """
+    Time every statement run on `target`, an Engine, a Connection or the
+    Engine class for all of them, into the QueryStats `get_stats` returns
+    """
+
+    def __init__(self, target, get_stats: Callable[[], Optional[QueryStats]]) -> None:
+        self.target = target
+        self.get_stats = get_stats
+
+    def _before(self, conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault(self, []).append(time.perf_counter())
+
+    def _after(self, conn, cursor, statement, parameters, context, executemany):
+        # Nothing to time when listening started during the statement
+        started = conn.info.get(self)
+        if not started:
+            return
+        elapsed = time.perf_counter() - started.pop()
+        stats = self.get_stats()
+        if stats is not None:
+            stats.record(statement, elapsed)
+
+    def listen(self) -> None:
+        if not event.contains(self.target, "before_cursor_execute", self._before):
+            event.listen(self.target, "before_cursor_execute", self._before)
+            event.listen(self.target, "after_cursor_execute", self._after)
+
+    def remove(self) -> None:
+        if event.contains(self.target, "before_cursor_execute", self._before):
+            event.remove(self.target, "before_cursor_execute", self._before)
+            event.remove(self.target, "after_cursor_execute", self._after)
+
+
+request_queries = QueryListener(Engine, current_query_stats.get)
+
+
+class QueryStatsMiddleware:
+    """
+    Count the statements of every request and their database time
+
+    The totals are sent in a Server-Timing header, which browser dev tools
+    show next to the request. Statement shapes repeated `repeat_threshold`
+    times in one request are logged as a likely N+1.
+    """
+
+    def __init__(self, app: ASGIApp, repeat_threshold: int = 5):
+        self.app = app
+        self.repeat_threshold = repeat_threshold
+        request_queries.listen()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = QueryStats()
+        token = current_query_stats.set(stats)
+
+        async def send_with_timing(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                headers.append("Server-Timing", stats.server_timing())
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            current_query_stats.reset(token)
+
+        for shape, count in stats.repeated(self.repeat_threshold).items():
+            logger.warning(
+                f"{scope['method']} {scope['path']} ran {count}x, likely N+1: {shape}"
+            )
@@ -0,0 +1,125 @@
+"""
+Sliding window counter helpers
+
+The sliding window counter keeps two integers per key (the request count of
+the current fixed window and of the previous one) and estimates the number of
+requests in the last `window` seconds by weighting the previous window with
+the part of it that still overlaps the sliding window. Backends that can not
+keep one timestamp per request (shared memory, postgres) store this state.
+"""
+
+import math
+from typing import Optional, Tuple
+
+
+def current_bucket(now: float, window: int) -> int:
+    """Index of the fixed window that contains `now`"""
+    return int(now // window)
+
+
+def roll_window(
+    bucket: int, previous_count: int, current_count: int, window: int, now: float
+) -> Tuple[int, int, int]:
+    """
+    Move stored counters to the fixed window that contains `now`
+
+    Returns:
+        Tuple of (bucket, previous_count, current_count)
+    """
+    now_bucket = current_bucket(now, window)
+    if bucket == now_bucket:
+        return bucket, previous_count, current_count
+    if bucket == now_bucket - 1:
+        return now_bucket, current_count, 0
+    return now_bucket, 0, 0
+
+
+def estimate(
+    bucket: int, previous_count: int, current_count: int, window: int, now: float
+) -> float:
+    """Estimated number of requests in the sliding window ending at `now`"""
+    elapsed = now - bucket * window
+    weight = max(0.0, (window - elapsed) / window)
+    return previous_count * weight + current_count
+
+
+def remaining(
+    bucket: int,
+    previous_count: int,
+    current_count: int,
+    window: int,
+    limit: int,
+    now: float,
+) -> int:
+    """Number of requests that are still allowed at `now`"""
+    bucket, previous_count, current_count = roll_window(
+        bucket, previous_count, current_count, window, now
+    )
+    used = estimate(bucket, previous_count, current_count, window, now)
+    return max(0, math.floor(limit - used))
+
+
+def retry_after(
+    bucket: int,
+    previous_count: int,
+    current_count: int,
+    window: int,
+    limit: int,
+    now: float,
+) -> float:
+    """Seconds until the estimate drops to `limit` again"""
+    if limit < 0:
+        return float(window)
+
+    window_start = bucket * window
+    if current_count < limit and previous_count > 0:
+        # Wait until enough of the previous window slides out
+        allowed_at = (
+            window_start + window - (limit - current_count) * window / previous_count
+        )
+    else:
+        # Current window is full, it becomes the previous window next
+        allowed_at = window_start + 2 * window - limit * window / current_count
+
+    return max(0.0, allowed_at - now)
+
+
+def hit(
+    bucket: int,
+    previous_count: int,
+    current_count: int,
+    window: int,
+    limit: int,
+    now: float,
+    cost: int = 1,
+) -> Tuple[bool, int, Optional[float], int, int, int]:
+    """
+    Apply one request counting as `cost` requests to the counters
+
+    Returns:
+        Tuple of (is_allowed, remaining, retry_after_seconds, bucket,
+        previous_count, current_count) where the counters are the new state
+        to store
+    """
+    # roll_window and estimate inlined, this runs on every request
+    now_bucket = int(now // window)
+    if bucket != now_bucket:
+        previous_count = current_count if bucket == now_bucket - 1 else 0
+        current_count = 0
+        bucket = now_bucket
+
+    weight = (window - (now - bucket * window)) / window
+    used = previous_count * weight + current_count
+    if used + cost <= limit:
+        left = max(0, math.floor(limit - used - cost))
+        return True, left, None, bucket, previous_count, current_count + cost
+
+    return (
+        False,
+        0,
+        # Allowed once the estimate drops to limit - cost
+        retry_after(bucket, previous_count, current_count, window, limit - cost, now),
+        bucket,
+        previous_count,
+        current_count,
+    )
@@ -0,0 +1,80 @@
+from abc import ABC, abstractmethod
+from typing import NamedTuple, Optional
+
+
+class RateLimitResult(NamedTuple):
+    allowed: bool
+    # Requests left in the window after this one
+    remaining: int
+    # Seconds until a request is allowed again, None when allowed
+    retry_after: Optional[float]
+
+
+class BaseRateLimiter(ABC):
+    """Base rate limiter backend that must be inherited by all backends."""
+
+    @abstractmethod
+    async def is_allowed(
+        self, key: str, limit: int, window: int
+    ) -> tuple[bool, Optional[float]]:
+        """
+        Check if request is allowed and record it when it is
+
+        Args:
+            key: Unique identifier for the rate limit
+            limit: Maximum number of requests allowed
+            window: Time window in seconds
+
+        Returns:
+            Tuple of (is_allowed, retry_after_seconds)
+        """
+        pass
+
+    @abstractmethod
+    async def get_remaining(self, key: str, limit: int) -> int:
+        """Get remaining requests for a key"""
+        pass
+
+    @abstractmethod
+    async def reset(self, key: str) -> None:
+        """Reset rate limit for a key"""
+        pass
+
+    async def hit(
+        self, key: str, limit: int, window: int, cost: int = 1
+    ) -> RateLimitResult:
+        """
+        Check and record a request, and report the remaining requests
+
+        Backends override this to do both in one atomic operation, this
+        fallback needs several and may see requests made in between.
+
+        Args:
+            cost: Number of requests this request counts as
+        """
+        remaining = await self.get_remaining(key, limit)
+        if 0 < remaining < cost:
+            # Can't ask when `cost` requests free up without recording one,
+            # the whole window is an upper bound
+            return RateLimitResult(False, 0, float(window))
+        for _ in range(cost):
+            allowed, retry_after = await self.is_allowed(key, limit, window)
+            if not allowed:
+                return RateLimitResult(False, 0, retry_after)
+        return RateLimitResult(True, await self.get_remaining(key, limit), None)
+
+    async def evict_expired(self, batch_size: int = 1000) -> int:
+        """
+        Drop state of keys that no longer count any request
+
+        Called periodically in the background, backends without expiring
+        state keep this no-op.
+
+        Returns:
+            Number of evicted keys
+        """
+        return 0
+
+    def stats(self) -> dict:
+        """Counters describing the stored state, for monitoring"""
+        return {}
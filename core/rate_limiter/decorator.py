@@ -1,12 +1,12 @@
 from functools import wraps
 from typing import Callable, Optional
 from fastapi import Request, HTTPException, status
-from core.rate_limiter.memory import InMemoryRateLimiter
+from core.rate_limiter.base import BaseRateLimiter
 from core.rate_limiter.key_builder import RateLimitKeyBuilder
 
 
 def rate_limit(
-    backend: Optional[InMemoryRateLimiter] = None,
+    backend: Optional[BaseRateLimiter] = None,
     limit: int = 10,
     window: int = 60,
     key_func: Optional[Callable[[Request], str]] = None,
@@ -16,7 +16,7 @@ def rate_limit(
     Decorator for rate limiting individual endpoints with secure key generation
 
     Args:
-        backend: InMemoryRateLimiter instance
+        backend: Rate limiter backend instance (memory, shared memory, postgres)
         limit: Maximum requests per window
         window: Time window in seconds
         key_func: Custom function to extract rate limit key (optional)
@@ -45,8 +45,8 @@ def rate_limit(
             if not request:
                 raise ValueError("Request object not found in function arguments")
 
-            if not backend or not isinstance(backend, InMemoryRateLimiter):
-                raise ValueError("InMemoryRateLimiter instance must be provided")
+            if not backend or not isinstance(backend, BaseRateLimiter):
+                raise ValueError("Rate limiter backend instance must be provided")
 
             # Get rate limit key
             if key_func:
@@ -54,30 +54,27 @@ def rate_limit(
             else:
                 key = RateLimitKeyBuilder.build_key(request, use_fingerprint)
 
-            # Check rate limit
-            is_allowed, retry_after = await backend.is_allowed(key, limit, window)
+            # Check and record the request in one atomic backend call
+            result = await backend.hit(key, limit, window)
 
-            if not is_allowed:
+            if not result.allowed:
                 raise HTTPException(
                     status_code=status.HTTP_429_TOO_MANY_REQUESTS,
                     detail="Rate limit exceeded",
                     headers={
                         "X-RateLimit-Limit": str(limit),
                         "X-RateLimit-Remaining": "0",
-                        "Retry-After": str(retry_after),
+                        "Retry-After": str(result.retry_after),
                     },
                 )
 
-            # Get remaining requests
-            remaining = await backend.get_remaining(key, limit)
-
             # Call original function
             response = await func(*args, **kwargs)
 
             # Add rate limit headers if response supports it
             if hasattr(response, "headers"):
                 response.headers["X-RateLimit-Limit"] = str(limit)
-                response.headers["X-RateLimit-Remaining"] = str(remaining - 1)
+                response.headers["X-RateLimit-Remaining"] = str(result.remaining)
                 response.headers["X-RateLimit-Window"] = str(window)
 
             return response
@@ -0,0 +1,39 @@
+from core.rate_limiter.base import BaseRateLimiter
+from settings import (
+    RATE_LIMIT_ALGORITHM,
+    RATE_LIMIT_BACKEND,
+    RATE_LIMIT_MAX_KEYS,
+    RATE_LIMIT_SHARED_MEMORY_PATH,
+    RATE_LIMIT_SHARED_MEMORY_SLOTS,
+)
+
+
+def create_rate_limiter(backend: str = RATE_LIMIT_BACKEND) -> BaseRateLimiter:
+    """
+    Create the rate limiter backend configured by RATE_LIMIT_BACKEND
+
+    - memory: per process, limits are multiplied by the number of workers,
+      RATE_LIMIT_ALGORITHM picks sliding_log or sliding_window_counter
+    - shared_memory: shared by all worker processes on one host
+    - postgres: shared by all nodes using the same database
+    """
+    if backend == "memory":
+        from core.rate_limiter.memory import InMemoryRateLimiter
+
+        return InMemoryRateLimiter(
+            algorithm=RATE_LIMIT_ALGORITHM, max_keys=RATE_LIMIT_MAX_KEYS
+        )
+    if backend == "shared_memory":
+        from core.rate_limiter.shared_memory import SharedMemoryRateLimiter
+
+        return SharedMemoryRateLimiter(
+            path=RATE_LIMIT_SHARED_MEMORY_PATH, slots=RATE_LIMIT_SHARED_MEMORY_SLOTS
+        )
+    if backend == "postgres":
+        from core.rate_limiter.postgres import PostgresRateLimiter
+
+        return PostgresRateLimiter()
+
+    raise ValueError(
+        f"{backend} is not a rate limit backend, use memory, shared_memory or postgres"
+    )
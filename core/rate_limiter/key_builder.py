@@ -3,7 +3,7 @@ from typing import Optional
 from fastapi import Request
 import jwt
 
-from settings import ALGORITHM, SECRET_KEY
+from core.token_cache import decode_token
 
 
 class RateLimitKeyBuilder:
@@ -145,7 +145,7 @@ class RateLimitKeyBuilder:
             # Authenticated user - use verified id from JWT
             user_id = None
             try:
-                payload = jwt.decode(jwt=token, key=SECRET_KEY, algorithms=[ALGORITHM])
+                payload = decode_token(token, request)
                 user_id = payload.get("id")
             except jwt.PyJWTError:
                 pass
@@ -1,15 +1,56 @@
 import asyncio
 import time
-from collections import defaultdict
+from collections import OrderedDict
 from typing import Dict, List, Optional
 
+from core.rate_limiter import algorithms
+from core.rate_limiter.base import BaseRateLimiter, RateLimitResult
 
-class InMemoryRateLimiter:
-    """In-memory rate limiter using sliding window algorithm"""
+# Keeps one timestamp per request, exact but O(limit) per key
+SLIDING_LOG = "sliding_log"
+# Keeps two counters per key, O(1) but assumes evenly spread requests
+SLIDING_WINDOW_COUNTER = "sliding_window_counter"
+ALGORITHMS = (SLIDING_LOG, SLIDING_WINDOW_COUNTER)
 
-    def __init__(self):
-        self._requests: Dict[str, List[float]] = defaultdict(list)
-        self._lock = asyncio.Lock()
+
+class InMemoryRateLimiter(BaseRateLimiter):
+    """
+    In-memory rate limiter using sliding window algorithm
+
+    All state is only touched from the event loop and no method awaits
+    between reading and writing the state of a key, so each call is atomic
+    without a lock and requests for different keys never wait on each other.
+
+    Keys are kept per window in least recently used order together with
+    the time they become idle (their last request left the window). Keys
+    of one window become idle in the order they were used, so idle keys
+    are evicted from the front of each window without scanning every key,
+    and the least recently used front makes room when `max_keys` is
+    reached.
+    """
+
+    def __init__(self, algorithm: str = SLIDING_LOG, max_keys: Optional[int] = None):
+        """
+        Args:
+            algorithm: SLIDING_LOG (default) or SLIDING_WINDOW_COUNTER
+            max_keys: Maximum number of keys kept in memory, unlimited if None
+        """
+        if algorithm not in ALGORITHMS:
+            raise ValueError(
+                f"{algorithm} is not a rate limit algorithm, use one of {ALGORITHMS}"
+            )
+        self.algorithm = algorithm
+        self.max_keys = max_keys
+        self._requests: Dict[str, List[float]] = {}
+        # key -> [bucket, window, previous_count, current_count]
+        self._counters: Dict[str, List[int]] = {}
+        # window -> key -> time the key becomes idle, least recently used first
+        self._idle_at: Dict[int, OrderedDict[str, float]] = {}
+        # key -> window it is kept under in _idle_at
+        self._windows: Dict[str, int] = {}
+        self._stored_timestamps = 0
+        self.evicted_expired = 0
+        self.evicted_capacity = 0
 
     async def is_allowed(
         self, key: str, limit: int, window: int
@@ -25,58 +66,160 @@ class InMemoryRateLimiter:
         Returns:
             Tuple of (is_allowed, retry_after_seconds)
         """
-        async with self._lock:
-            current_time = time.time()
-            cutoff_time = current_time - window
+        result = await self.hit(key, limit, window)
+        return result.allowed, result.retry_after
+
+    async def hit(
+        self, key: str, limit: int, window: int, cost: int = 1
+    ) -> RateLimitResult:
+        """Check, record and report a request counting as `cost` requests"""
+        current_time = time.time()
+        self._touch(key, window, current_time)
+        if self.algorithm == SLIDING_WINDOW_COUNTER:
+            return self._hit_counter(key, limit, window, current_time, cost)
+        return self._hit_log(key, limit, window, current_time, cost)
+
+    def _touch(self, key: str, window: int, current_time: float) -> None:
+        """Mark key as most recently used, evicting the oldest key when full"""
+        if key in self._windows:
+            self._unlink(key)
+        elif self.max_keys is not None and len(self._windows) >= self.max_keys:
+            self._forget(self._least_recently_used())
+            self.evicted_capacity += 1
+        self._idle_at.setdefault(window, OrderedDict())[key] = current_time + window
+        self._windows[key] = window
+
+    def _least_recently_used(self) -> str:
+        oldest_key, oldest_use = None, None
+        for window, keys in self._idle_at.items():
+            # The front key of a window is its least recently used one
+            key, idle_at = next(iter(keys.items()))
+            if oldest_use is None or idle_at - window < oldest_use:
+                oldest_key, oldest_use = key, idle_at - window
+        return oldest_key
+
+    def _unlink(self, key: str) -> None:
+        window = self._windows.pop(key)
+        keys = self._idle_at[window]
+        del keys[key]
+        if not keys:
+            del self._idle_at[window]
+
+    def _forget(self, key: str) -> None:
+        if key in self._windows:
+            self._unlink(key)
+        timestamps = self._requests.pop(key, None)
+        if timestamps is not None:
+            self._stored_timestamps -= len(timestamps)
+        self._counters.pop(key, None)
+
+    def _hit_log(
+        self, key: str, limit: int, window: int, current_time: float, cost: int
+    ) -> RateLimitResult:
+        cutoff_time = current_time - window
 
-            # Remove expired timestamps
-            self._requests[key] = [ts for ts in self._requests[key] if ts > cutoff_time]
+        # Remove expired timestamps
+        stored = self._requests.get(key, [])
+        timestamps = [ts for ts in stored if ts > cutoff_time]
+        self._requests[key] = timestamps
+        self._stored_timestamps -= len(stored) - len(timestamps)
 
-            # Check if under limit
-            if len(self._requests[key]) < limit:
-                self._requests[key].append(current_time)
-                return True, None
+        # Check if under limit
+        if len(timestamps) + cost <= limit:
+            timestamps.extend([current_time] * cost)
+            self._stored_timestamps += cost
+            return RateLimitResult(True, limit - len(timestamps), None)
 
-            # Calculate retry_after
-            if self._requests[key]:
-                oldest_request = min(self._requests[key])
-                retry_after = window - (current_time - oldest_request)
-            else:
-                # Edge case: limit is 0, no requests stored
-                retry_after = window
+        # Calculate retry_after, timestamps are stored oldest first
+        keep = limit - cost
+        if timestamps and keep >= 0:
+            # Allowed once all but `keep` stored requests left the window
+            freeing_request = timestamps[len(timestamps) - keep - 1]
+            retry_after = window - (current_time - freeing_request)
+        else:
+            # Edge case: limit is 0 or below cost, never allowed
+            retry_after = window
 
-            return False, max(0, retry_after)
+        return RateLimitResult(False, 0, max(0, retry_after))
+
+    def _hit_counter(
+        self, key: str, limit: int, window: int, current_time: float, cost: int
+    ) -> RateLimitResult:
+        """Sliding window counter variant of _hit_log, O(1) per request"""
+        counter = self._counters.get(key)
+        if counter is None or counter[1] != window:
+            counter = [algorithms.current_bucket(current_time, window), window, 0, 0]
+            self._counters[key] = counter
+
+        allowed, remaining, retry_after, counter[0], counter[2], counter[3] = (
+            algorithms.hit(
+                counter[0], counter[2], counter[3], window, limit, current_time, cost
+            )
+        )
+        return RateLimitResult(allowed, remaining, retry_after)
 
     async def reset(self, key: str) -> None:
         """Reset rate limit for a key"""
-        async with self._lock:
-            if key in self._requests:
-                del self._requests[key]
+        self._forget(key)
 
     async def get_remaining(self, key: str, limit: int) -> int:
         """Get remaining requests for a key"""
-        async with self._lock:
-            current_count = len(self._requests.get(key, []))
-            return max(0, limit - current_count)
+        if self.algorithm == SLIDING_WINDOW_COUNTER:
+            counter = self._counters.get(key)
+            if counter is None:
+                return max(0, limit)
+            bucket, window, previous_count, current_count = counter
+            return algorithms.remaining(
+                bucket, previous_count, current_count, window, limit, time.time()
+            )
+
+        current_count = len(self._requests.get(key, []))
+        return max(0, limit - current_count)
+
+    def _evict_expired_batch(self, now: float, batch_size: int) -> int:
+        evicted = 0
+        for keys in list(self._idle_at.values()):
+            while keys and evicted < batch_size:
+                key, idle_at = next(iter(keys.items()))
+                if idle_at > now:
+                    break
+                self._forget(key)
+                evicted += 1
+        self.evicted_expired += evicted
+        return evicted
+
+    async def evict_expired(self, batch_size: int = 1000) -> int:
+        """
+        Evict keys whose last request left the window
 
-    async def cleanup_expired(self, window: int) -> None:
+        Keys are evicted in batches from the least recently used end and the
+        event loop gets control back between batches.
+
+        Returns:
+            Number of evicted keys
+        """
+        total = 0
+        while True:
+            evicted = self._evict_expired_batch(time.time(), batch_size)
+            total += evicted
+            if evicted < batch_size:
+                return total
+            await asyncio.sleep(0)
+
+    async def cleanup_expired(self, window: Optional[int] = None) -> None:
         """
         Cleanup expired entries to prevent memory bloat
-        Should be called periodically by a background task
+
+        Kept for backwards compatibility, every key now expires after its own
+        window so `window` is ignored. See evict_expired.
         """
-        async with self._lock:
-            current_time = time.time()
-            cutoff_time = current_time - window
-
-            keys_to_delete = []
-            for key, timestamps in self._requests.items():
-                # Filter out expired timestamps
-                valid_timestamps = [ts for ts in timestamps if ts > cutoff_time]
-                if valid_timestamps:
-                    self._requests[key] = valid_timestamps
-                else:
-                    keys_to_delete.append(key)
-
-            # Remove empty keys
-            for key in keys_to_delete:
-                del self._requests[key]
+        await self.evict_expired()
+
+    def stats(self) -> dict:
+        return {
+            "active_keys": len(self._windows),
+            "max_keys": self.max_keys,
+            "stored_timestamps": self._stored_timestamps,
+            "evicted_expired": self.evicted_expired,
+            "evicted_capacity": self.evicted_capacity,
+        }
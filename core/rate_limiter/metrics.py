@@ -0,0 +1,78 @@
+from typing import Callable, Optional
+
+from core.rate_limiter.base import BaseRateLimiter, RateLimitResult
+from core.rate_limiter.policy import RateLimitPolicy
+
+# Allowed requests leaving at most this share of the limit count as near
+NEAR_LIMIT_RATIO = 0.1
+
+RateLimitListener = Callable[[RateLimitPolicy, RateLimitResult], None]
+
+
+class RateLimitMetrics:
+    """
+    Counters of the rate limit middleware, per policy and in total
+
+    Everything is updated on the event loop, listeners are called with the
+    policy and result of every checked request, e.g. to forward them to an
+    external metrics system.
+    """
+
+    def __init__(self):
+        self.policies: dict[str, dict] = {}
+        self.build_key_calls = 0
+        self.build_key_seconds = 0.0
+        self.backend_calls = 0
+        self.backend_seconds = 0.0
+        self._listeners: list[RateLimitListener] = []
+
+    def add_listener(self, listener: RateLimitListener) -> None:
+        self._listeners.append(listener)
+
+    def record(
+        self,
+        policy: RateLimitPolicy,
+        result: RateLimitResult,
+        build_key_seconds: float,
+        backend_seconds: float,
+    ) -> None:
+        counters = self.policies.get(policy.name)
+        if counters is None:
+            counters = {
+                "limit": policy.limit,
+                "window": policy.window,
+                "allowed": 0,
+                "denied": 0,
+                "near_limit": 0,
+            }
+            self.policies[policy.name] = counters
+
+        if result.allowed:
+            counters["allowed"] += 1
+            if result.remaining <= policy.limit * NEAR_LIMIT_RATIO:
+                counters["near_limit"] += 1
+        else:
+            counters["denied"] += 1
+
+        self.build_key_calls += 1
+        self.build_key_seconds += build_key_seconds
+        self.backend_calls += 1
+        self.backend_seconds += backend_seconds
+
+        for listener in self._listeners:
+            listener(policy, result)
+
+    def snapshot(self, backend: Optional[BaseRateLimiter] = None) -> dict:
+        """Current counters, with the stats of the backend when given"""
+        return {
+            "policies": {name: dict(c) for name, c in self.policies.items()},
+            "build_key": {
+                "calls": self.build_key_calls,
+                "seconds": self.build_key_seconds,
+            },
+            "backend": {
+                "calls": self.backend_calls,
+                "seconds": self.backend_seconds,
+                **(backend.stats() if backend is not None else {}),
+            },
+        }
@@ -1,63 +1,88 @@
-from fnmatch import fnmatch
-from typing import Callable, Optional
+import time
+from typing import Callable, Optional, Union
 
 from fastapi import Request, status
 from fastapi.responses import JSONResponse
+from starlette.datastructures import MutableHeaders
 from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
+from core.rate_limiter.base import BaseRateLimiter, RateLimitResult
 from core.rate_limiter.key_builder import RateLimitKeyBuilder
-from core.rate_limiter.memory import InMemoryRateLimiter
+from core.rate_limiter.metrics import RateLimitMetrics
+from core.rate_limiter.path_matcher import PathMatcher
+from core.rate_limiter.policy import (
+    KEY_IP,
+    RateLimitPolicy,
+    RateLimitPolicyTable,
+    RateLimitRule,
+)
 
 
-class RateLimitMiddleware(BaseHTTPMiddleware):
-    """FastAPI middleware for rate limiting with secure key generation"""
+class _RateLimitRules:
+    """Configuration and decisions shared by both rate limit middlewares"""
 
-    def __init__(
+    def _configure(
         self,
-        app,
-        backend: type[InMemoryRateLimiter],
-        enabled: bool = True,
-        limit: int = 100,
-        window: int = 60,
-        key_func: Optional[Callable[[Request], str]] = None,
-        exclude_paths: Optional[list[str]] = None,
-        use_fingerprint: bool = True,
+        backend: Union[type[BaseRateLimiter], BaseRateLimiter],
+        enabled: bool,
+        limit: int,
+        window: int,
+        key_func: Optional[Callable[[Request], str]],
+        exclude_paths: Optional[list[str]],
+        use_fingerprint: bool,
+        policies: Optional[list[RateLimitRule]],
+        metrics: Optional[RateLimitMetrics],
     ):
-        """
-        Initialize rate limit middleware
-
-        Args:
-            app: FastAPI application
-            backend: InMemoryRateLimiter
-            enabled: Enable/disable rate limiting
-            limit: Maximum requests per window
-            window: Time window in seconds
-            key_func: Custom function to extract rate limit key (optional)
-            exclude_paths: List of paths to exclude from rate limiting
-            use_fingerprint: Use browser fingerprint for anonymous users (more secure)
-        """
-        super().__init__(app)
-        self.backend = backend()
+        self.backend = backend() if isinstance(backend, type) else backend
         self.enabled = enabled
         self.limit = limit
         self.window = window
         self.key_func = key_func
         self.exclude_paths = exclude_paths or []
+        self._excluded = PathMatcher(self.exclude_paths)
         self.use_fingerprint = use_fingerprint
+        self.policies = RateLimitPolicyTable(
+            policies or [], default=RateLimitPolicy("default", limit, window)
+        )
+        self.metrics = metrics if metrics is not None else RateLimitMetrics()
 
-    def _get_rate_limit_key(self, request: Request) -> str:
+    def _get_rate_limit_key(
+        self, request: Request, policy: Optional[RateLimitPolicy] = None
+    ) -> str:
         """
         Get rate limit key using secure key builder
 
         If custom key_func is provided, use it.
-        Otherwise, use secure RateLimitKeyBuilder.
+        Otherwise, use secure RateLimitKeyBuilder. Keys of policies other
+        than the default one are prefixed with the policy name, so every
+        policy has its own budget.
         """
         if self.key_func:
-            return self.key_func(request)
+            key = self.key_func(request)
+        elif policy is not None and policy.key == KEY_IP:
+            key = RateLimitKeyBuilder.build_anonymous_key(
+                request, use_fingerprint=False
+            )
+        else:
+            key = RateLimitKeyBuilder.build_key(
+                request, use_fingerprint=self.use_fingerprint
+            )
 
-        return RateLimitKeyBuilder.build_key(
-            request, use_fingerprint=self.use_fingerprint
+        if policy is None or policy is self.policies.default:
+            return key
+        return f"{policy.name}:{key}"
+
+    async def _hit(self, request: Request, policy: RateLimitPolicy) -> RateLimitResult:
+        """Check and record the request in one atomic backend call"""
+        start = time.perf_counter()
+        key = self._get_rate_limit_key(request, policy)
+        key_built = time.perf_counter()
+        result = await self.backend.hit(key, policy.limit, policy.window, policy.cost)
+        self.metrics.record(
+            policy, result, key_built - start, time.perf_counter() - key_built
         )
+        return result
 
     def _should_exclude(self, path: str) -> bool:
         """
@@ -67,19 +92,75 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         - exact prefix match (old behavior)
         - glob patterns like '/user-profile/*/profile-picture/'
         """
-        normalized_path = path.rstrip("/") or "/"
+        return self._excluded.matches(path)
+
+    def _limited_response(
+        self, result: RateLimitResult, policy: RateLimitPolicy
+    ) -> JSONResponse:
+        return JSONResponse(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            content={
+                "message": "Rate limit exceeded",
+            },
+            headers={
+                "X-RateLimit-Limit": str(policy.limit),
+                "X-RateLimit-Remaining": "0",
+                "X-RateLimit-Reset": str(result.retry_after),
+                "Retry-After": str(int(result.retry_after or 0)),
+            },
+        )
 
-        for exclude_path in self.exclude_paths:
-            pattern = exclude_path.rstrip("/") or "/"
 
-            if any(ch in pattern for ch in ["*", "?", "["]):
-                if fnmatch(normalized_path, pattern):
-                    return True
-            else:
-                if normalized_path.startswith(pattern):
-                    return True
+class RateLimitMiddleware(_RateLimitRules, BaseHTTPMiddleware):
+    """
+    FastAPI middleware for rate limiting with secure key generation
 
-        return False
+    Prefer ASGIRateLimitMiddleware, BaseHTTPMiddleware runs every request in
+    extra tasks and buffers streaming responses.
+    """
+
+    def __init__(
+        self,
+        app,
+        backend: Union[type[BaseRateLimiter], BaseRateLimiter],
+        enabled: bool = True,
+        limit: int = 100,
+        window: int = 60,
+        key_func: Optional[Callable[[Request], str]] = None,
+        exclude_paths: Optional[list[str]] = None,
+        use_fingerprint: bool = True,
+        policies: Optional[list[RateLimitRule]] = None,
+        metrics: Optional[RateLimitMetrics] = None,
+    ):
+        """
+        Initialize rate limit middleware
+
+        Args:
+            app: FastAPI application
+            backend: Rate limiter backend class or instance, a class is
+                instantiated without arguments
+            enabled: Enable/disable rate limiting
+            limit: Maximum requests per window
+            window: Time window in seconds
+            key_func: Custom function to extract rate limit key (optional)
+            exclude_paths: List of paths to exclude from rate limiting
+            use_fingerprint: Use browser fingerprint for anonymous users (more secure)
+            policies: Per route rules, routes without a rule get `limit` and
+                `window` (see core.rate_limiter.policy)
+            metrics: Counters to update, a new RateLimitMetrics by default
+        """
+        BaseHTTPMiddleware.__init__(self, app)
+        self._configure(
+            backend,
+            enabled,
+            limit,
+            window,
+            key_func,
+            exclude_paths,
+            use_fingerprint,
+            policies,
+            metrics,
+        )
 
     async def dispatch(self, request: Request, call_next):
         """Process request with rate limiting"""
@@ -90,38 +171,83 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         if self._should_exclude(request.url.path):
             return await call_next(request)
 
-        # Get rate limit key
-        key = self._get_rate_limit_key(request)
-
-        # Check rate limit
-        is_allowed, retry_after = await self.backend.is_allowed(
-            key, self.limit, self.window
-        )
+        # Get policy, then check and record the request
+        policy = self.policies.resolve(request.method, request.url.path)
+        result = await self._hit(request, policy)
 
-        if not is_allowed:
+        if not result.allowed:
             # Rate limit exceeded
-            return JSONResponse(
-                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-                content={
-                    "message": "Rate limit exceeded",
-                },
-                headers={
-                    "X-RateLimit-Limit": str(self.limit),
-                    "X-RateLimit-Remaining": "0",
-                    "X-RateLimit-Reset": str(retry_after),
-                    "Retry-After": str(int(retry_after or 0)),
-                },
-            )
+            return self._limited_response(result, policy)
 
         # Process request
         response = await call_next(request)
 
-        # Get remaining requests AFTER processing (accurate count)
-        remaining = await self.backend.get_remaining(key, self.limit)
-
         # Add rate limit headers
-        response.headers["X-RateLimit-Limit"] = str(self.limit)
-        response.headers["X-RateLimit-Remaining"] = str(remaining)
-        response.headers["X-RateLimit-Window"] = str(self.window)
+        response.headers["X-RateLimit-Limit"] = str(policy.limit)
+        response.headers["X-RateLimit-Remaining"] = str(result.remaining)
+        response.headers["X-RateLimit-Window"] = str(policy.window)
 
         return response
+
+
+class ASGIRateLimitMiddleware(_RateLimitRules):
+    """
+    Pure ASGI version of RateLimitMiddleware with the same behaviour
+
+    Adds the rate limit headers to the response start message while the
+    response is sent, so no extra task runs per request and streaming
+    responses are passed through as they are produced.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        backend: Union[type[BaseRateLimiter], BaseRateLimiter],
+        enabled: bool = True,
+        limit: int = 100,
+        window: int = 60,
+        key_func: Optional[Callable[[Request], str]] = None,
+        exclude_paths: Optional[list[str]] = None,
+        use_fingerprint: bool = True,
+        policies: Optional[list[RateLimitRule]] = None,
+        metrics: Optional[RateLimitMetrics] = None,
+    ):
+        """See RateLimitMiddleware for the arguments"""
+        self.app = app
+        self._configure(
+            backend,
+            enabled,
+            limit,
+            window,
+            key_func,
+            exclude_paths,
+            use_fingerprint,
+            policies,
+            metrics,
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            scope["type"] != "http"
+            or not self.enabled
+            or self._should_exclude(scope["path"])
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        policy = self.policies.resolve(scope["method"], scope["path"])
+        result = await self._hit(Request(scope), policy)
+
+        if not result.allowed:
+            await self._limited_response(result, policy)(scope, receive, send)
+            return
+
+        async def send_with_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                headers["X-RateLimit-Limit"] = str(policy.limit)
+                headers["X-RateLimit-Remaining"] = str(result.remaining)
+                headers["X-RateLimit-Window"] = str(policy.window)
+            await send(message)
+
+        await self.app(scope, receive, send_with_headers)
@@ -0,0 +1,60 @@
+import re
+from fnmatch import translate
+from typing import Iterable, Optional
+
+# Marks a node of the trie where a prefix ends
+_END = ""
+
+
+def _normalize_path(path: str) -> str:
+    return path.rstrip("/") or "/"
+
+
+class PathMatcher:
+    """
+    Match request paths against exclusion patterns, compiled once
+
+    Supports:
+    - exact prefix match, "/docs" matches "/docs" and "/docs/oauth2-redirect"
+    - glob patterns like '/user-profile/*/profile-picture/'
+
+    Prefixes are stored in a character trie, so a check walks the path once
+    no matter how many prefixes there are. Glob patterns are translated once
+    and combined into a single regex.
+    """
+
+    def __init__(self, patterns: Iterable[str]):
+        self._trie: dict = {}
+        globs = []
+        for pattern in patterns:
+            pattern = _normalize_path(pattern)
+            if any(ch in pattern for ch in ["*", "?", "["]):
+                globs.append(translate(pattern))
+                continue
+
+            node = self._trie
+            for ch in pattern:
+                node = node.setdefault(ch, {})
+            node[_END] = True
+
+        self._glob: Optional[re.Pattern] = (
+            re.compile("|".join(globs)) if globs else None
+        )
+
+    def _matches_prefix(self, path: str) -> bool:
+        node = self._trie
+        if not node:
+            return False
+        for ch in path:
+            node = node.get(ch)
+            if node is None:
+                return False
+            if _END in node:
+                return True
+        return False
+
+    def matches(self, path: str) -> bool:
+        path = _normalize_path(path)
+        if self._matches_prefix(path):
+            return True
+        return self._glob is not None and self._glob.match(path) is not None
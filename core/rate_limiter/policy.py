@@ -0,0 +1,128 @@
+import re
+from typing import Iterable, NamedTuple, Optional
+
+# Limit per user when authenticated, per client fingerprint otherwise
+KEY_USER = "user"
+# Limit per client IP, also for authenticated users (e.g. signup)
+KEY_IP = "ip"
+KEY_STRATEGIES = (KEY_USER, KEY_IP)
+
+_PARAM = re.compile(r"\{([^}]+)\}")
+
+
+class RateLimitPolicy(NamedTuple):
+    # Policies with the same name share one budget per client
+    name: str
+    limit: int
+    window: int = 60
+    key: str = KEY_USER
+    # Number of requests one call counts as
+    cost: int = 1
+
+
+class RateLimitRule(NamedTuple):
+    # HTTP method or "*" for every method
+    method: str
+    # Route template as declared on the router, e.g. "/schedule/{schedule_id}"
+    path: str
+    # None keeps the default policy, e.g. for a static path a template matches
+    policy: Optional[RateLimitPolicy]
+
+
+def _normalize_path(path: str) -> str:
+    return path.rstrip("/") or "/"
+
+
+def _template_to_regex(path: str) -> str:
+    """Turn a route template into a regex, "{name:path}" spans slashes"""
+    parts = _PARAM.split(path)
+    regex = []
+    for i, part in enumerate(parts):
+        if i % 2 == 0:
+            regex.append(re.escape(part))
+        else:
+            regex.append(".*" if part.endswith(":path") else "[^/]+")
+    return "".join(regex)
+
+
+class RateLimitPolicyTable:
+    """
+    Route template and method to rate limit policy, compiled once
+
+    Rules without path parameters are looked up in a dict, the others are
+    combined into one regex tried in rule order. Static rules win over
+    templated ones, a method rule wins over a "*" rule for the same path,
+    and requests matching no rule get the default policy.
+    """
+
+    def __init__(self, rules: Iterable[RateLimitRule], default: RateLimitPolicy):
+        self.default = default
+        self._static: dict[tuple[str, str], RateLimitPolicy] = {}
+        self._templated: list[RateLimitPolicy] = []
+        by_name = {default.name: default}
+        patterns = []
+
+        for rule in rules:
+            policy = rule.policy or default
+            if policy.key not in KEY_STRATEGIES:
+                raise ValueError(
+                    f"{policy.key} is not a rate limit key, use one of {KEY_STRATEGIES}"
+                )
+            shared = by_name.setdefault(policy.name, policy)
+            if (shared.limit, shared.window, shared.key) != (
+                policy.limit,
+                policy.window,
+                policy.key,
+            ):
+                raise ValueError(
+                    f"rate limit policy {policy.name} is declared with different "
+                    "limit, window or key"
+                )
+
+            method = rule.method.upper()
+            path = _normalize_path(rule.path)
+            if _PARAM.search(path) is None:
+                self._static.setdefault((method, path), policy)
+                continue
+
+            method_regex = "[A-Z]+" if method == "*" else re.escape(method)
+            patterns.append(
+                f"(?P<r{len(self._templated)}>{method_regex} {_template_to_regex(path)})"
+            )
+            self._templated.append(policy)
+
+        self._pattern: Optional[re.Pattern] = (
+            re.compile("|".join(patterns)) if patterns else None
+        )
+
+    def resolve(self, method: str, path: str) -> RateLimitPolicy:
+        """Policy for a request"""
+        path = _normalize_path(path)
+        policy = self._static.get((method, path)) or self._static.get(("*", path))
+        if policy is not None:
+            return policy
+
+        if self._pattern is not None:
+            match = self._pattern.fullmatch(f"{method} {path}")
+            if match is not None:
+                return self._templated[int(match.lastgroup[1:])]
+
+        return self.default
+
+
+# Sends an email, signup and forgot password share one budget per IP
+_EMAIL = RateLimitPolicy("email", limit=10, window=600, key=KEY_IP, cost=2)
+# Public programme pages, polled by many clients during the event
+_BROWSE = RateLimitPolicy("browse", limit=300, window=60)
+
+RATE_LIMIT_POLICIES = [
+    RateLimitRule("POST", "/payment/", RateLimitPolicy("payment", limit=5)),
+    RateLimitRule("POST", "/auth/email/signup/", _EMAIL),
+    RateLimitRule("POST", "/auth/email/forgot-password/", _EMAIL),
+    RateLimitRule("GET", "/locations/cities/", RateLimitPolicy("locations", limit=30)),
+    RateLimitRule("GET", "/schedule/", _BROWSE),
+    # Management's schedule list, not the public detail the template is for
+    RateLimitRule("GET", "/schedule/cms", None),
+    RateLimitRule("GET", "/schedule/{schedule_id}", _BROWSE),
+    RateLimitRule("GET", "/ticket/", _BROWSE),
+]
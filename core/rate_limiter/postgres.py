@@ -0,0 +1,164 @@
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Callable, Optional
+
+from sqlalchemy import delete, func, literal, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
+from core.rate_limiter import algorithms
+from core.rate_limiter.base import BaseRateLimiter, RateLimitResult
+from models.RateLimitCounter import RateLimitCounter
+
+
+class PostgresRateLimiter(BaseRateLimiter):
+    """
+    Rate limiter shared by every node that uses the same database
+
+    One row per key in `rate_limit_counter` holds the sliding window counter
+    state (see `core.rate_limiter.algorithms`). The row is locked with
+    SELECT ... FOR UPDATE while a request is counted, so concurrent workers
+    on different nodes never lose an increment. Queries run in the threadpool
+    to keep the event loop free.
+    """
+
+    def __init__(self, session_factory: Optional[Callable[[], Session]] = None):
+        """
+        Args:
+            session_factory: Callable returning a new Session, defaults to
+                the application sessionmaker
+        """
+        if session_factory is None:
+            from models import db
+
+            session_factory = db
+        self._session_factory = session_factory
+        # Time spent waiting for the row lock (and creating the row)
+        self.lock_wait_seconds = 0.0
+        self._stats_lock = threading.Lock()
+
+    def _lock_counter(self, session: Session, key: str, window: int, now: float):
+        stmt = (
+            select(RateLimitCounter)
+            .where(RateLimitCounter.key == key)
+            .with_for_update()
+        )
+        counter = session.execute(stmt).scalar_one_or_none()
+        if counter is not None:
+            return counter
+
+        session.execute(
+            insert(RateLimitCounter)
+            .values(
+                key=key,
+                window=window,
+                bucket=algorithms.current_bucket(now, window),
+                previous_count=0,
+                current_count=0,
+                updated_at=datetime.now(timezone.utc),
+            )
+            .on_conflict_do_nothing(index_elements=[RateLimitCounter.key])
+        )
+        return session.execute(stmt).scalar_one()
+
+    def _hit(self, key: str, limit: int, window: int, cost: int) -> RateLimitResult:
+        with self._session_factory() as session, session.begin():
+            now = time.time()
+            start = time.perf_counter()
+            counter = self._lock_counter(session, key, window, now)
+            with self._stats_lock:
+                self.lock_wait_seconds += time.perf_counter() - start
+            if counter.window != window:
+                counter.window = window
+                counter.bucket, counter.previous_count, counter.current_count = 0, 0, 0
+
+            (
+                allowed,
+                remaining,
+                retry_after,
+                counter.bucket,
+                counter.previous_count,
+                counter.current_count,
+            ) = algorithms.hit(
+                counter.bucket,
+                counter.previous_count,
+                counter.current_count,
+                window,
+                limit,
+                now,
+                cost,
+            )
+            counter.updated_at = datetime.now(timezone.utc)
+            return RateLimitResult(allowed, remaining, retry_after)
+
+    def _get_remaining(self, key: str, limit: int) -> int:
+        with self._session_factory() as session:
+            counter = session.get(RateLimitCounter, key)
+            if counter is None:
+                return max(0, limit)
+            return algorithms.remaining(
+                counter.bucket,
+                counter.previous_count,
+                counter.current_count,
+                counter.window,
+                limit,
+                time.time(),
+            )
+
+    def _reset(self, key: str) -> None:
+        with self._session_factory() as session, session.begin():
+            session.execute(delete(RateLimitCounter).where(RateLimitCounter.key == key))
+
+    def _evict_expired_batch(self, batch_size: int) -> int:
+        now = literal(time.time())
+        expired = (
+            select(RateLimitCounter.key)
+            .where(
+                RateLimitCounter.bucket < func.floor(now / RateLimitCounter.window) - 1
+            )
+            .limit(batch_size)
+            .with_for_update(skip_locked=True)
+        )
+        with self._session_factory() as session, session.begin():
+            result = session.execute(
+                delete(RateLimitCounter).where(
+                    RateLimitCounter.key.in_(expired.scalar_subquery())
+                )
+            )
+            return result.rowcount
+
+    async def is_allowed(
+        self, key: str, limit: int, window: int
+    ) -> tuple[bool, Optional[float]]:
+        result = await self.hit(key, limit, window)
+        return result.allowed, result.retry_after
+
+    async def hit(
+        self, key: str, limit: int, window: int, cost: int = 1
+    ) -> RateLimitResult:
+        return await run_in_threadpool(self._hit, key, limit, window, cost)
+
+    async def get_remaining(self, key: str, limit: int) -> int:
+        return await run_in_threadpool(self._get_remaining, key, limit)
+
+    async def reset(self, key: str) -> None:
+        await run_in_threadpool(self._reset, key)
+
+    async def evict_expired(self, batch_size: int = 1000) -> int:
+        """
+        Delete rows whose stored windows are both over
+
+        Rows are deleted `batch_size` at a time, each batch in its own short
+        transaction, skipping rows another node is counting right now.
+        """
+        total = 0
+        while True:
+            evicted = await run_in_threadpool(self._evict_expired_batch, batch_size)
+            total += evicted
+            if evicted < batch_size:
+                return total
+
+    def stats(self) -> dict:
+        return {"lock_wait_seconds": self.lock_wait_seconds}
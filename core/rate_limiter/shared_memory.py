@@ -0,0 +1,243 @@
+import asyncio
+import fcntl
+import hashlib
+import mmap
+import os
+import struct
+import time
+from contextlib import asynccontextmanager
+from typing import Optional
+
+from core.rate_limiter import algorithms
+from core.rate_limiter.base import BaseRateLimiter, RateLimitResult
+
+# Header: magic, layout version, number of slots
+_HEADER = struct.Struct("<4sII")
+_HEADER_SIZE = 64
+_MAGIC = b"PYRL"
+_VERSION = 1
+
+# Slot: key hash, bucket, window, previous count, current count
+_SLOT = struct.Struct("<QqIII4x")
+_EMPTY_SLOT = bytes(_SLOT.size)
+
+# Keys are probed inside a bucket of consecutive slots
+SLOTS_PER_BUCKET = 8
+
+
+class SharedMemoryRateLimiter(BaseRateLimiter):
+    """
+    Rate limiter shared by every worker process on one host
+
+    State lives in a fixed size hash table inside a memory mapped file
+    (by default under /dev/shm), so all uvicorn workers see the same counters
+    and limits survive a restart of the workers. Each key uses the sliding
+    window counter algorithm (see `core.rate_limiter.algorithms`).
+
+    When every slot of a bucket is taken, the slot with the oldest window is
+    reused, so the table never grows beyond `slots` entries.
+
+    Every bucket has its own lock (a POSIX record lock on the byte range of
+    the bucket), so workers only wait on each other for keys in the same
+    bucket. A worker waiting for a lock yields to the event loop between
+    attempts instead of blocking it.
+    """
+
+    def __init__(self, path: str, slots: int = 65536):
+        """
+        Args:
+            path: File backing the shared table, created when missing
+            slots: Number of keys the table can hold, rounded up to a
+                multiple of SLOTS_PER_BUCKET
+        """
+        self.path = path
+        self.buckets = max(1, -(-slots // SLOTS_PER_BUCKET))
+        self.slots = self.buckets * SLOTS_PER_BUCKET
+        self._size = _HEADER_SIZE + self.slots * _SLOT.size
+
+        self._fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+        fcntl.flock(self._fd, fcntl.LOCK_EX)
+        try:
+            if os.fstat(self._fd).st_size == 0:
+                os.ftruncate(self._fd, self._size)
+                os.pwrite(self._fd, _HEADER.pack(_MAGIC, _VERSION, self.slots), 0)
+            else:
+                magic, version, existing_slots = _HEADER.unpack(
+                    os.pread(self._fd, _HEADER.size, 0)
+                )
+                if magic != _MAGIC or version != _VERSION:
+                    raise ValueError(f"{path} is not a rate limiter table")
+                if existing_slots != self.slots:
+                    raise ValueError(
+                        f"{path} holds {existing_slots} slots, expected {self.slots}"
+                    )
+        finally:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+
+        self._map = mmap.mmap(self._fd, self._size)
+        # Next bucket evict_expired looks at, each process sweeps on its own
+        self._sweep_bucket = 0
+        self.evicted_expired = 0
+        self.lock_wait_seconds = 0.0
+
+    def close(self) -> None:
+        self._map.close()
+        os.close(self._fd)
+
+    @staticmethod
+    def _hash_key(key: str) -> int:
+        # 0 marks an empty slot
+        digest = hashlib.blake2b(key.encode(), digest_size=8).digest()
+        return int.from_bytes(digest, "little") or 1
+
+    def _slot_offset(self, index: int) -> int:
+        return _HEADER_SIZE + index * _SLOT.size
+
+    def _first_slot(self, key_hash: int) -> int:
+        return (key_hash % self.buckets) * SLOTS_PER_BUCKET
+
+    @asynccontextmanager
+    async def _locked(self, key_hash: int):
+        """Lock the bucket of a key for every process using the table"""
+        async with self._locked_bucket(key_hash % self.buckets):
+            yield
+
+    @asynccontextmanager
+    async def _locked_bucket(self, bucket_index: int):
+        start = self._slot_offset(bucket_index * SLOTS_PER_BUCKET)
+        length = SLOTS_PER_BUCKET * _SLOT.size
+        wait_start = time.perf_counter()
+        while True:
+            try:
+                fcntl.lockf(self._fd, fcntl.LOCK_EX | fcntl.LOCK_NB, length, start)
+                break
+            except OSError:
+                # Held by another worker for a few microseconds, retry on
+                # the next turn of the loop
+                await asyncio.sleep(0)
+        self.lock_wait_seconds += time.perf_counter() - wait_start
+        try:
+            yield
+        finally:
+            fcntl.lockf(self._fd, fcntl.LOCK_UN, length, start)
+
+    def _find_slot(self, key_hash: int, now: float, create: bool) -> Optional[int]:
+        """
+        Find the slot of a key inside its bucket
+
+        With create=True a free, expired or the least recently used slot of
+        the bucket is returned when the key is not stored yet.
+        """
+        first = self._first_slot(key_hash)
+        candidate = None
+        candidate_age = None
+        for index in range(first, first + SLOTS_PER_BUCKET):
+            slot_hash, bucket, window, _, _ = _SLOT.unpack_from(
+                self._map, self._slot_offset(index)
+            )
+            if slot_hash == key_hash:
+                return index
+            if not create:
+                continue
+
+            if slot_hash == 0:
+                age = float("inf")
+            elif algorithms.current_bucket(now, window) - bucket > 1:
+                # Both stored windows are over, nothing left to count
+                age = float("inf")
+            else:
+                age = now - bucket * window
+
+            if candidate_age is None or age > candidate_age:
+                candidate = index
+                candidate_age = age
+
+        if candidate is not None:
+            _SLOT.pack_into(
+                self._map, self._slot_offset(candidate), key_hash, 0, 1, 0, 0
+            )
+        return candidate
+
+    async def is_allowed(
+        self, key: str, limit: int, window: int
+    ) -> tuple[bool, Optional[float]]:
+        result = await self.hit(key, limit, window)
+        return result.allowed, result.retry_after
+
+    async def hit(
+        self, key: str, limit: int, window: int, cost: int = 1
+    ) -> RateLimitResult:
+        key_hash = self._hash_key(key)
+        async with self._locked(key_hash):
+            now = time.time()
+            index = self._find_slot(key_hash, now, create=True)
+            offset = self._slot_offset(index)
+            _, bucket, stored_window, previous, current = _SLOT.unpack_from(
+                self._map, offset
+            )
+            if stored_window != window:
+                bucket, previous, current = 0, 0, 0
+
+            allowed, remaining, retry_after, bucket, previous, current = algorithms.hit(
+                bucket, previous, current, window, limit, now, cost
+            )
+            _SLOT.pack_into(
+                self._map, offset, key_hash, bucket, window, previous, current
+            )
+            return RateLimitResult(allowed, remaining, retry_after)
+
+    async def get_remaining(self, key: str, limit: int) -> int:
+        key_hash = self._hash_key(key)
+        async with self._locked(key_hash):
+            now = time.time()
+            index = self._find_slot(key_hash, now, create=False)
+            if index is None:
+                return max(0, limit)
+
+            _, bucket, window, previous, current = _SLOT.unpack_from(
+                self._map, self._slot_offset(index)
+            )
+            return algorithms.remaining(bucket, previous, current, window, limit, now)
+
+    async def reset(self, key: str) -> None:
+        key_hash = self._hash_key(key)
+        async with self._locked(key_hash):
+            index = self._find_slot(key_hash, time.time(), create=False)
+            if index is not None:
+                offset = self._slot_offset(index)
+                self._map[offset : offset + _SLOT.size] = _EMPTY_SLOT
+
+    async def _evict_bucket(self, bucket_index: int, now: float) -> int:
+        evicted = 0
+        first = bucket_index * SLOTS_PER_BUCKET
+        async with self._locked_bucket(bucket_index):
+            for index in range(first, first + SLOTS_PER_BUCKET):
+                offset = self._slot_offset(index)
+                slot_hash, bucket, window, _, _ = _SLOT.unpack_from(self._map, offset)
+                if slot_hash and algorithms.current_bucket(now, window) - bucket > 1:
+                    self._map[offset : offset + _SLOT.size] = _EMPTY_SLOT
+                    evicted += 1
+        return evicted
+
+    async def evict_expired(self, batch_size: int = 1000) -> int:
+        """
+        Free slots whose stored windows are both over
+
+        Full slots are reused anyway, freeing them keeps probing short. One
+        call sweeps `batch_size` buckets and continues where the previous
+        call stopped, locking one bucket at a time.
+        """
+        now = time.time()
+        evicted = 0
+        for _ in range(min(batch_size, self.buckets)):
+            evicted += await self._evict_bucket(self._sweep_bucket, now)
+            self._sweep_bucket = (self._sweep_bucket + 1) % self.buckets
+        self.evicted_expired += evicted
+        return evicted
+
+    def stats(self) -> dict:
+        return {
+            "slots": self.slots,
+            "evicted_expired": self.evicted_expired,
+            "lock_wait_seconds": self.lock_wait_seconds,
+        }
@@ -1,6 +1,12 @@
 import asyncio
 from unittest.async_case import IsolatedAsyncioTestCase
-from core.rate_limiter.memory import InMemoryRateLimiter
+from unittest.mock import patch
+from core.rate_limiter.base import BaseRateLimiter
+from core.rate_limiter.memory import (
+    SLIDING_LOG,
+    SLIDING_WINDOW_COUNTER,
+    InMemoryRateLimiter,
+)
 
 
 class TestInMemoryRateLimiter(IsolatedAsyncioTestCase):
@@ -194,3 +200,329 @@ class TestInMemoryRateLimiter(IsolatedAsyncioTestCase):
         # Next one should be blocked
         is_allowed, _ = await self.limiter.is_allowed(key, limit, window)
         self.assertFalse(is_allowed)
+
+    async def test_hit_reports_remaining(self):
+        key = "hit_test"
+        limit = 3
+        window = 60
+
+        for expected_remaining in [2, 1, 0]:
+            result = await self.limiter.hit(key, limit, window)
+            self.assertTrue(result.allowed)
+            self.assertEqual(result.remaining, expected_remaining)
+            self.assertIsNone(result.retry_after)
+
+        result = await self.limiter.hit(key, limit, window)
+        self.assertFalse(result.allowed)
+        self.assertEqual(result.remaining, 0)
+        self.assertGreater(result.retry_after, 0)
+
+    async def test_concurrent_hits_report_unique_remaining(self):
+        key = "concurrent_hit_test"
+        limit = 10
+        window = 60
+
+        results = await asyncio.gather(
+            *[self.limiter.hit(key, limit, window) for _ in range(limit)]
+        )
+
+        # Each request is counted and reported atomically
+        self.assertEqual(
+            sorted(result.remaining for result in results), list(range(limit))
+        )
+
+    async def test_hit_with_cost(self):
+        result = await self.limiter.hit("cost", 5, 60, cost=2)
+        self.assertEqual(result, (True, 3, None))
+        result = await self.limiter.hit("cost", 5, 60, cost=2)
+        self.assertEqual(result.remaining, 1)
+
+        result = await self.limiter.hit("cost", 5, 60, cost=2)
+        self.assertFalse(result.allowed)
+        self.assertGreater(result.retry_after, 0)
+        # A cheaper request still fits
+        result = await self.limiter.hit("cost", 5, 60)
+        self.assertEqual(result, (True, 0, None))
+
+    async def test_cost_above_limit_never_allowed(self):
+        result = await self.limiter.hit("cost", 1, 60, cost=2)
+        self.assertFalse(result.allowed)
+        self.assertEqual(result.retry_after, 60)
+
+    async def test_fallback_hit_with_cost(self):
+        class FallbackLimiter(InMemoryRateLimiter):
+            """A backend with only is_allowed and get_remaining"""
+
+            async def is_allowed(self, key, limit, window):
+                result = await InMemoryRateLimiter.hit(self, key, limit, window)
+                return result.allowed, result.retry_after
+
+            hit = BaseRateLimiter.hit
+
+        limiter = FallbackLimiter()
+        self.assertEqual(await limiter.hit("cost", 5, 60, cost=2), (True, 3, None))
+        self.assertEqual(await limiter.hit("cost", 5, 60, cost=2), (True, 1, None))
+
+        result = await limiter.hit("cost", 5, 60, cost=2)
+        self.assertEqual(result, (False, 0, 60.0))
+        # Denied without recording, a cheaper request still fits
+        self.assertEqual(await limiter.hit("cost", 5, 60), (True, 0, None))
+        result = await limiter.hit("cost", 5, 60, cost=2)
+        self.assertFalse(result.allowed)
+        self.assertGreater(result.retry_after, 0)
+
+
+class TestSlidingWindowCounterAlgorithm(IsolatedAsyncioTestCase):
+    """
+    Sliding window counter against the sliding log
+
+    The counter never lets its estimate exceed the limit and decides like
+    the log for bursts aligned to a window. It assumes the previous
+    window's requests were spread evenly: it denies requests the log allows
+    while a burst slides out, and after a burst just before a window edge
+    it allows requests the log denies, less than twice the limit in any
+    window-long span.
+    """
+
+    limit = 6
+    window = 60
+    # Start of a fixed window, so the counter buckets line up with the test
+    start = 600.0
+
+    def setUp(self):
+        self.log = InMemoryRateLimiter(algorithm=SLIDING_LOG)
+        self.counter = InMemoryRateLimiter(algorithm=SLIDING_WINDOW_COUNTER)
+
+    async def decide(self, timestamps: list[float]) -> list[list[bool]]:
+        """Run the same request timestamps through both algorithms"""
+        decisions = []
+        for limiter in [self.log, self.counter]:
+            allowed = []
+            with patch("core.rate_limiter.memory.time") as mock_time:
+                for ts in timestamps:
+                    mock_time.time.return_value = ts
+                    is_allowed, _ = await limiter.is_allowed(
+                        "key", self.limit, self.window
+                    )
+                    allowed.append(is_allowed)
+            decisions.append(allowed)
+        return decisions
+
+    def busiest(self, timestamps: list[float], decisions: list[bool]) -> int:
+        """Most allowed requests in any window-long span"""
+        allowed = [ts for ts, ok in zip(timestamps, decisions) if ok]
+        return max(
+            sum(1 for other in allowed if ts <= other < ts + self.window)
+            for ts in allowed
+        )
+
+    async def test_invalid_algorithm(self):
+        with self.assertRaises(ValueError):
+            InMemoryRateLimiter(algorithm="fixed_window")
+
+    async def test_burst_at_window_start(self):
+        log, counter = await self.decide([self.start] * (self.limit + 1))
+        self.assertEqual(log, counter)
+        self.assertEqual(log, [True] * self.limit + [False])
+
+    async def test_denied_until_just_before_window_edge(self):
+        timestamps = [self.start] * self.limit + [self.start + self.window - 0.001]
+        log, counter = await self.decide(timestamps)
+        self.assertEqual(log, counter)
+        self.assertFalse(log[-1])
+
+    async def test_burst_slides_out_after_window_edge(self):
+        step = self.window / self.limit
+        timestamps = [self.start] * self.limit + [
+            self.start + self.window + 0.001,
+            self.start + self.window + step,
+        ]
+        log, counter = await self.decide(timestamps)
+        # The burst still weighs almost fully right after the edge
+        self.assertEqual(log[-2:], [True, True])
+        self.assertEqual(counter[-2:], [False, True])
+
+    async def test_fresh_after_two_idle_windows(self):
+        timestamps = [self.start] * self.limit + [self.start + 2 * self.window] * (
+            self.limit + 1
+        )
+        log, counter = await self.decide(timestamps)
+        self.assertEqual(log, counter)
+        self.assertEqual(log[self.limit :], [True] * self.limit + [False])
+
+    async def test_even_traffic_across_window_edges(self):
+        # Exactly `limit` requests per window, spread evenly over three windows
+        step = self.window / self.limit
+        timestamps = [self.start + (i + 0.5) * step for i in range(3 * self.limit)]
+        log, counter = await self.decide(timestamps)
+        self.assertTrue(all(log))
+        # The first request of each later window would take the estimate to
+        # limit + 0.5
+        self.assertEqual(counter.count(False), 2)
+        self.assertLessEqual(self.busiest(timestamps, counter), self.limit)
+
+    async def test_even_traffic_extra_request_denied(self):
+        # One extra request on top of even traffic in the second window
+        step = self.window / self.limit
+        timestamps = [self.start + (i + 0.5) * step for i in range(2 * self.limit)]
+        timestamps.insert(self.limit + 3, timestamps[self.limit + 2])
+        log, counter = await self.decide(timestamps)
+        self.assertFalse(log[self.limit + 3])
+        self.assertFalse(counter[self.limit + 3])
+
+    async def test_burst_before_window_edge_bounded(self):
+        # A burst just before the edge, then a request every half second
+        burst = self.start + self.window - 1
+        timestamps = [burst] * self.limit + [burst + i / 2 for i in range(1, 240)]
+        log, counter = await self.decide(timestamps)
+
+        # 10s past the edge the counter weighs the burst at 49/60
+        after_edge = timestamps.index(self.start + self.window + 10)
+        self.assertFalse(log[after_edge])
+        self.assertTrue(counter[after_edge])
+        self.assertEqual(self.busiest(timestamps, log), self.limit)
+        self.assertLess(self.busiest(timestamps, counter), 2 * self.limit)
+
+    async def test_limit_is_ceiling(self):
+        with patch("core.rate_limiter.memory.time") as mock_time:
+            mock_time.time.return_value = self.start
+            for _ in range(self.limit):
+                await self.counter.hit("key", self.limit, self.window)
+
+            # The burst weighs 5.95, one more would be 6.95
+            mock_time.time.return_value = self.start + self.window + 0.5
+            result = await self.counter.hit("key", self.limit, self.window)
+            self.assertFalse(result.allowed)
+
+            # The burst weighs 3, exactly three more fit
+            mock_time.time.return_value = self.start + self.window + 30
+            results = [
+                await self.counter.hit("key", self.limit, self.window) for _ in range(4)
+            ]
+            self.assertEqual([r.allowed for r in results], [True] * 3 + [False])
+            self.assertEqual(results[2].remaining, 0)
+
+    async def test_retry_after_and_remaining(self):
+        with patch("core.rate_limiter.memory.time") as mock_time:
+            mock_time.time.return_value = self.start
+            for _ in range(self.limit):
+                await self.counter.is_allowed("key", self.limit, self.window)
+            self.assertEqual(await self.counter.get_remaining("key", self.limit), 0)
+
+            mock_time.time.return_value = self.start + 10
+            is_allowed, retry_after = await self.counter.is_allowed(
+                "key", self.limit, self.window
+            )
+            self.assertFalse(is_allowed)
+            # A slot frees up at start + 70, when the burst weighs 5
+            self.assertAlmostEqual(retry_after, 60)
+
+            mock_time.time.return_value = self.start + self.window + 30
+            result = await self.counter.hit("key", self.limit, self.window)
+            # Half of the burst still weighs on the sliding window
+            self.assertTrue(result.allowed)
+            self.assertEqual(result.remaining, 2)
+
+    async def test_cost_matches_sliding_log(self):
+        for limiter in [self.log, self.counter]:
+            with patch("core.rate_limiter.memory.time") as mock_time:
+                mock_time.time.return_value = self.start
+                results = [
+                    await limiter.hit("key", self.limit, self.window, cost=4)
+                    for _ in range(2)
+                ]
+                self.assertEqual([r.allowed for r in results], [True, False])
+                self.assertEqual(results[0].remaining, 2)
+
+                # The first request slid out of the window
+                mock_time.time.return_value = self.start + 2 * self.window
+                result = await limiter.hit("key", self.limit, self.window, cost=4)
+                self.assertTrue(result.allowed)
+
+    async def test_cleanup_expired_counters(self):
+        with patch("core.rate_limiter.memory.time") as mock_time:
+            mock_time.time.return_value = self.start
+            await self.counter.is_allowed("key", self.limit, self.window)
+
+            mock_time.time.return_value = self.start + 2 * self.window
+            await self.counter.cleanup_expired(self.window)
+
+        self.assertEqual(self.counter._counters, {})
+
+
+class TestInMemoryEviction(IsolatedAsyncioTestCase):
+    start = 600.0
+
+    async def test_evict_expired_only_idle_keys(self):
+        limiter = InMemoryRateLimiter()
+        with patch("core.rate_limiter.memory.time") as mock_time:
+            mock_time.time.return_value = self.start
+            await limiter.hit("idle", 5, 10)
+            await limiter.hit("active", 5, 60)
+
+            mock_time.time.return_value = self.start + 11
+            evicted = await limiter.evict_expired()
+
+        self.assertEqual(evicted, 1)
+        self.assertNotIn("idle", limiter._requests)
+        self.assertIn("active", limiter._requests)
+        self.assertEqual(limiter.stats()["active_keys"], 1)
+        self.assertEqual(limiter.stats()["stored_timestamps"], 1)
+        self.assertEqual(limiter.stats()["evicted_expired"], 1)
+
+    async def test_evict_expired_in_batches(self):
+        limiter = InMemoryRateLimiter(algorithm=SLIDING_WINDOW_COUNTER)
+        with patch("core.rate_limiter.memory.time") as mock_time:
+            mock_time.time.return_value = self.start
+            for i in range(25):
+                await limiter.hit(f"key{i}", 5, 10)
+
+            mock_time.time.return_value = self.start + 11
+            evicted = await limiter.evict_expired(batch_size=10)
+
+        self.assertEqual(evicted, 25)
+        self.assertEqual(limiter._counters, {})
+        self.assertEqual(limiter.stats()["active_keys"], 0)
+
+    async def test_max_keys_evicts_least_recently_used(self):
+        limiter = InMemoryRateLimiter(max_keys=2)
+        await limiter.hit("key1", 5, 60)
+        await limiter.hit("key2", 5, 60)
+        # key1 becomes the most recently used key
+        await limiter.hit("key1", 5, 60)
+        await limiter.hit("key3", 5, 60)
+
+        self.assertEqual(set(limiter._requests), {"key1", "key3"})
+        self.assertEqual(await limiter.get_remaining("key1", 5), 3)
+        stats = limiter.stats()
+        self.assertEqual(stats["active_keys"], 2)
+        self.assertEqual(stats["evicted_capacity"], 1)
+        self.assertEqual(stats["stored_timestamps"], 3)
+
+    async def test_long_window_key_does_not_block_eviction(self):
+        limiter = InMemoryRateLimiter()
+        with patch("core.rate_limiter.memory.time") as mock_time:
+            mock_time.time.return_value = self.start
+            await limiter.hit("email:user", 5, 600)
+            for i in range(1000):
+                await limiter.hit(f"key{i}", 5, 60)
+
+            mock_time.time.return_value = self.start + 100
+            evicted = await limiter.evict_expired()
+
+        self.assertEqual(evicted, 1000)
+        self.assertEqual(set(limiter._requests), {"email:user"})
+        self.assertEqual(limiter.stats()["active_keys"], 1)
+
+    async def test_max_keys_evicts_least_recently_used_across_windows(self):
+        limiter = InMemoryRateLimiter(max_keys=2)
+        with patch("core.rate_limiter.memory.time") as mock_time:
+            mock_time.time.return_value = self.start
+            await limiter.hit("short", 5, 60)
+            mock_time.time.return_value = self.start + 1
+            await limiter.hit("long", 5, 600)
+            mock_time.time.return_value = self.start + 2
+            await limiter.hit("new", 5, 60)
+
+        self.assertEqual(set(limiter._requests), {"long", "new"})
+        self.assertEqual(limiter.stats()["evicted_capacity"], 1)
@@ -0,0 +1,94 @@
+from unittest import TestCase
+
+from fastapi.testclient import TestClient
+
+from core.rate_limiter.base import RateLimitResult
+from core.rate_limiter.memory import InMemoryRateLimiter
+from core.rate_limiter.metrics import RateLimitMetrics
+from core.rate_limiter.policy import RateLimitPolicy
+from core.security import get_current_principal
+from core.user_cache import UserPrincipal
+from models.User import MANAGEMENT_PARTICIPANT, VOLUNTEER_PARTICIPANT
+
+POLICY = RateLimitPolicy("payment", limit=20)
+
+
+class TestRateLimitMetrics(TestCase):
+    def test_counts_per_policy(self):
+        metrics = RateLimitMetrics()
+        metrics.record(POLICY, RateLimitResult(True, 10, None), 0.001, 0.002)
+        metrics.record(POLICY, RateLimitResult(True, 2, None), 0.001, 0.002)
+        metrics.record(POLICY, RateLimitResult(False, 0, 5.0), 0.001, 0.002)
+
+        snapshot = metrics.snapshot()
+        self.assertEqual(
+            snapshot["policies"]["payment"],
+            {"limit": 20, "window": 60, "allowed": 2, "denied": 1, "near_limit": 1},
+        )
+        self.assertEqual(snapshot["build_key"]["calls"], 3)
+        self.assertAlmostEqual(snapshot["build_key"]["seconds"], 0.003)
+        self.assertEqual(snapshot["backend"]["calls"], 3)
+        self.assertAlmostEqual(snapshot["backend"]["seconds"], 0.006)
+
+    def test_listener(self):
+        metrics = RateLimitMetrics()
+        seen = []
+        metrics.add_listener(lambda policy, result: seen.append((policy, result)))
+        result = RateLimitResult(False, 0, 5.0)
+        metrics.record(POLICY, result, 0, 0)
+
+        self.assertEqual(seen, [(POLICY, result)])
+
+    def test_snapshot_includes_backend_stats(self):
+        backend = InMemoryRateLimiter(max_keys=100)
+        snapshot = RateLimitMetrics().snapshot(backend)
+
+        self.assertEqual(snapshot["backend"]["active_keys"], 0)
+        self.assertEqual(snapshot["backend"]["max_keys"], 100)
+
+
+class TestRateLimitMetricsEndpoint(TestCase):
+    def setUp(self):
+        from main import app
+
+        self.app = app
+        self.client = TestClient(app)
+
+    def tearDown(self):
+        self.app.dependency_overrides.pop(get_current_principal, None)
+
+    def get_as(self, participant_type):
+        principal = participant_type and UserPrincipal(
+            id="1", username="user", participant_type=participant_type, email=None
+        )
+        self.app.dependency_overrides[get_current_principal] = lambda: principal
+        return self.client.get("/metrics/rate-limit")
+
+    def test_metrics_endpoint(self):
+        response = self.get_as(MANAGEMENT_PARTICIPANT)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("policies", response.json())
+        self.assertIn("build_key", response.json())
+        self.assertIn("active_keys", response.json()["backend"])
+
+    def test_metrics_endpoint_management_only(self):
+        self.assertEqual(self.get_as(None).status_code, 401)
+        self.assertEqual(self.get_as(VOLUNTEER_PARTICIPANT).status_code, 403)
+
+    def test_apps_do_not_share_metrics(self):
+        from main import create_app
+
+        other = create_app()
+        self.app.state.rate_limit_metrics.record(
+            POLICY, RateLimitResult(False, 0, 30), 0.001, 0.002
+        )
+
+        self.assertIsNot(other.state.rate_limiter, self.app.state.rate_limiter)
+        self.assertIsNot(other.state.loop_monitor, self.app.state.loop_monitor)
+        self.assertEqual(
+            other.state.rate_limit_metrics.snapshot(other.state.rate_limiter)[
+                "policies"
+            ],
+            {},
+        )
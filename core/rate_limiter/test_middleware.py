@@ -1,12 +1,15 @@
 import asyncio
 from unittest.async_case import IsolatedAsyncioTestCase
-from unittest.mock import Mock
+from unittest.mock import AsyncMock, Mock
 
-from fastapi import Request
-from fastapi.responses import JSONResponse
+import httpx
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, StreamingResponse
 
 from core.rate_limiter.memory import InMemoryRateLimiter
-from core.rate_limiter.middleware import RateLimitMiddleware
+from core.rate_limiter.metrics import RateLimitMetrics
+from core.rate_limiter.middleware import ASGIRateLimitMiddleware, RateLimitMiddleware
+from core.rate_limiter.policy import KEY_IP, RateLimitPolicy, RateLimitRule
 from main import app
 
 
@@ -330,3 +333,151 @@ class TestRateLimitMiddleware(IsolatedAsyncioTestCase):
         response = await middleware.dispatch(request, mock_call_next)
         self.assertEqual(response.status_code, 429)
         self.assertEqual(response.headers["X-RateLimit-Remaining"], "0")
+
+    async def test_single_backend_call_per_request(self):
+        backend = InMemoryRateLimiter()
+        backend.is_allowed = AsyncMock()
+        backend.get_remaining = AsyncMock()
+        middleware = RateLimitMiddleware(
+            app=app,
+            backend=backend,
+            enabled=True,
+            limit=3,
+            window=self.window,
+            use_fingerprint=False,
+        )
+
+        request = self.create_mock_request()
+
+        async def mock_call_next(req):
+            return JSONResponse({"status": "ok"})
+
+        response = await middleware.dispatch(request, mock_call_next)
+
+        self.assertEqual(response.headers["X-RateLimit-Remaining"], "2")
+        backend.is_allowed.assert_not_called()
+        backend.get_remaining.assert_not_called()
+
+
+class TestASGIRateLimitMiddleware(IsolatedAsyncioTestCase):
+    def create_client(self, limit=2, **kwargs) -> httpx.AsyncClient:
+        test_app = FastAPI()
+
+        @test_app.get("/items")
+        async def items():
+            return [{"id": 1}]
+
+        @test_app.get("/items/{item_id}")
+        async def item(item_id: int):
+            return {"id": item_id}
+
+        @test_app.post("/items")
+        async def create_item():
+            return {"id": 2}
+
+        @test_app.get("/stream")
+        async def stream():
+            async def chunks():
+                yield b"first,"
+                yield b"second"
+
+            return StreamingResponse(chunks(), media_type="text/plain")
+
+        test_app.add_middleware(
+            ASGIRateLimitMiddleware,
+            backend=InMemoryRateLimiter(),
+            limit=limit,
+            window=60,
+            use_fingerprint=False,
+            **kwargs,
+        )
+        return httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=test_app), base_url="http://test"
+        )
+
+    async def test_headers_on_success(self):
+        async with self.create_client() as client:
+            response = await client.get("/items")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), [{"id": 1}])
+        self.assertEqual(response.headers["X-RateLimit-Limit"], "2")
+        self.assertEqual(response.headers["X-RateLimit-Remaining"], "1")
+        self.assertEqual(response.headers["X-RateLimit-Window"], "60")
+
+    async def test_blocked_request(self):
+        async with self.create_client() as client:
+            await client.get("/items")
+            await client.get("/items")
+            response = await client.get("/items")
+
+        self.assertEqual(response.status_code, 429)
+        self.assertEqual(response.json(), {"message": "Rate limit exceeded"})
+        self.assertEqual(response.headers["X-RateLimit-Limit"], "2")
+        self.assertEqual(response.headers["X-RateLimit-Remaining"], "0")
+        self.assertGreater(float(response.headers["X-RateLimit-Reset"]), 0)
+        self.assertIn("Retry-After", response.headers)
+
+    async def test_excluded_paths(self):
+        async with self.create_client(limit=1, exclude_paths=["/ite*"]) as client:
+            for _ in range(3):
+                response = await client.get("/items")
+                self.assertEqual(response.status_code, 200)
+                self.assertNotIn("X-RateLimit-Limit", response.headers)
+
+    async def test_disabled(self):
+        async with self.create_client(limit=1, enabled=False) as client:
+            for _ in range(3):
+                response = await client.get("/items")
+                self.assertEqual(response.status_code, 200)
+
+    async def test_streaming_response(self):
+        async with self.create_client() as client:
+            response = await client.get("/stream")
+
+        self.assertEqual(response.text, "first,second")
+        self.assertEqual(response.headers["X-RateLimit-Remaining"], "1")
+
+    async def test_route_policies(self):
+        detail = RateLimitPolicy("detail", limit=1, window=30)
+        create = RateLimitPolicy("create", limit=4, key=KEY_IP, cost=2)
+        policies = [
+            RateLimitRule("GET", "/items/{item_id}", detail),
+            RateLimitRule("POST", "/items", create),
+        ]
+        async with self.create_client(limit=5, policies=policies) as client:
+            response = await client.get("/items/1")
+            self.assertEqual(response.headers["X-RateLimit-Limit"], "1")
+            self.assertEqual(response.headers["X-RateLimit-Window"], "30")
+            # Same policy for another item
+            response = await client.get("/items/2")
+            self.assertEqual(response.status_code, 429)
+            self.assertEqual(response.headers["X-RateLimit-Limit"], "1")
+
+            # Every call counts twice against its own budget
+            response = await client.post("/items")
+            self.assertEqual(response.headers["X-RateLimit-Remaining"], "2")
+            response = await client.post("/items")
+            self.assertEqual(response.headers["X-RateLimit-Remaining"], "0")
+            response = await client.post("/items")
+            self.assertEqual(response.status_code, 429)
+
+            # Routes without a rule keep the default budget
+            response = await client.get("/items")
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(response.headers["X-RateLimit-Remaining"], "4")
+
+    async def test_metrics(self):
+        metrics = RateLimitMetrics()
+        policies = [RateLimitRule("POST", "/items", RateLimitPolicy("create", 1))]
+        async with self.create_client(policies=policies, metrics=metrics) as client:
+            await client.get("/items")
+            await client.post("/items")
+            await client.post("/items")
+
+        snapshot = metrics.snapshot()
+        self.assertEqual(snapshot["policies"]["default"]["allowed"], 1)
+        self.assertEqual(snapshot["policies"]["create"]["allowed"], 1)
+        self.assertEqual(snapshot["policies"]["create"]["denied"], 1)
+        self.assertEqual(snapshot["build_key"]["calls"], 3)
+        self.assertGreater(snapshot["backend"]["seconds"], 0)
@@ -0,0 +1,76 @@
+import random
+from fnmatch import fnmatch
+from unittest import TestCase
+
+from core.rate_limiter.path_matcher import PathMatcher
+
+
+def loop_should_exclude(patterns: list[str], path: str) -> bool:
+    """Pattern by pattern check the compiled matcher replaces"""
+    normalized_path = path.rstrip("/") or "/"
+    for exclude_path in patterns:
+        pattern = exclude_path.rstrip("/") or "/"
+        if any(ch in pattern for ch in ["*", "?", "["]):
+            if fnmatch(normalized_path, pattern):
+                return True
+        elif normalized_path.startswith(pattern):
+            return True
+    return False
+
+
+class TestPathMatcher(TestCase):
+    def test_prefix(self):
+        matcher = PathMatcher(["/docs", "/auth/token/"])
+        self.assertTrue(matcher.matches("/docs"))
+        self.assertTrue(matcher.matches("/docs/oauth2-redirect"))
+        self.assertTrue(matcher.matches("/auth/token"))
+        self.assertFalse(matcher.matches("/auth/me/"))
+        self.assertFalse(matcher.matches("/doc"))
+
+    def test_glob(self):
+        matcher = PathMatcher(["/user-profile/*/profile-picture/", "/speaker/[0-9]?"])
+        self.assertTrue(matcher.matches("/user-profile/abc/profile-picture/"))
+        self.assertTrue(matcher.matches("/speaker/12"))
+        self.assertFalse(matcher.matches("/user-profile/abc/profile-banner/"))
+        self.assertFalse(matcher.matches("/speaker/a2"))
+
+    def test_empty(self):
+        matcher = PathMatcher([])
+        self.assertFalse(matcher.matches("/"))
+        self.assertFalse(matcher.matches("/docs"))
+
+    def test_root_matches_everything(self):
+        self.assertTrue(PathMatcher(["/"]).matches("/anything"))
+
+    def test_same_result_as_pattern_loop(self):
+        rng = random.Random(7)
+        segments = ["api", "v1", "user", "profile", "docs", "12", "ab", "x"]
+
+        def random_path(min_segments=1):
+            return "/" + "/".join(
+                rng.choice(segments) for _ in range(rng.randint(min_segments, 4))
+            )
+
+        patterns = []
+        for _ in range(300):
+            pattern = random_path(min_segments=3)
+            kind = rng.random()
+            if kind < 0.3:
+                pattern = pattern.replace(rng.choice(segments), "*", 1)
+            elif kind < 0.4:
+                pattern += "/?"
+            elif kind < 0.5:
+                pattern += "/[a-z]*"
+            patterns.append(pattern + rng.choice(["", "/"]))
+
+        matcher = PathMatcher(patterns)
+        excluded = 0
+        for _ in range(3000):
+            path = random_path() + rng.choice(["", "/"])
+            expected = loop_should_exclude(patterns, path)
+            self.assertEqual(matcher.matches(path), expected, path)
+            excluded += expected
+
+        # Both outcomes are covered
+        self.assertGreater(excluded, 100)
+        self.assertLess(excluded, 2900)
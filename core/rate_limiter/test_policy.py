@@ -0,0 +1,109 @@
+from unittest import TestCase
+
+from core.rate_limiter.policy import (
+    KEY_IP,
+    RATE_LIMIT_POLICIES,
+    RateLimitPolicy,
+    RateLimitPolicyTable,
+    RateLimitRule,
+)
+
+DEFAULT = RateLimitPolicy("default", limit=20)
+PAYMENT = RateLimitPolicy("payment", limit=5)
+DETAIL = RateLimitPolicy("detail", limit=100)
+FILES = RateLimitPolicy("files", limit=10)
+ANY = RateLimitPolicy("any", limit=50)
+
+
+class TestRateLimitPolicyTable(TestCase):
+    def setUp(self):
+        self.table = RateLimitPolicyTable(
+            [
+                RateLimitRule("POST", "/payment/", PAYMENT),
+                RateLimitRule("GET", "/schedule/{schedule_id}", DETAIL),
+                RateLimitRule("GET", "/schedule/cms", ANY),
+                RateLimitRule("GET", "/files/{file_path:path}", FILES),
+                RateLimitRule("*", "/voucher/{voucher_id}/status", ANY),
+            ],
+            default=DEFAULT,
+        )
+
+    def test_static_path_and_method(self):
+        self.assertEqual(self.table.resolve("POST", "/payment/"), PAYMENT)
+        self.assertEqual(self.table.resolve("POST", "/payment"), PAYMENT)
+        self.assertEqual(self.table.resolve("GET", "/payment/"), DEFAULT)
+
+    def test_templated_path(self):
+        self.assertEqual(self.table.resolve("GET", "/schedule/abc-123"), DETAIL)
+        self.assertEqual(self.table.resolve("GET", "/schedule/abc/stream"), DEFAULT)
+        self.assertEqual(self.table.resolve("PUT", "/schedule/abc-123"), DEFAULT)
+
+    def test_static_rule_wins_over_template(self):
+        self.assertEqual(self.table.resolve("GET", "/schedule/cms"), ANY)
+
+    def test_path_parameter_spans_slashes(self):
+        self.assertEqual(self.table.resolve("GET", "/files/a/b/c.png"), FILES)
+
+    def test_any_method(self):
+        self.assertEqual(self.table.resolve("PATCH", "/voucher/1/status"), ANY)
+        self.assertEqual(self.table.resolve("GET", "/voucher/1/status/"), ANY)
+
+    def test_unknown_path_gets_default(self):
+        self.assertEqual(self.table.resolve("GET", "/health"), DEFAULT)
+
+    def test_conflicting_shared_policy(self):
+        with self.assertRaises(ValueError):
+            RateLimitPolicyTable(
+                [
+                    RateLimitRule("GET", "/a", RateLimitPolicy("shared", limit=5)),
+                    RateLimitRule("GET", "/b", RateLimitPolicy("shared", limit=6)),
+                ],
+                default=DEFAULT,
+            )
+
+    def test_unknown_key_strategy(self):
+        with self.assertRaises(ValueError):
+            RateLimitPolicyTable(
+                [RateLimitRule("GET", "/a", RateLimitPolicy("a", 5, key="session"))],
+                default=DEFAULT,
+            )
+
+    def test_shared_policy_with_ip_key(self):
+        email = RateLimitPolicy("email", limit=10, key=KEY_IP, cost=2)
+        table = RateLimitPolicyTable(
+            [
+                RateLimitRule("POST", "/signup", email),
+                RateLimitRule("POST", "/forgot", email),
+            ],
+            default=DEFAULT,
+        )
+        self.assertIs(
+            table.resolve("POST", "/signup"), table.resolve("POST", "/forgot")
+        )
+
+    def test_rule_keeping_default_policy(self):
+        table = RateLimitPolicyTable(
+            [
+                RateLimitRule("GET", "/schedule/cms", None),
+                RateLimitRule("GET", "/schedule/{schedule_id}", DETAIL),
+            ],
+            default=DEFAULT,
+        )
+        self.assertEqual(table.resolve("GET", "/schedule/cms"), DEFAULT)
+        self.assertEqual(table.resolve("GET", "/schedule/abc-123"), DETAIL)
+
+    def test_application_cms_schedule_is_not_browse(self):
+        table = RateLimitPolicyTable(RATE_LIMIT_POLICIES, default=DEFAULT)
+        self.assertEqual(table.resolve("GET", "/schedule/cms"), DEFAULT)
+        self.assertEqual(table.resolve("GET", "/schedule/abc-123").name, "browse")
+
+    def test_application_rules_match_routes(self):
+        from main import app
+
+        routes = {
+            (method, route.path.rstrip("/") or "/")
+            for route in app.routes
+            for method in getattr(route, "methods", None) or []
+        }
+        for rule in RATE_LIMIT_POLICIES:
+            self.assertIn((rule.method, rule.path.rstrip("/") or "/"), routes, rule)
@@ -0,0 +1,155 @@
+import asyncio
+import fcntl
+import multiprocessing
+import os
+import tempfile
+import time
+from unittest.async_case import IsolatedAsyncioTestCase
+from unittest.mock import patch
+
+from core.rate_limiter.shared_memory import SharedMemoryRateLimiter
+
+
+def _hit_from_process(path: str, slots: int, key: str, limit: int, attempts: int):
+    limiter = SharedMemoryRateLimiter(path=path, slots=slots)
+
+    async def run():
+        return sum(
+            [(await limiter.is_allowed(key, limit, 60))[0] for _ in range(attempts)]
+        )
+
+    # Requests straddling a window edge may be estimated below the limit
+    with patch("core.rate_limiter.shared_memory.time") as mock_time:
+        mock_time.time.return_value = 630.0
+        allowed = asyncio.run(run())
+    limiter.close()
+    return allowed
+
+
+def _hold_lock(path: str, locked, seconds: float):
+    fd = os.open(path, os.O_RDWR)
+    fcntl.lockf(fd, fcntl.LOCK_EX)
+    locked.set()
+    time.sleep(seconds)
+    os.close(fd)
+
+
+class TestSharedMemoryRateLimiter(IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp_dir.name, "rate_limit")
+        self.limiter = SharedMemoryRateLimiter(path=self.path, slots=64)
+
+    def tearDown(self):
+        self.limiter.close()
+        self.tmp_dir.cleanup()
+
+    async def test_basic_rate_limiting(self):
+        for i in range(5):
+            is_allowed, retry_after = await self.limiter.is_allowed("user", 5, 60)
+            self.assertTrue(is_allowed, f"Request {i + 1} should be allowed")
+            self.assertIsNone(retry_after)
+
+        is_allowed, retry_after = await self.limiter.is_allowed("user", 5, 60)
+        self.assertFalse(is_allowed)
+        self.assertGreater(retry_after, 0)
+        self.assertLessEqual(retry_after, 120)
+
+    async def test_get_remaining_and_reset(self):
+        self.assertEqual(await self.limiter.get_remaining("user", 3), 3)
+        await self.limiter.is_allowed("user", 3, 60)
+        await self.limiter.is_allowed("user", 3, 60)
+        self.assertEqual(await self.limiter.get_remaining("user", 3), 1)
+
+        await self.limiter.reset("user")
+        self.assertEqual(await self.limiter.get_remaining("user", 3), 3)
+
+    async def test_hit_reports_remaining(self):
+        for expected_remaining in [2, 1, 0]:
+            result = await self.limiter.hit("user", 3, 60)
+            self.assertTrue(result.allowed)
+            self.assertEqual(result.remaining, expected_remaining)
+
+        result = await self.limiter.hit("user", 3, 60)
+        self.assertFalse(result.allowed)
+        self.assertEqual(result.remaining, 0)
+        self.assertGreater(self.limiter.stats()["lock_wait_seconds"], 0)
+
+    async def test_different_keys_independent(self):
+        for _ in range(3):
+            await self.limiter.is_allowed("key1", 3, 60)
+
+        is_allowed, _ = await self.limiter.is_allowed("key1", 3, 60)
+        self.assertFalse(is_allowed)
+        is_allowed, _ = await self.limiter.is_allowed("key2", 3, 60)
+        self.assertTrue(is_allowed)
+
+    async def test_state_survives_new_instance(self):
+        for _ in range(2):
+            await self.limiter.is_allowed("user", 2, 60)
+
+        # Same file, e.g. after a worker restart
+        other = SharedMemoryRateLimiter(path=self.path, slots=64)
+        is_allowed, _ = await other.is_allowed("user", 2, 60)
+        other.close()
+        self.assertFalse(is_allowed)
+
+    async def test_full_bucket_reuses_slot(self):
+        # More keys than slots must keep working without errors
+        for i in range(500):
+            is_allowed, _ = await self.limiter.is_allowed(f"key{i}", 1, 60)
+            self.assertTrue(is_allowed)
+
+    async def test_slot_count_mismatch(self):
+        with self.assertRaises(ValueError):
+            SharedMemoryRateLimiter(path=self.path, slots=128)
+
+    async def test_limit_shared_between_processes(self):
+        ctx = multiprocessing.get_context("spawn")
+        with ctx.Pool(4) as pool:
+            results = pool.starmap(
+                _hit_from_process, [(self.path, 64, "shared", 10, 10)] * 4
+            )
+
+        self.assertEqual(sum(results), 10)
+
+    async def test_waiting_for_lock_does_not_block_loop(self):
+        ctx = multiprocessing.get_context("spawn")
+        locked = ctx.Event()
+        holder = ctx.Process(target=_hold_lock, args=(self.path, locked, 0.3))
+        holder.start()
+        ticks = 0
+
+        async def tick():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.01)
+
+        try:
+            self.assertTrue(locked.wait(10))
+            ticker = asyncio.create_task(tick())
+            result = await self.limiter.hit("key", 3, 60)
+            ticker.cancel()
+        finally:
+            holder.join()
+
+        self.assertTrue(result.allowed)
+        self.assertGreater(ticks, 5)
+        self.assertGreater(self.limiter.stats()["lock_wait_seconds"], 0.1)
+
+    async def test_evict_expired(self):
+        with patch("core.rate_limiter.shared_memory.time") as mock_time:
+            mock_time.time.return_value = 600.0
+            await self.limiter.hit("idle", 3, 10)
+            await self.limiter.hit("active", 3, 60)
+
+            mock_time.time.return_value = 630.0
+            evicted = await self.limiter.evict_expired()
+            self.assertEqual(evicted, 1)
+            self.assertEqual(await self.limiter.get_remaining("active", 3), 2)
+            self.assertIsNone(
+                self.limiter._find_slot(
+                    self.limiter._hash_key("idle"), 630.0, create=False
+                )
+            )
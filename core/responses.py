@@ -1,3 +1,4 @@
+import hashlib
 from abc import ABCMeta, abstractmethod
 from typing import Any, Optional, Union
 from fastapi import HTTPException
@@ -24,6 +25,66 @@ class Ok(HttpResponseAbstract):
         return JSONResponse(content=self.data, status_code=200)
 
 
+# Public reads, shared caches may keep them but must revalidate every time
+PUBLIC_CACHE_CONTROL = "public, no-cache"
+
+
+def json_body(data: Any) -> bytes:
+    """
+    serialise data the way JSONResponse does
+    """
+    return JSONResponse(content=data).body
+
+
+def strong_etag(body: bytes) -> str:
+    return f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    If-None-Match uses the weak comparison, W/"x" matches "x"
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return etag in {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+
+
+class CachedOk(HttpResponseAbstract):
+    def __init__(
+        self,
+        body: bytes,
+        etag: str,
+        if_none_match: Optional[str] = None,
+        cache_control: str = PUBLIC_CACHE_CONTROL,
+    ) -> None:
+        """
+        body: serialised json, see json_body
+        etag: strong etag of body, see strong_etag
+        if_none_match: If-None-Match header of the request
+        status_code: 200, or 304 without a body when if_none_match matches etag
+        """
+        self.body = body
+        self.etag = etag
+        self.if_none_match = if_none_match
+        self.cache_control = cache_control
+
+    def response(self) -> Response:
+        """
+        parse class to Response
+        """
+        headers = {"ETag": self.etag, "Cache-Control": self.cache_control}
+        if etag_matches(self.if_none_match, self.etag):
+            return Response(status_code=304, headers=headers)
+        return Response(
+            content=self.body,
+            status_code=200,
+            media_type="application/json",
+            headers=headers,
+        )
+
+
 class Created(HttpResponseAbstract):
     def __init__(self, data: Optional[Any]) -> None:
         if data is not None:
@@ -1,20 +1,23 @@
+import uuid
 from datetime import datetime, timedelta
 from typing import Optional, Tuple
 
-import bcrypt
 import jwt
 import pytz
-from fastapi import Depends
+from fastapi import Depends, Request
 from fastapi.security import OAuth2PasswordBearer
 from pytz import timezone
-from sqlalchemy import delete, or_, select
+from sqlalchemy import delete, lambda_stmt, select
 from sqlalchemy.orm import Session
 from sqlalchemy.orm import Session as SQLAlchemySession
 
 from models import get_db_sync
 from models.RefreshToken import RefreshToken
-from models.Token import Token
+from models.Token import Token, hash_token
 from models.User import User
+from core.password_hasher import password_hasher
+from core.token_cache import decode_token
+from core.user_cache import UserPrincipal, user_principal_cache
 from schemas.auth import AuthorizationStatusEnum
 from settings import (
     ACCESS_TOKEN_EXPIRE_MINUTES,
@@ -28,15 +31,25 @@ oauth2_scheme = OAuth2PasswordBearer(tokenUrl="auth/token/", auto_error=False)
 
 
 def generate_hash_password(password: str) -> str:
-    hash = bcrypt.hashpw(str.encode(password), bcrypt.gensalt())
-    return hash.decode()
+    return password_hasher.hash(password)
 
 
 def validated_password(hash: str, password: str) -> bool:
-    try:
-        return bcrypt.checkpw(password.encode(), hash.encode())
-    except Exception:
-        return False
+    return password_hasher.verify(hash, password)
+
+
+async def generate_hash_password_async(password: str) -> str:
+    """generate_hash_password without blocking the event loop"""
+    return await password_hasher.hash_async(password)
+
+
+async def validated_password_async(hash: str, password: str) -> bool:
+    """validated_password without blocking the event loop"""
+    return await password_hasher.verify_async(hash, password)
+
+
+def password_needs_rehash(hash: str) -> bool:
+    return password_hasher.needs_rehash(hash)
 
 
 async def generate_token_from_user(
@@ -56,6 +69,8 @@ async def generate_token_from_user(
         "id": str(user.id),
         "username": user.username,
         "exp": expire,
+        # Tokens are unique by hash, also when issued twice within a second
+        "jti": uuid.uuid4().hex,
     }
     token = jwt.encode(payload, SECRET_KEY, algorithm=ALGORITHM)
     new_token = Token(user=user, token=token, expired_at=expire)
@@ -80,16 +95,24 @@ async def generate_token_from_user(
     return (token, refresh_token)
 
 
-def get_user_from_token(db: SQLAlchemySession, token: str) -> Optional[User]:
+def get_user_from_token(
+    db: SQLAlchemySession, token: Optional[str], request: Optional[Request] = None
+) -> Optional[User]:
+    # oauth2_scheme passes None without an Authorization header
+    if token is None:
+        return None
     now = datetime.now().astimezone(pytz.timezone(TZ))
     try:
-        payload = jwt.decode(jwt=token, key=SECRET_KEY, algorithms=[ALGORITHM])
+        payload = decode_token(token, request)
         id = payload.get("id")
     except Exception:
         invalidate_token(db=db, token=token)
         return None
 
-    stmt = select(Token).where(Token.token == token, Token.user_id == id)
+    token_hash = hash_token(token)
+    stmt = lambda_stmt(
+        lambda: select(Token).where(Token.token_hash == token_hash, Token.user_id == id)
+    )
     session = db.execute(stmt).scalar()
     if session is None:
         return None
@@ -100,26 +123,98 @@ def get_user_from_token(db: SQLAlchemySession, token: str) -> Optional[User]:
     return session.user
 
 
+def _principal_stmt(token: str, user_id: str):
+    # The token lookup of every authenticated request, built and compiled
+    # once, later calls only bind the hash and user id
+    token_hash = hash_token(token)
+    return lambda_stmt(
+        lambda: select(
+            Token.expired_at,
+            User.id,
+            User.username,
+            User.participant_type,
+            User.email,
+        )
+        .join(User, Token.user_id == User.id)
+        .where(Token.token_hash == token_hash, Token.user_id == user_id)
+    )
+
+
+def _cache_principal(token: str, row) -> UserPrincipal:
+    principal = UserPrincipal(
+        id=row.id,
+        username=row.username,
+        participant_type=row.participant_type,
+        email=row.email,
+    )
+    user_principal_cache.put(token, principal, row.expired_at)
+    return principal
+
+
+def get_principal_from_token(
+    db: SQLAlchemySession, token: Optional[str], request: Optional[Request] = None
+) -> Optional[UserPrincipal]:
+    """
+    Like get_user_from_token, but only loads the fields of UserPrincipal
+
+    Cached per token (see core.user_cache), so repeated requests with the
+    same token need no query at all.
+    """
+    if token is None:
+        return None
+    principal = user_principal_cache.get(token)
+    if principal is not None:
+        return principal
+
+    now = datetime.now().astimezone(pytz.timezone(TZ))
+    try:
+        payload = decode_token(token, request)
+        id = payload.get("id")
+    except Exception:
+        invalidate_token(db=db, token=token)
+        return None
+
+    row = db.execute(_principal_stmt(token, id)).first()
+    if row is None:
+        return None
+    if row.expired_at <= now:
+        invalidate_token(db=db, token=token)
+        return None
+
+    return _cache_principal(token, row)
+
+
 def get_current_user(
-    db: Session = Depends(get_db_sync), token: str = Depends(oauth2_scheme)
+    request: Request,
+    db: Session = Depends(get_db_sync),
+    token: str = Depends(oauth2_scheme),
 ) -> Optional[User]:
-    return get_user_from_token(db, token)
+    return get_user_from_token(db, token, request)
+
+
+def get_current_principal(
+    request: Request,
+    db: Session = Depends(get_db_sync),
+    token: str = Depends(oauth2_scheme),
+) -> Optional[UserPrincipal]:
+    return get_principal_from_token(db, token, request)
 
 
 def invalidate_token(db: SQLAlchemySession, token: str):
-    # clear all expired token and selected_token
-    now = datetime.now().astimezone(pytz.timezone(TZ))
-    stmt = delete(Token).where(or_(Token.expired_at <= now, Token.token == token))
-    db.execute(stmt)
+    # Only the presented token, other expired tokens are deleted in the
+    # background (see core.token_reaper)
+    db.execute(delete(Token).where(Token.token_hash == hash_token(token)))
     db.commit()
+    # Bulk deletes skip the ORM events that keep the cache in sync
+    user_principal_cache.discard(token)
 
 
 def check_permissions(
-    current_user: User | None, required_participant_type: str
+    current_user: User | UserPrincipal | None, required_participant_type: str
 ) -> AuthorizationStatusEnum:
     """Check if the current user has the required permissions.
     Args:
-        current_user (User | None): The current authenticated user.
+        current_user (User | UserPrincipal | None): The current authenticated user.
         required_participant_type (str): The required participant type for access.
     Returns:
         AuthorizationStatusEnum: The authorization status.
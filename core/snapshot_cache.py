@@ -0,0 +1,202 @@
+import threading
+import time
+from collections import OrderedDict
+from itertools import chain
+from typing import Callable, Hashable, NamedTuple, Optional, Union
+
+from fastapi import Request, Response
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+
+from core.responses import CachedOk, common_response, strong_etag
+from models.City import City
+from models.Country import Country
+from models.Organizer import Organizer
+from models.OrganizerType import OrganizerType
+from models.Room import Room
+from models.Schedule import Schedule
+from models.ScheduleType import ScheduleType
+from models.Speaker import Speaker
+from models.SpeakerType import SpeakerType
+from models.State import State
+from models.Ticket import Ticket
+from models.User import User
+from models.Volunteer import Volunteer
+from settings import SNAPSHOT_CACHE_SIZE, SNAPSHOT_CACHE_TTL
+
+
+class Snapshot(NamedTuple):
+    body: bytes
+    etag: str
+
+
+class SnapshotCache:
+    """
+    Serialised public responses, per query, bounded LRU
+
+    Every entry is tagged with the `version` read before its query ran.
+    Committing a change to one of `models` bumps the version, which makes
+    older entries misses, so a hit never touches the database. Other
+    workers don't see the bump, `ttl` bounds how stale their entries get.
+    Entries carry the ETag of their body, a conditional request that hits
+    is answered without querying or serialising anything.
+    """
+
+    def __init__(self, models: tuple[type, ...], max_size: int = 256, ttl: float = 30):
+        self.models = models
+        self.max_size = max_size
+        self.ttl = ttl
+        self.version = 0
+        self._entries: OrderedDict[Hashable, tuple[int, float, Snapshot]] = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+        _caches.append(self)
+
+    def get(self, key: Hashable) -> Optional[Snapshot]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            version, expires_at, snapshot = entry
+            if version != self.version or expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return snapshot
+
+    def put(self, key: Hashable, version: int, body: bytes) -> Snapshot:
+        """Store `body`, built from data read at `version`"""
+        snapshot = Snapshot(body=body, etag=strong_etag(body))
+        with self._lock:
+            if version != self.version:
+                # Changed while the query ran, the body may be stale already
+                return snapshot
+            self._entries[key] = (version, time.monotonic() + self.ttl, snapshot)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+        return snapshot
+
+    def bump(self) -> None:
+        with self._lock:
+            self.version += 1
+            self._entries.clear()
+
+    def clear(self) -> None:
+        self.bump()
+
+
+_caches: list[SnapshotCache] = []
+
+
+def clear_snapshots() -> None:
+    """Drop every snapshot, e.g. of rows a rolled back test added"""
+    for cache in _caches:
+        cache.clear()
+
+
+def cached_response(
+    cache: SnapshotCache,
+    key: Hashable,
+    request: Request,
+    build: Callable[[], Union[bytes, Response]],
+) -> Response:
+    """
+    The snapshot under `key`, 304 when it matches If-None-Match
+
+    On a miss `build` runs the query and returns the serialised body. A
+    response it returns instead, e.g. an error, is sent as is and not cached.
+    """
+    snapshot = cache.get(key)
+    if snapshot is None:
+        version = cache.version
+        body = build()
+        if not isinstance(body, bytes):
+            return body
+        snapshot = cache.put(key, version, body)
+    return common_response(
+        CachedOk(snapshot.body, snapshot.etag, request.headers.get("if-none-match"))
+    )
+
+
+# One cache per public endpoint group, with the models shown in its responses
+schedule_snapshot = SnapshotCache(
+    (Schedule, Speaker, SpeakerType, User, Room, ScheduleType),
+    max_size=SNAPSHOT_CACHE_SIZE,
+    ttl=SNAPSHOT_CACHE_TTL,
+)
+speaker_snapshot = SnapshotCache(
+    (Speaker, SpeakerType, User), max_size=SNAPSHOT_CACHE_SIZE, ttl=SNAPSHOT_CACHE_TTL
+)
+organizer_snapshot = SnapshotCache(
+    (Organizer, OrganizerType, User),
+    max_size=SNAPSHOT_CACHE_SIZE,
+    ttl=SNAPSHOT_CACHE_TTL,
+)
+volunteer_snapshot = SnapshotCache(
+    (Volunteer, User), max_size=SNAPSHOT_CACHE_SIZE, ttl=SNAPSHOT_CACHE_TTL
+)
+ticket_snapshot = SnapshotCache(
+    (Ticket,), max_size=SNAPSHOT_CACHE_SIZE, ttl=SNAPSHOT_CACHE_TTL
+)
+location_snapshot = SnapshotCache(
+    (Country, State, City), max_size=SNAPSHOT_CACHE_SIZE, ttl=SNAPSHOT_CACHE_TTL
+)
+
+
+# User columns the public responses show or search, logins, check-ins and
+# private profile fields don't change any snapshot
+PUBLIC_USER_ATTRS = (
+    "username",
+    "first_name",
+    "last_name",
+    "email",
+    "bio",
+    "company",
+    "job_category",
+    "job_title",
+    "profile_picture",
+    "website",
+    "facebook_username",
+    "linkedin_username",
+    "twitter_username",
+    "instagram_username",
+    "share_my_email_and_phone_number",
+    "share_my_job_and_company",
+    "share_my_public_social_media",
+)
+
+
+def _changes_snapshot(session: Session, instance) -> bool:
+    if not isinstance(instance, User) or instance in session.deleted:
+        return True
+    if instance in session.new:
+        # Shown once a speaker, organizer or volunteer points at it, which
+        # is a change of its own
+        return False
+    attrs = inspect(instance).attrs
+    return any(attrs[name].history.has_changes() for name in PUBLIC_USER_ATTRS)
+
+
+@event.listens_for(Session, "after_flush")
+def _mark_snapshot_change(session: Session, flush_context) -> None:
+    # new, dirty and deleted and the attribute history still hold what was
+    # just flushed
+    session.info.setdefault("snapshot_changes", set()).update(
+        type(instance)
+        for instance in chain(session.new, session.dirty, session.deleted)
+        if _changes_snapshot(session, instance)
+    )
+
+
+@event.listens_for(Session, "after_commit")
+def _bump_snapshot_versions(session: Session) -> None:
+    # Bumped after commit, a read between flush and commit would otherwise
+    # cache the old rows under the new version
+    changed = session.info.pop("snapshot_changes", None)
+    if not changed:
+        return
+    for cache in _caches:
+        if any(issubclass(model, cache.models) for model in changed):
+            cache.bump()
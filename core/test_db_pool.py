@@ -0,0 +1,124 @@
+import threading
+import time
+from unittest import TestCase
+from unittest.mock import patch
+
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, exc, text
+
+from core.db_pool import InstrumentedQueuePool, PoolMetrics, instrument
+from main import app
+from models import DATABASE_URL, engine
+from settings import DB_MAX_OVERFLOW, DB_POOL_SIZE
+
+
+class TestInstrumentedPool(TestCase):
+    def setUp(self):
+        self.engine = create_engine(
+            DATABASE_URL,
+            poolclass=InstrumentedQueuePool,
+            pool_size=1,
+            max_overflow=0,
+            pool_timeout=0.2,
+        )
+        self.metrics = instrument(self.engine)
+
+    def tearDown(self):
+        self.engine.dispose()
+
+    def test_counts_checkouts_and_wait_times(self):
+        for _ in range(3):
+            with self.engine.connect() as connection:
+                connection.execute(text("SELECT 1"))
+
+        snapshot = self.metrics.snapshot(self.engine.pool)
+        self.assertEqual(snapshot["checkouts"], 3)
+        self.assertEqual(snapshot["checked_out"], 0)
+        self.assertEqual(sum(snapshot["wait_histogram"].values()), 3)
+        self.assertFalse(snapshot["saturated"])
+
+    def test_saturation_and_timeouts(self):
+        with self.engine.connect():
+            snapshot = self.metrics.snapshot(self.engine.pool)
+            self.assertEqual(snapshot["checked_out"], 1)
+            self.assertTrue(snapshot["saturated"])
+
+            with self.assertRaises(exc.TimeoutError):
+                self.engine.connect()
+
+        snapshot = self.metrics.snapshot(self.engine.pool)
+        self.assertEqual(snapshot["timeouts"], 1)
+        self.assertEqual(snapshot["waiting"], 0)
+        self.assertLess(snapshot["seconds_since_timeout"], 1)
+
+    def test_unlimited_overflow_has_no_capacity(self):
+        engine = create_engine(
+            DATABASE_URL, poolclass=InstrumentedQueuePool, pool_size=1, max_overflow=-1
+        )
+        metrics = instrument(engine)
+        try:
+            with engine.connect(), engine.connect():
+                snapshot = metrics.snapshot(engine.pool)
+        finally:
+            engine.dispose()
+
+        self.assertIsNone(snapshot["capacity"])
+        self.assertEqual(snapshot["checked_out"], 2)
+        self.assertFalse(snapshot["saturated"])
+
+    def test_waiting_requests_are_counted(self):
+        released = threading.Event()
+        with self.engine.connect():
+            waiter = threading.Thread(
+                target=lambda: self.engine.connect().close() or released.set()
+            )
+            self.engine.pool._timeout = 5
+            waiter.start()
+            deadline = time.monotonic() + 5
+            while self.metrics.waiting == 0 and time.monotonic() < deadline:
+                time.sleep(0.001)
+            self.assertEqual(self.metrics.snapshot(self.engine.pool)["waiting"], 1)
+
+        waiter.join()
+        self.assertTrue(released.is_set())
+        self.assertEqual(self.metrics.snapshot(self.engine.pool)["waiting"], 0)
+
+    def test_metrics_survive_dispose(self):
+        self.engine.dispose()
+        with self.engine.connect():
+            pass
+        self.assertEqual(self.metrics.snapshot(self.engine.pool)["checkouts"], 1)
+
+
+class TestReadiness(TestCase):
+    def test_ready(self):
+        response = TestClient(app).get("/health/ready")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["status"], "ok")
+        self.assertEqual(
+            response.json()["pools"]["sync"]["capacity"],
+            DB_POOL_SIZE + DB_MAX_OVERFLOW,
+        )
+
+    def test_saturated_pool_is_ready(self):
+        capacity = DB_POOL_SIZE + DB_MAX_OVERFLOW
+        connections = [engine.connect() for _ in range(capacity)]
+        try:
+            response = TestClient(app).get("/health/ready")
+        finally:
+            for connection in connections:
+                connection.close()
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.json()["pools"]["sync"]["saturated"])
+
+    def test_not_ready_after_timeout(self):
+        metrics = PoolMetrics()
+        with patch("main.pool_metrics", metrics):
+            metrics.start_wait()
+            metrics.fail_wait(timed_out=True)
+            response = TestClient(app).get("/health/ready")
+
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(response.json()["status"], "timing_out")
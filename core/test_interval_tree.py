@@ -0,0 +1,37 @@
+import random
+from unittest import TestCase
+
+from core.interval_tree import IntervalTree
+
+
+class TestIntervalTree(TestCase):
+    def test_half_open_overlaps(self):
+        tree = IntervalTree([(10, 20, "a"), (20, 30, "b"), (5, 40, "c")])
+
+        self.assertEqual(tree.overlapping(15, 25), ["c", "a", "b"])
+        # Touching ends don't overlap
+        self.assertEqual(tree.overlapping(0, 10), ["c"])
+        self.assertEqual(tree.overlapping(30, 35), ["c"])
+        self.assertEqual(tree.overlapping(40, 50), [])
+
+    def test_empty_intervals_overlap_nothing(self):
+        tree = IntervalTree([(10, 10, "empty"), (20, 10, "reversed"), (0, 30, "a")])
+
+        self.assertEqual(len(tree), 1)
+        self.assertEqual(tree.overlapping(5, 15), ["a"])
+        self.assertEqual(tree.overlapping(15, 15), [])
+        self.assertEqual(IntervalTree([]).overlapping(0, 10), [])
+
+    def test_matches_scan(self):
+        rng = random.Random(25)
+        intervals = []
+        for i in range(500):
+            start = rng.randrange(0, 10_000)
+            intervals.append((start, start + rng.randrange(1, 300), i))
+        tree = IntervalTree(intervals)
+
+        for _ in range(200):
+            start = rng.randrange(-100, 10_100)
+            end = start + rng.randrange(1, 500)
+            expected = sorted((s, i) for s, e, i in intervals if s < end and start < e)
+            self.assertEqual(tree.overlapping(start, end), [i for _, i in expected])
@@ -0,0 +1,23 @@
+import subprocess
+import sys
+from unittest import TestCase
+
+from scripts.benchmark_import_time import LAZY_MODULES
+
+
+class TestLazyImports(TestCase):
+    def test_import_main_skips_lazy_modules(self):
+        # A new interpreter, this one may have imported them already
+        result = subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                "import sys, main; "
+                f"print(','.join(m for m in {LAZY_MODULES!r} if m in sys.modules))",
+            ],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+
+        self.assertEqual(result.stdout.strip(), "")
@@ -0,0 +1,103 @@
+import asyncio
+import time
+from unittest import IsolatedAsyncioTestCase, TestCase
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from core.loop_monitor import LoopLagMonitor, assert_no_blocking, current_route
+from core.security import get_current_principal
+from core.user_cache import UserPrincipal
+from models.User import MANAGEMENT_PARTICIPANT, VOLUNTEER_PARTICIPANT
+
+
+def blocking_function(seconds: float) -> None:
+    time.sleep(seconds)
+
+
+class TestLoopLagMonitor(IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.monitor = LoopLagMonitor(threshold=0.2, interval=0.01)
+        self.monitor.start()
+
+    async def asyncTearDown(self):
+        await self.monitor.stop()
+
+    async def test_records_lag_percentiles(self):
+        await asyncio.sleep(0.1)
+
+        stats = self.monitor.stats()
+        self.assertGreater(stats["samples"], 0)
+        self.assertEqual(set(stats["lag_ms"]), {"p50", "p95", "p99", "max"})
+        self.assertEqual(stats["blocked_count"], 0)
+
+    async def test_reports_route_and_stack_of_blocking_call(self):
+        async def handler():
+            current_route.set("GET /slow/")
+            await asyncio.sleep(0.02)
+            blocking_function(0.5)
+
+        await asyncio.create_task(handler())
+        # Let the probe see the end of the stall
+        await asyncio.sleep(0.1)
+
+        stats = self.monitor.stats()
+        self.assertEqual(stats["blocked_count"], 1)
+        report = stats["blocked"][0]
+        self.assertEqual(report["route"], "GET /slow/")
+        self.assertIn("blocking_function", report["stack"])
+        self.assertGreaterEqual(report["duration_ms"], 400)
+        self.assertGreaterEqual(stats["lag_ms"]["max"], 400)
+
+
+class TestAssertNoBlocking(TestCase):
+    def setUp(self):
+        self.app = FastAPI()
+
+        @self.app.get("/slow/")
+        async def slow():
+            blocking_function(0.6)
+            return {}
+
+        @self.app.get("/fast/")
+        async def fast():
+            await asyncio.sleep(0.1)
+            return {}
+
+    def test_passes_when_nothing_blocks(self):
+        with assert_no_blocking(self.app, threshold=0.25) as client:
+            self.assertEqual(client.get("/fast/").status_code, 200)
+
+    def test_fails_when_handler_blocks(self):
+        with self.assertRaises(AssertionError) as raised:
+            with assert_no_blocking(self.app, threshold=0.25) as client:
+                client.get("/slow/")
+
+        self.assertIn("GET /slow/", str(raised.exception))
+        self.assertIn("blocking_function", str(raised.exception))
+
+
+class TestEventLoopMetricsEndpoint(TestCase):
+    def setUp(self):
+        from main import app
+
+        self.app = app
+        self.client = TestClient(app)
+
+    def tearDown(self):
+        self.app.dependency_overrides.pop(get_current_principal, None)
+
+    def get_as(self, participant_type):
+        principal = participant_type and UserPrincipal(
+            id="1", username="user", participant_type=participant_type, email=None
+        )
+        self.app.dependency_overrides[get_current_principal] = lambda: principal
+        return self.client.get("/metrics/event-loop")
+
+    def test_management_only(self):
+        self.assertEqual(self.get_as(None).status_code, 401)
+        self.assertEqual(self.get_as(VOLUNTEER_PARTICIPANT).status_code, 403)
+
+        response = self.get_as(MANAGEMENT_PARTICIPANT)
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("blocked", response.json())
@@ -0,0 +1,88 @@
+import asyncio
+import time
+from unittest import IsolatedAsyncioTestCase, TestCase
+
+from fastapi.testclient import TestClient
+
+from core.password_hasher import PasswordHasher
+from core.security import get_current_principal
+from core.user_cache import UserPrincipal
+from models.User import MANAGEMENT_PARTICIPANT, VOLUNTEER_PARTICIPANT
+
+
+class TestPasswordHasher(IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.hasher = PasswordHasher(rounds=4, max_threads=1)
+
+    def test_hash_and_verify(self):
+        hash = self.hasher.hash("password")
+        self.assertTrue(self.hasher.verify(hash, "password"))
+        self.assertFalse(self.hasher.verify(hash, "wrong"))
+        self.assertFalse(self.hasher.verify("not a hash", "password"))
+
+    def test_needs_rehash_when_rounds_change(self):
+        hash = self.hasher.hash("password")
+        self.assertFalse(self.hasher.needs_rehash(hash))
+        self.assertTrue(PasswordHasher(rounds=5).needs_rehash(hash))
+        self.assertFalse(self.hasher.needs_rehash("not a hash"))
+
+    async def test_async_does_not_block_event_loop(self):
+        hasher = PasswordHasher(rounds=12, max_threads=1)
+        ticks = 0
+
+        async def tick():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.005)
+
+        ticker = asyncio.create_task(tick())
+        start = time.perf_counter()
+        hash = await hasher.hash_async("password")
+        elapsed = time.perf_counter() - start
+        ticker.cancel()
+
+        self.assertTrue(await hasher.verify_async(hash, "password"))
+        # The loop kept running while the hash was computed
+        self.assertGreater(ticks, elapsed / 0.005 / 4)
+
+    async def test_concurrency_is_capped_and_queue_time_recorded(self):
+        hash = self.hasher.hash("password")
+
+        results = await asyncio.gather(
+            *(self.hasher.verify_async(hash, "password") for _ in range(3))
+        )
+
+        self.assertEqual(results, [True, True, True])
+        stats = self.hasher.stats()
+        self.assertEqual(stats["calls"], 3)
+        self.assertEqual(stats["waiting"], 0)
+        # One thread, so the later calls waited for the earlier ones
+        self.assertGreater(stats["max_queue_seconds"], 0)
+        self.assertGreater(stats["queue_seconds"], stats["hash_seconds"] / 3)
+
+
+class TestPasswordHasherMetricsEndpoint(TestCase):
+    def setUp(self):
+        from main import app
+
+        self.app = app
+        self.client = TestClient(app)
+
+    def tearDown(self):
+        self.app.dependency_overrides.pop(get_current_principal, None)
+
+    def get_as(self, participant_type):
+        principal = participant_type and UserPrincipal(
+            id="1", username="user", participant_type=participant_type, email=None
+        )
+        self.app.dependency_overrides[get_current_principal] = lambda: principal
+        return self.client.get("/metrics/password-hasher")
+
+    def test_management_only(self):
+        self.assertEqual(self.get_as(None).status_code, 401)
+        self.assertEqual(self.get_as(VOLUNTEER_PARTICIPANT).status_code, 403)
+
+        response = self.get_as(MANAGEMENT_PARTICIPANT)
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("max_queue_seconds", response.json())
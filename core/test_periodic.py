@@ -0,0 +1,36 @@
+import asyncio
+from unittest.async_case import IsolatedAsyncioTestCase
+
+from core.periodic import PeriodicTask
+
+
+class TestPeriodicTask(IsolatedAsyncioTestCase):
+    async def test_runs_until_stopped(self):
+        calls = []
+
+        async def func():
+            calls.append(1)
+
+        task = PeriodicTask("test", func, 0.01)
+        task.start()
+        await asyncio.sleep(0.1)
+        await task.stop()
+        runs = len(calls)
+
+        self.assertGreater(runs, 1)
+        await asyncio.sleep(0.05)
+        self.assertEqual(len(calls), runs)
+
+    async def test_keeps_running_after_failure(self):
+        calls = []
+
+        async def func():
+            calls.append(1)
+            raise RuntimeError("boom")
+
+        task = PeriodicTask("test", func, 0.01)
+        task.start()
+        await asyncio.sleep(0.1)
+        await task.stop()
+
+        self.assertGreater(len(calls), 1)
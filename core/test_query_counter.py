@@ -0,0 +1,71 @@
+from unittest import TestCase
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+
+from core.query_counter import (
+    QueryStatsMiddleware,
+    request_queries,
+    statement_shape,
+)
+from models import engine
+from routes.tests.utils import assert_max_queries
+
+
+class TestStatementShape(TestCase):
+    def test_collapses_parameters(self):
+        self.assertEqual(
+            statement_shape(
+                "SELECT id FROM t\n WHERE a = %(a_1)s AND b IN (%(b_1_1)s, %(b_1_2)s)"
+            ),
+            "SELECT id FROM t WHERE a = ? AND b IN (?)",
+        )
+
+
+class TestQueryStatsMiddleware(TestCase):
+    def setUp(self):
+        app = FastAPI()
+        app.add_middleware(QueryStatsMiddleware, repeat_threshold=3)
+
+        @app.get("/queries/{count}")
+        def run_queries(count: int):
+            with engine.connect() as connection:
+                for i in range(count):
+                    connection.execute(text("SELECT :i"), {"i": i})
+            return {}
+
+        self.client = TestClient(app)
+
+    def tearDown(self):
+        request_queries.remove()
+
+    def test_server_timing(self):
+        response = self.client.get("/queries/2")
+
+        self.assertRegex(
+            response.headers["Server-Timing"], r'^db;dur=[\d.]+;desc="2 queries"$'
+        )
+
+    def test_logs_repeated_statements(self):
+        with self.assertLogs("uvicorn.error", level="WARNING") as logs:
+            self.client.get("/queries/3")
+
+        self.assertIn("GET /queries/3 ran 3x, likely N+1: SELECT ?", logs.output[0])
+
+
+class TestAssertMaxQueries(TestCase):
+    def test_within_budget(self):
+        with engine.connect() as connection:
+            with assert_max_queries(2, connection) as stats:
+                connection.execute(text("SELECT 1"))
+                connection.execute(text("SELECT 1"))
+
+        self.assertEqual(stats.count, 2)
+
+    def test_over_budget(self):
+        with engine.connect() as connection:
+            with self.assertRaisesRegex(AssertionError, "2 queries.*\n2x SELECT 1"):
+                with assert_max_queries(1, connection):
+                    connection.execute(text("SELECT 1"))
+                    connection.execute(text("SELECT 1"))
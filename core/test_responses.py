@@ -0,0 +1,29 @@
+from unittest import TestCase
+
+from core.responses import CachedOk, etag_matches, json_body, strong_etag
+
+
+class TestCachedOk(TestCase):
+    def test_etag_matches(self):
+        etag = strong_etag(b"[]")
+
+        self.assertTrue(etag_matches(etag, etag))
+        self.assertTrue(etag_matches(f'"other", W/{etag}', etag))
+        self.assertTrue(etag_matches("*", etag))
+        self.assertFalse(etag_matches(None, etag))
+        self.assertFalse(etag_matches('"other"', etag))
+
+    def test_response(self):
+        body = json_body({"results": []})
+        etag = strong_etag(body)
+
+        ok = CachedOk(body, etag).response()
+        not_modified = CachedOk(body, etag, if_none_match=etag).response()
+
+        self.assertEqual(ok.status_code, 200)
+        self.assertEqual(ok.body, b'{"results":[]}')
+        self.assertEqual(ok.headers["ETag"], etag)
+        self.assertEqual(ok.headers["Cache-Control"], "public, no-cache")
+        self.assertEqual(not_modified.status_code, 304)
+        self.assertEqual(not_modified.body, b"")
+        self.assertEqual(not_modified.headers["ETag"], etag)
@@ -0,0 +1,124 @@
+from unittest import TestCase
+from unittest.mock import patch
+
+import alembic.config
+
+from core.responses import strong_etag
+from core.snapshot_cache import (
+    SnapshotCache,
+    schedule_snapshot,
+    speaker_snapshot,
+    ticket_snapshot,
+)
+from models import db, engine
+from models.Room import Room
+from models.Ticket import Ticket
+from models.User import User
+
+
+class TestSnapshotCache(TestCase):
+    def test_put_tags_body_with_etag(self):
+        cache = SnapshotCache((Room,))
+
+        snapshot = cache.put("key", cache.version, b"[]")
+
+        self.assertEqual(snapshot.etag, strong_etag(b"[]"))
+        self.assertEqual(cache.get("key"), snapshot)
+
+    def test_bump_invalidates(self):
+        cache = SnapshotCache((Room,))
+        cache.put("key", cache.version, b"[]")
+        self.assertEqual(cache.get("key").body, b"[]")
+
+        cache.bump()
+
+        self.assertIsNone(cache.get("key"))
+
+    def test_put_read_before_bump_is_ignored(self):
+        cache = SnapshotCache((Room,))
+        version = cache.version
+        cache.bump()
+
+        snapshot = cache.put("key", version, b"[]")
+
+        self.assertEqual(snapshot.body, b"[]")
+        self.assertIsNone(cache.get("key"))
+
+    def test_expires_after_ttl(self):
+        cache = SnapshotCache((Room,), ttl=30)
+        with patch("core.snapshot_cache.time") as mock_time:
+            mock_time.monotonic.return_value = 100.0
+            cache.put("key", cache.version, b"[]")
+
+            mock_time.monotonic.return_value = 129.0
+            self.assertEqual(cache.get("key").body, b"[]")
+            mock_time.monotonic.return_value = 130.0
+            self.assertIsNone(cache.get("key"))
+
+    def test_bounded(self):
+        cache = SnapshotCache((Room,), max_size=2)
+        for key in ["a", "b", "c"]:
+            cache.put(key, cache.version, b"[]")
+
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(cache.get("c").body, b"[]")
+
+
+class TestSnapshotInvalidation(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        alembic.config.main(argv=["upgrade", "head"])
+
+    def setUp(self):
+        self.connection = engine.connect()
+        self.trans = self.connection.begin()
+        self.db = db(bind=self.connection, join_transaction_mode="create_savepoint")
+
+    def tearDown(self):
+        self.db.close()
+        self.trans.rollback()
+        self.connection.close()
+
+    def test_commit_bumps_version(self):
+        version = schedule_snapshot.version
+        self.db.add(Room(name="Snapshot Hall"))
+        self.db.flush()
+        self.assertEqual(schedule_snapshot.version, version)
+
+        self.db.commit()
+
+        self.assertGreater(schedule_snapshot.version, version)
+
+    def test_unrelated_commit_keeps_version(self):
+        version = schedule_snapshot.version
+        ticket_version = ticket_snapshot.version
+        self.db.add(
+            Ticket(
+                name="Snapshot Ticket",
+                price=1,
+                user_participant_type="In Person",
+                is_sold_out=False,
+                is_active=True,
+            )
+        )
+
+        self.db.commit()
+
+        self.assertEqual(schedule_snapshot.version, version)
+        self.assertGreater(ticket_snapshot.version, ticket_version)
+
+    def test_only_public_user_changes_bump_version(self):
+        version = speaker_snapshot.version
+        user = User(username="snapshot_user", first_name="Snapshot")
+        self.db.add(user)
+        self.db.commit()
+        self.assertEqual(speaker_snapshot.version, version)
+
+        user.password = "rehashed"
+        user.t_shirt_size = "L"
+        self.db.commit()
+        self.assertEqual(speaker_snapshot.version, version)
+
+        user.first_name = "Renamed"
+        self.db.commit()
+        self.assertGreater(speaker_snapshot.version, version)
@@ -0,0 +1,89 @@
+import time
+from unittest import TestCase
+from unittest.mock import patch
+
+import jwt
+from fastapi import Request
+
+from core.rate_limiter.key_builder import RateLimitKeyBuilder
+from core.token_cache import VerifiedTokenCache, decode_token, verified_token_cache
+from settings import ALGORITHM, SECRET_KEY
+
+
+class TestVerifiedTokenCache(TestCase):
+    def test_expires_at_token_exp(self):
+        cache = VerifiedTokenCache(max_size=10, max_ttl=300)
+        with patch("core.token_cache.time") as mock_time:
+            mock_time.time.return_value = 1000.0
+            cache.put("token", {"id": "1", "exp": 1010})
+
+            mock_time.time.return_value = 1009.0
+            self.assertEqual(cache.get("token"), {"id": "1", "exp": 1010})
+            mock_time.time.return_value = 1010.0
+            self.assertIsNone(cache.get("token"))
+
+    def test_max_ttl_without_exp(self):
+        cache = VerifiedTokenCache(max_size=10, max_ttl=60)
+        with patch("core.token_cache.time") as mock_time:
+            mock_time.time.return_value = 1000.0
+            cache.put("token", {"id": "1"})
+
+            mock_time.time.return_value = 1059.0
+            self.assertIsNotNone(cache.get("token"))
+            mock_time.time.return_value = 1060.0
+            self.assertIsNone(cache.get("token"))
+
+    def test_bounded_least_recently_used(self):
+        cache = VerifiedTokenCache(max_size=2, max_ttl=60)
+        cache.put("a", {"id": "a"})
+        cache.put("b", {"id": "b"})
+        cache.get("a")
+        cache.put("c", {"id": "c"})
+
+        self.assertIsNotNone(cache.get("a"))
+        self.assertIsNone(cache.get("b"))
+        self.assertIsNotNone(cache.get("c"))
+
+
+class TestDecodeToken(TestCase):
+    def setUp(self):
+        verified_token_cache.clear()
+        self.token = jwt.encode(
+            {"id": "42", "exp": int(time.time()) + 600}, SECRET_KEY, algorithm=ALGORITHM
+        )
+
+    def create_request(self) -> Request:
+        return Request(
+            {
+                "type": "http",
+                "method": "GET",
+                "path": "/",
+                "headers": [(b"authorization", f"Bearer {self.token}".encode())],
+                "client": ("10.0.0.1", 1234),
+            }
+        )
+
+    def test_verified_once_per_token(self):
+        with patch("core.token_cache.jwt.decode", wraps=jwt.decode) as decode:
+            for _ in range(3):
+                self.assertEqual(decode_token(self.token)["id"], "42")
+
+        decode.assert_called_once()
+
+    def test_shared_on_request_scope(self):
+        request = self.create_request()
+        with patch("core.token_cache.jwt.decode", wraps=jwt.decode) as decode:
+            key = RateLimitKeyBuilder.build_key(request, use_fingerprint=False)
+            # Even when the process wide cache was cleared in between
+            verified_token_cache.clear()
+            claims = decode_token(self.token, request)
+
+        self.assertEqual(key, "user:42")
+        self.assertEqual(claims["id"], "42")
+        decode.assert_called_once()
+
+    def test_invalid_token_not_cached(self):
+        with self.assertRaises(jwt.PyJWTError):
+            decode_token("invalid")
+        with self.assertRaises(jwt.PyJWTError):
+            decode_token("invalid")
@@ -0,0 +1,117 @@
+import uuid
+from datetime import datetime, timedelta, timezone
+from unittest import IsolatedAsyncioTestCase
+
+import alembic.config
+from sqlalchemy import select
+
+from core.security import invalidate_token
+from core.token_reaper import ExpiredRowReaper
+from models import db, engine
+from models.EmailVerification import EmailVerification
+from models.RefreshToken import RefreshToken
+from models.ResetPassword import ResetPassword
+from models.Token import Token
+from models.User import User
+
+
+class TestExpiredRowReaper(IsolatedAsyncioTestCase):
+    @classmethod
+    def setUpClass(cls):
+        alembic_args = ["upgrade", "head"]
+        alembic.config.main(argv=alembic_args)
+
+    def setUp(self):
+        self.connection = engine.connect()
+        self.trans = self.connection.begin()
+        self.session = self.create_session()
+        self.user = User(username="reaper")
+        self.session.add(self.user)
+        self.session.commit()
+        self.now = datetime.now(timezone.utc)
+
+    def tearDown(self):
+        self.session.close()
+        self.trans.rollback()
+        self.connection.close()
+
+    def create_session(self):
+        return db(bind=self.connection, join_transaction_mode="create_savepoint")
+
+    def add_token(self, expired_at: datetime) -> Token:
+        token = Token(
+            user_id=self.user.id, token=str(uuid.uuid4()), expired_at=expired_at
+        )
+        self.session.add(token)
+        self.session.flush()
+        self.session.add(
+            RefreshToken(
+                user_id=self.user.id,
+                refresh_token=str(uuid.uuid4()),
+                token_id=token.id,
+                expired_at=expired_at + timedelta(days=1),
+            )
+        )
+        return token
+
+    def count(self, model) -> int:
+        return len(self.session.execute(select(model.id)).scalars().all())
+
+    async def test_reaps_expired_rows_in_batches(self):
+        past = self.now - timedelta(hours=1)
+        future = self.now + timedelta(hours=1)
+        for _ in range(5):
+            self.add_token(past)
+        fresh = self.add_token(future)
+        for i, expired_at in enumerate([past, past, past, future]):
+            self.session.add(
+                EmailVerification(
+                    email=f"reaper{i}@example.com",
+                    username=f"reaper{i}",
+                    password="x",
+                    verification_code=str(i),
+                    expired_at=expired_at,
+                )
+            )
+            self.session.add(
+                ResetPassword(user_id=self.user.id, token=str(i), expired_at=expired_at)
+            )
+        self.session.commit()
+
+        reaper = ExpiredRowReaper(session_factory=self.create_session, batch_size=2)
+        deleted = await reaper.reap()
+
+        self.assertEqual(deleted["token"], 5)
+        self.assertEqual(deleted["email_verification"], 3)
+        self.assertEqual(deleted["reset_password"], 3)
+        self.session.expire_all()
+        self.assertEqual(
+            self.session.execute(select(Token.id)).scalars().all(), [fresh.id]
+        )
+        self.assertEqual(self.count(RefreshToken), 1)
+        self.assertEqual(self.count(EmailVerification), 1)
+        self.assertEqual(self.count(ResetPassword), 1)
+
+    async def test_retention_keeps_recently_expired_rows(self):
+        self.add_token(self.now - timedelta(hours=1))
+        self.add_token(self.now - timedelta(days=2))
+        self.session.commit()
+
+        reaper = ExpiredRowReaper(
+            session_factory=self.create_session, retention=timedelta(days=1)
+        )
+        deleted = await reaper.reap()
+
+        self.assertEqual(deleted["token"], 1)
+        self.assertEqual(self.count(Token), 1)
+
+    async def test_invalidate_token_deletes_only_presented_token(self):
+        presented = self.add_token(self.now + timedelta(hours=1))
+        self.add_token(self.now - timedelta(hours=1))
+        self.session.commit()
+
+        invalidate_token(db=self.session, token=presented.token)
+
+        tokens = self.session.execute(select(Token.token)).scalars().all()
+        self.assertEqual(len(tokens), 1)
+        self.assertNotEqual(tokens[0], presented.token)
@@ -0,0 +1,187 @@
+import time
+import uuid
+from datetime import datetime, timezone
+from unittest import IsolatedAsyncioTestCase, TestCase
+from unittest.mock import patch
+
+import alembic.config
+from fastapi.testclient import TestClient
+from sqlalchemy import delete, event
+
+from core.security import (
+    generate_token_from_user,
+    get_principal_from_token,
+    invalidate_token,
+)
+from core.user_cache import UserPrincipal, UserPrincipalCache, user_principal_cache
+from main import app
+from models import db, engine, get_db_sync, get_db_sync_for_test
+from models.Token import Token, hash_token
+from models.User import MANAGEMENT_PARTICIPANT, User
+
+
+def create_principal(**kwargs) -> UserPrincipal:
+    fields = {
+        "id": uuid.uuid4(),
+        "username": "user",
+        "participant_type": None,
+        "email": None,
+    }
+    fields.update(kwargs)
+    return UserPrincipal(**fields)
+
+
+class TestUserPrincipalCache(TestCase):
+    def test_expires_at_ttl(self):
+        cache = UserPrincipalCache(max_size=10, ttl=60)
+        principal = create_principal()
+        with patch("core.user_cache.time") as mock_time:
+            mock_time.time.return_value = 1000.0
+            cache.put("token", principal, datetime.fromtimestamp(5000, timezone.utc))
+
+            mock_time.time.return_value = 1059.0
+            self.assertEqual(cache.get("token"), principal)
+            mock_time.time.return_value = 1060.0
+            self.assertIsNone(cache.get("token"))
+
+    def test_expires_at_token_expiry(self):
+        cache = UserPrincipalCache(max_size=10, ttl=60)
+        with patch("core.user_cache.time") as mock_time:
+            mock_time.time.return_value = 1000.0
+            cache.put(
+                "token",
+                create_principal(),
+                datetime.fromtimestamp(1010, timezone.utc),
+            )
+
+            mock_time.time.return_value = 1010.0
+            self.assertIsNone(cache.get("token"))
+
+    def test_bounded_least_recently_used(self):
+        cache = UserPrincipalCache(max_size=2, ttl=60)
+        expired_at = datetime.fromtimestamp(4102444800, timezone.utc)
+        cache.put("a", create_principal(), expired_at)
+        cache.put("b", create_principal(), expired_at)
+        cache.get("a")
+        cache.put("c", create_principal(), expired_at)
+
+        self.assertIsNotNone(cache.get("a"))
+        self.assertIsNone(cache.get("b"))
+        self.assertIsNotNone(cache.get("c"))
+
+    def test_invalidate_user(self):
+        cache = UserPrincipalCache(max_size=10, ttl=60)
+        expired_at = datetime.fromtimestamp(4102444800, timezone.utc)
+        principal = create_principal()
+        other = create_principal()
+        cache.put("a", principal, expired_at)
+        cache.put("b", principal, expired_at)
+        cache.put("c", other, expired_at)
+
+        cache.invalidate_user(principal.id)
+
+        self.assertIsNone(cache.get("a"))
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("c"), other)
+
+
+class TestGetPrincipalFromToken(IsolatedAsyncioTestCase):
+    @classmethod
+    def setUpClass(cls):
+        alembic_args = ["upgrade", "head"]
+        alembic.config.main(argv=alembic_args)
+
+    def setUp(self):
+        user_principal_cache.clear()
+        self.connection = engine.connect()
+        self.trans = self.connection.begin()
+        self.session = db(
+            bind=self.connection, join_transaction_mode="create_savepoint"
+        )
+
+        self.user = User(
+            username="cached",
+            email="cached@example.com",
+            participant_type=MANAGEMENT_PARTICIPANT,
+        )
+        self.session.add(self.user)
+        self.session.commit()
+
+        self.statements = []
+        event.listen(engine, "before_cursor_execute", self.record_statement)
+
+    def tearDown(self):
+        event.remove(engine, "before_cursor_execute", self.record_statement)
+        self.session.close()
+        self.trans.rollback()
+        self.connection.close()
+        user_principal_cache.clear()
+
+    def record_statement(self, conn, cursor, statement, *args):
+        self.statements.append(statement)
+
+    async def test_cached_lookup_needs_no_query(self):
+        (token, _) = await generate_token_from_user(db=self.session, user=self.user)
+        self.session.commit()
+
+        principal = get_principal_from_token(db=self.session, token=token)
+        self.assertEqual(principal.id, self.user.id)
+        self.assertEqual(principal.username, "cached")
+        self.assertEqual(principal.email, "cached@example.com")
+        self.assertEqual(principal.participant_type, MANAGEMENT_PARTICIPANT)
+
+        self.statements.clear()
+        self.assertEqual(
+            get_principal_from_token(db=self.session, token=token), principal
+        )
+        self.assertEqual(self.statements, [])
+
+    async def test_user_update_invalidates(self):
+        (token, _) = await generate_token_from_user(db=self.session, user=self.user)
+        self.session.commit()
+        get_principal_from_token(db=self.session, token=token)
+
+        self.user.participant_type = None
+        self.session.commit()
+
+        self.assertIsNone(user_principal_cache.get(token))
+        principal = get_principal_from_token(db=self.session, token=token)
+        self.assertIsNone(principal.participant_type)
+
+    async def test_invalidate_token_discards(self):
+        (token, _) = await generate_token_from_user(db=self.session, user=self.user)
+        self.session.commit()
+        get_principal_from_token(db=self.session, token=token)
+
+        invalidate_token(db=self.session, token=token)
+
+        self.assertIsNone(user_principal_cache.get(token))
+        self.assertIsNone(get_principal_from_token(db=self.session, token=token))
+
+    async def test_logout_then_me_is_unauthorized(self):
+        (token, _) = await generate_token_from_user(db=self.session, user=self.user)
+        self.session.commit()
+        app.dependency_overrides[get_db_sync] = get_db_sync_for_test(db=self.session)
+        client = TestClient(app)
+        headers = {"Authorization": f"Bearer {token}"}
+
+        self.assertEqual(client.get("/auth/me/", headers=headers).status_code, 200)
+        self.assertEqual(client.post("/auth/logout/", headers=headers).status_code, 200)
+        self.assertEqual(client.get("/auth/me/", headers=headers).status_code, 401)
+
+    async def test_logout_in_other_worker_within_ttl(self):
+        (token, _) = await generate_token_from_user(db=self.session, user=self.user)
+        self.session.commit()
+        with patch("core.user_cache.time") as mock_time:
+            mock_time.time.return_value = time.time()
+            get_principal_from_token(db=self.session, token=token)
+
+            # Another worker deletes the row, this worker's cache isn't told
+            self.session.execute(
+                delete(Token).where(Token.token_hash == hash_token(token))
+            )
+            self.session.commit()
+            self.assertIsNotNone(get_principal_from_token(db=self.session, token=token))
+
+            mock_time.time.return_value += user_principal_cache.ttl
+            self.assertIsNone(get_principal_from_token(db=self.session, token=token))
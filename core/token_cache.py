@@ -0,0 +1,85 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Optional
+
+import jwt
+from fastapi import Request
+
+from settings import ALGORITHM, JWT_CACHE_MAX_TTL, JWT_CACHE_SIZE, SECRET_KEY
+
+# Request scope key holding (token, claims) of the request's bearer token
+SCOPE_KEY = "verified_token"
+
+
+class VerifiedTokenCache:
+    """
+    Bounded LRU cache of token -> verified claims
+
+    An entry expires at the token's `exp`, or after `max_ttl` seconds when
+    that comes first, so an expired token is never served from the cache.
+    Shared by the event loop and the threadpool, hence the lock.
+    """
+
+    def __init__(self, max_size: int = 10000, max_ttl: float = 300):
+        self.max_size = max_size
+        self.max_ttl = max_ttl
+        self._entries: OrderedDict[str, tuple[float, dict]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, token: str) -> Optional[dict]:
+        with self._lock:
+            entry = self._entries.get(token)
+            if entry is None:
+                return None
+            expires_at, claims = entry
+            if expires_at <= time.time():
+                del self._entries[token]
+                return None
+            self._entries.move_to_end(token)
+            return claims
+
+    def put(self, token: str, claims: dict) -> None:
+        expires_at = time.time() + self.max_ttl
+        exp = claims.get("exp")
+        if isinstance(exp, (int, float)):
+            expires_at = min(expires_at, exp)
+
+        with self._lock:
+            self._entries[token] = (expires_at, claims)
+            self._entries.move_to_end(token)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+verified_token_cache = VerifiedTokenCache(
+    max_size=JWT_CACHE_SIZE, max_ttl=JWT_CACHE_MAX_TTL
+)
+
+
+def decode_token(token: str, request: Optional[Request] = None) -> dict[str, Any]:
+    """
+    Verified claims of a token, raises jwt.PyJWTError like jwt.decode
+
+    The signature is verified once per token and cache lifetime. With a
+    request, the claims are also kept on the request scope, so the rate
+    limiter and the auth dependencies of one request share them.
+    """
+    scope = getattr(request, "scope", None)
+    if isinstance(scope, dict):
+        cached = scope.get(SCOPE_KEY)
+        if cached is not None and cached[0] == token:
+            return cached[1]
+
+    claims = verified_token_cache.get(token)
+    if claims is None:
+        claims = jwt.decode(jwt=token, key=SECRET_KEY, algorithms=[ALGORITHM])
+        verified_token_cache.put(token, claims)
+
+    if isinstance(scope, dict):
+        scope[SCOPE_KEY] = (token, claims)
+    return claims
@@ -0,0 +1,75 @@
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Optional
+
+from sqlalchemy import delete, select
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
+from models import Base
+from models.EmailVerification import EmailVerification
+from models.RefreshToken import RefreshToken
+from models.ResetPassword import ResetPassword
+from models.Token import Token
+
+# Refresh tokens first, deleting a token also deletes its refresh tokens
+EXPIRING_MODELS: tuple[type[Base], ...] = (
+    RefreshToken,
+    Token,
+    EmailVerification,
+    ResetPassword,
+)
+
+
+class ExpiredRowReaper:
+    """
+    Delete expired tokens, refresh tokens, email verifications and reset
+    password requests, meant to run as a PeriodicTask
+
+    Rows are deleted `batch_size` at a time, each batch in its own short
+    transaction, skipping rows a request holds a lock on. Rows are kept for
+    `retention` after they expire, so e.g. an expired reset password link
+    is still reported as expired rather than unknown.
+    """
+
+    def __init__(
+        self,
+        session_factory: Optional[Callable[[], Session]] = None,
+        batch_size: int = 1000,
+        retention: timedelta = timedelta(0),
+        models: tuple[type[Base], ...] = EXPIRING_MODELS,
+    ):
+        if session_factory is None:
+            from models import db
+
+            session_factory = db
+        self._session_factory = session_factory
+        self.batch_size = batch_size
+        self.retention = retention
+        self.models = models
+
+    def _reap_batch(self, model: type[Base], cutoff: datetime) -> int:
+        expired = (
+            select(model.id)
+            .where(model.expired_at <= cutoff)
+            .limit(self.batch_size)
+            .with_for_update(skip_locked=True)
+        )
+        with self._session_factory() as session, session.begin():
+            result = session.execute(
+                delete(model).where(model.id.in_(expired.scalar_subquery()))
+            )
+            return result.rowcount
+
+    async def reap(self) -> dict[str, int]:
+        """Delete every expired row, returns the number deleted per table"""
+        cutoff = datetime.now(timezone.utc) - self.retention
+        deleted = {}
+        for model in self.models:
+            total = 0
+            while True:
+                count = await run_in_threadpool(self._reap_batch, model, cutoff)
+                total += count
+                if count < self.batch_size:
+                    break
+            deleted[model.__tablename__] = total
+        return deleted
@@ -0,0 +1,101 @@
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from datetime import datetime
+from typing import NamedTuple, Optional
+
+from sqlalchemy import event
+
+from models.Token import Token
+from models.User import User
+from settings import USER_CACHE_SIZE, USER_CACHE_TTL
+
+
+class UserPrincipal(NamedTuple):
+    """Fields of the authenticated user most endpoints need"""
+
+    id: uuid.UUID
+    username: Optional[str]
+    participant_type: Optional[str]
+    email: Optional[str]
+
+
+class UserPrincipalCache:
+    """
+    Bounded LRU cache of access token -> UserPrincipal
+
+    An entry expires when the token expires, or after `ttl` seconds when
+    that comes first. Entries are dropped when the token is invalidated and
+    when the user is updated or deleted through the ORM. Other workers only
+    see such changes once their entry expires: a token logged out elsewhere
+    keeps working here for up to `ttl` seconds, so keep it to a few.
+    """
+
+    def __init__(self, max_size: int = 10000, ttl: float = 5):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: OrderedDict[str, tuple[float, UserPrincipal]] = OrderedDict()
+        self._tokens_by_user: dict[uuid.UUID, set[str]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, token: str) -> Optional[UserPrincipal]:
+        with self._lock:
+            entry = self._entries.get(token)
+            if entry is None:
+                return None
+            expires_at, principal = entry
+            if expires_at <= time.time():
+                self._remove(token)
+                return None
+            self._entries.move_to_end(token)
+            return principal
+
+    def put(self, token: str, principal: UserPrincipal, expired_at: datetime) -> None:
+        expires_at = min(time.time() + self.ttl, expired_at.timestamp())
+        with self._lock:
+            self._remove(token)
+            self._entries[token] = (expires_at, principal)
+            self._tokens_by_user.setdefault(principal.id, set()).add(token)
+            while len(self._entries) > self.max_size:
+                self._remove(next(iter(self._entries)))
+
+    def discard(self, token: str) -> None:
+        with self._lock:
+            self._remove(token)
+
+    def invalidate_user(self, user_id: uuid.UUID) -> None:
+        with self._lock:
+            for token in list(self._tokens_by_user.get(user_id, ())):
+                self._remove(token)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._tokens_by_user.clear()
+
+    def _remove(self, token: str) -> None:
+        entry = self._entries.pop(token, None)
+        if entry is None:
+            return
+        tokens = self._tokens_by_user.get(entry[1].id)
+        if tokens is not None:
+            tokens.discard(token)
+            if not tokens:
+                del self._tokens_by_user[entry[1].id]
+
+
+user_principal_cache = UserPrincipalCache(max_size=USER_CACHE_SIZE, ttl=USER_CACHE_TTL)
+
+
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def _invalidate_user(mapper, connection, target: User) -> None:
+    # Profile and participant type changes are visible on the next request
+    user_principal_cache.invalidate_user(target.id)
+
+
+@event.listens_for(Token, "after_update")
+@event.listens_for(Token, "after_delete")
+def _invalidate_token(mapper, connection, target: Token) -> None:
+    user_principal_cache.discard(target.token)
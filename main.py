@@ -1,11 +1,29 @@
-from fastapi import FastAPI, Request
+from contextlib import asynccontextmanager
+from datetime import timedelta
+from typing import Optional
+
+from fastapi import Depends, FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from pydantic import ValidationError
+from starlette.concurrency import run_in_threadpool
 from core.health_check import health_check
 from core.log import logger
-from core.rate_limiter.memory import InMemoryRateLimiter
-from core.rate_limiter.middleware import RateLimitMiddleware
+from core.loop_monitor import LoopLagMonitor, LoopMonitorMiddleware
+from core.password_hasher import password_hasher
+from core.periodic import PeriodicTask
+from core.query_counter import QueryStatsMiddleware
+from core.token_reaper import ExpiredRowReaper
+from core.rate_limiter.factory import create_rate_limiter
+from core.rate_limiter.metrics import RateLimitMetrics
+from core.rate_limiter.middleware import ASGIRateLimitMiddleware
+from core.rate_limiter.policy import RATE_LIMIT_POLICIES
+from core.responses import Forbidden, Unauthorized, common_response
+from core.security import check_permissions, get_current_principal
+from core.user_cache import UserPrincipal
+from models import engine, pool_metrics
+from models.User import MANAGEMENT_PARTICIPANT
+from schemas.auth import AuthorizationStatusEnum
 from routes.auth import router as auth_router
 from routes.user_profile import router as user_profile_router
 from routes.locations import router as locations_router
@@ -23,51 +41,48 @@ from routes.schedule_type import router as schedule_type_router
 from routes.volunteer import router as volunteer_router
 
 from settings import (
+    DB_POOL_TIMEOUT,
+    EXPIRED_ROW_REAPER_BATCH_SIZE,
+    EXPIRED_ROW_REAPER_INTERVAL,
+    EXPIRED_ROW_RETENTION,
+    LOOP_MONITOR_ENABLED,
+    LOOP_MONITOR_THRESHOLD_MS,
+    QUERY_REPEAT_THRESHOLD,
+    QUERY_STATS_ENABLED,
+    RATE_LIMIT_CLEANUP_INTERVAL,
     RATE_LIMIT_ENABLED,
     RATE_LIMIT_EXCLUDED_PATHS,
     RATE_LIMIT_PER_MINUTE,
     RATE_LIMIT_WINDOW,
 )
 
-health_check()
 
-app = FastAPI(title="PyconId 2025 BE")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Checked at startup rather than at import, importing the app for tests
+    # or tooling doesn't open a connection
+    await run_in_threadpool(health_check)
+    state = app.state
+    rate_limit_cleanup = PeriodicTask(
+        "rate-limit-cleanup",
+        state.rate_limiter.evict_expired,
+        RATE_LIMIT_CLEANUP_INTERVAL,
+    )
+    expired_row_cleanup = PeriodicTask(
+        "expired-row-cleanup",
+        state.expired_row_reaper.reap,
+        EXPIRED_ROW_REAPER_INTERVAL,
+    )
+    rate_limit_cleanup.start()
+    expired_row_cleanup.start()
+    if LOOP_MONITOR_ENABLED:
+        state.loop_monitor.start()
+    yield
+    await rate_limit_cleanup.stop()
+    await expired_row_cleanup.stop()
+    await state.loop_monitor.stop()
 
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
 
-app.add_middleware(
-    RateLimitMiddleware,
-    backend=InMemoryRateLimiter,
-    enabled=RATE_LIMIT_ENABLED,
-    limit=RATE_LIMIT_PER_MINUTE,
-    window=RATE_LIMIT_WINDOW,
-    exclude_paths=RATE_LIMIT_EXCLUDED_PATHS,
-)
-
-app.include_router(auth_router)
-app.include_router(user_profile_router)
-app.include_router(locations_router)
-app.include_router(ticket_router)
-app.include_router(room_router)
-app.include_router(speaker_router)
-app.include_router(schedule_router)
-app.include_router(payment_router)
-app.include_router(streaming_router)
-app.include_router(voucher_router)
-app.include_router(speaker_type_router)
-app.include_router(organizer_type_router)
-app.include_router(organizer_router)
-app.include_router(schedule_type_router)
-app.include_router(volunteer_router)
-
-
-@app.exception_handler(ValidationError)
 async def pydantic_validation_exception_handler(request: Request, exc: ValidationError):
     # Logikanya hampir sama, hanya cara mengambil detail errornya sedikit berbeda
     error_details = []
@@ -86,12 +101,154 @@ async def pydantic_validation_exception_handler(request: Request, exc: Validatio
     )
 
 
-@app.get("/")
 async def hello():
     logger.info("hello")
     return {"Hello": "from pyconid 2025 BE"}
 
 
-@app.get("/health")
 def health():
     return {"status": "ok"}
+
+
+async def ready():
+    """
+    Not ready for DB_POOL_TIMEOUT seconds after a database pool timed out
+
+    A pool with every connection in use only queues requests, that is
+    reported as saturated. Requests fail once they waited DB_POOL_TIMEOUT.
+    """
+    pools = {"sync": pool_metrics.snapshot(engine.pool)}
+    timing_out = any(
+        pool["seconds_since_timeout"] is not None
+        and pool["seconds_since_timeout"] < DB_POOL_TIMEOUT
+        for pool in pools.values()
+    )
+    return JSONResponse(
+        status_code=503 if timing_out else 200,
+        content={"status": "timing_out" if timing_out else "ok", "pools": pools},
+    )
+
+
+def _management_only(principal: Optional[UserPrincipal]) -> Optional[Response]:
+    """Unauthorized or Forbidden response unless `principal` is management"""
+    auth_status = check_permissions(principal, MANAGEMENT_PARTICIPANT)
+    if auth_status == AuthorizationStatusEnum.UNAUTHORIZED:
+        return common_response(Unauthorized(message="Unauthorized"))
+    if auth_status == AuthorizationStatusEnum.FORBIDDEN:
+        return common_response(Forbidden())
+    return None
+
+
+# Metrics tell how to get around the limiter or where the code is, they're
+# for management only. Async, so they read the counters on the event loop
+# that updates them.
+async def rate_limit_metrics_snapshot(
+    request: Request,
+    principal: Optional[UserPrincipal] = Depends(get_current_principal),
+):
+    denied = _management_only(principal)
+    if denied is not None:
+        return denied
+    state = request.app.state
+    return state.rate_limit_metrics.snapshot(state.rate_limiter)
+
+
+async def password_hasher_metrics_snapshot(
+    principal: Optional[UserPrincipal] = Depends(get_current_principal),
+):
+    # Includes how long logins and signups wait for a hashing thread
+    denied = _management_only(principal)
+    if denied is not None:
+        return denied
+    return password_hasher.stats()
+
+
+async def event_loop_metrics_snapshot(
+    request: Request,
+    principal: Optional[UserPrincipal] = Depends(get_current_principal),
+):
+    # The blocked call reports carry stack traces of the loop thread
+    denied = _management_only(principal)
+    if denied is not None:
+        return denied
+    return {"enabled": LOOP_MONITOR_ENABLED, **request.app.state.loop_monitor.stats()}
+
+
+def create_app() -> FastAPI:
+    """
+    Build the application
+
+    Importing it stays cheap, slow dependencies (pgeocode, mux_python,
+    authlib, fastapi_mail) are imported on first use and the database is
+    checked in the lifespan. Each app gets its own rate limiter, metrics,
+    loop monitor and reaper on `app.state`.
+    """
+    app = FastAPI(title="PyconId 2025 BE", lifespan=lifespan)
+    rate_limiter = create_rate_limiter()
+    rate_limit_metrics = RateLimitMetrics()
+    loop_monitor = LoopLagMonitor(threshold=LOOP_MONITOR_THRESHOLD_MS / 1000)
+    app.state.rate_limiter = rate_limiter
+    app.state.rate_limit_metrics = rate_limit_metrics
+    app.state.loop_monitor = loop_monitor
+    app.state.expired_row_reaper = ExpiredRowReaper(
+        batch_size=EXPIRED_ROW_REAPER_BATCH_SIZE,
+        retention=timedelta(seconds=EXPIRED_ROW_RETENTION),
+    )
+
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=["*"],
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+    )
+
+    app.add_middleware(
+        ASGIRateLimitMiddleware,
+        backend=rate_limiter,
+        enabled=RATE_LIMIT_ENABLED,
+        limit=RATE_LIMIT_PER_MINUTE,
+        window=RATE_LIMIT_WINDOW,
+        exclude_paths=RATE_LIMIT_EXCLUDED_PATHS,
+        policies=RATE_LIMIT_POLICIES,
+        metrics=rate_limit_metrics,
+    )
+
+    if LOOP_MONITOR_ENABLED:
+        app.add_middleware(LoopMonitorMiddleware, monitor=loop_monitor)
+
+    if QUERY_STATS_ENABLED:
+        app.add_middleware(
+            QueryStatsMiddleware, repeat_threshold=QUERY_REPEAT_THRESHOLD
+        )
+
+    app.include_router(auth_router)
+    app.include_router(user_profile_router)
+    app.include_router(locations_router)
+    app.include_router(ticket_router)
+    app.include_router(room_router)
+    app.include_router(speaker_router)
+    app.include_router(schedule_router)
+    app.include_router(payment_router)
+    app.include_router(streaming_router)
+    app.include_router(voucher_router)
+    app.include_router(speaker_type_router)
+    app.include_router(organizer_type_router)
+    app.include_router(organizer_router)
+    app.include_router(schedule_type_router)
+    app.include_router(volunteer_router)
+
+    app.add_exception_handler(ValidationError, pydantic_validation_exception_handler)
+
+    app.get("/")(hello)
+    app.get("/health")(health)
+    app.get("/health/ready")(ready)
+    app.get("/metrics/rate-limit", include_in_schema=False)(rate_limit_metrics_snapshot)
+    app.get("/metrics/event-loop", include_in_schema=False)(event_loop_metrics_snapshot)
+    app.get("/metrics/password-hasher", include_in_schema=False)(
+        password_hasher_metrics_snapshot
+    )
+    return app
+
+
+app = create_app()
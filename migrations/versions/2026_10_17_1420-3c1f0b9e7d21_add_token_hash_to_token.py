@@ -0,0 +1,65 @@
+"""add token_hash to token
+
+Duplicate token rows are merged into one, their refresh tokens are kept and
+point to the merged row.
+
+Revision ID: 3c1f0b9e7d21
+Revises: 8f8751c92630
+Create Date: 2026-10-17 14:20:41.512093
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "3c1f0b9e7d21"
+down_revision: Union[str, None] = "8f8751c92630"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "token",
+        sa.Column("token_hash", sa.String(length=64), nullable=True),
+        schema="public",
+    )
+    # The same JWT issued twice within a second is stored twice, keep one row.
+    # Refresh tokens of the dropped rows move to the kept one, deleting would
+    # cascade to them and log those sessions out
+    op.execute(
+        "CREATE TEMPORARY TABLE duplicate_token AS "
+        "SELECT id, first_value(id) OVER ("
+        "PARTITION BY token ORDER BY expired_at DESC, id DESC) AS kept_id "
+        "FROM public.token"
+    )
+    op.execute("DELETE FROM duplicate_token WHERE id = kept_id")
+    op.execute(
+        "UPDATE public.refresh_token r SET token_id = d.kept_id "
+        "FROM duplicate_token d WHERE r.token_id = d.id"
+    )
+    op.execute("DELETE FROM public.token t USING duplicate_token d WHERE t.id = d.id")
+    op.execute(
+        "UPDATE public.token "
+        "SET token_hash = encode(sha256(convert_to(token, 'UTF8')), 'hex')"
+    )
+    op.alter_column("token", "token_hash", nullable=False, schema="public")
+    op.create_index(
+        op.f("ix_public_token_token_hash"),
+        "token",
+        ["token_hash"],
+        unique=True,
+        schema="public",
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        op.f("ix_public_token_token_hash"), table_name="token", schema="public"
+    )
+    op.drop_column("token", "token_hash", schema="public")
@@ -0,0 +1,86 @@
+"""add search_vector to schedule and user
+
+Revision ID: b71e2d9c4a55
+Revises: 3c1f0b9e7d21
+Create Date: 2026-10-17 16:30:12.406117
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "b71e2d9c4a55"
+down_revision: Union[str, None] = "3c1f0b9e7d21"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Keep in sync with models.Schedule.SEARCH_VECTOR and models.User.NAME_SEARCH_VECTOR
+SCHEDULE_SEARCH_VECTOR = (
+    "setweight(to_tsvector('simple', coalesce(title, '')), 'A')"
+    " || setweight(to_tsvector('simple',"
+    " public.immutable_array_to_string(tags, ' ')), 'B')"
+    " || setweight(to_tsvector('simple', coalesce(description, '')), 'C')"
+)
+USER_NAME_SEARCH_VECTOR = (
+    "to_tsvector('simple', coalesce(first_name, '') || ' '"
+    " || coalesce(last_name, '') || ' ' || coalesce(username, ''))"
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # array_to_string is only STABLE, generated columns need IMMUTABLE
+    op.execute(
+        "CREATE FUNCTION public.immutable_array_to_string(text[], text) "
+        "RETURNS text LANGUAGE sql IMMUTABLE PARALLEL SAFE "
+        "AS $$ SELECT coalesce(array_to_string($1, $2), '') $$"
+    )
+    op.add_column(
+        "schedule",
+        sa.Column(
+            "search_vector",
+            postgresql.TSVECTOR(),
+            sa.Computed(SCHEDULE_SEARCH_VECTOR, persisted=True),
+        ),
+        schema="public",
+    )
+    op.create_index(
+        "ix_public_schedule_search_vector",
+        "schedule",
+        ["search_vector"],
+        postgresql_using="gin",
+        schema="public",
+    )
+    op.add_column(
+        "user",
+        sa.Column(
+            "name_search_vector",
+            postgresql.TSVECTOR(),
+            sa.Computed(USER_NAME_SEARCH_VECTOR, persisted=True),
+        ),
+        schema="public",
+    )
+    op.create_index(
+        "ix_public_user_name_search_vector",
+        "user",
+        ["name_search_vector"],
+        postgresql_using="gin",
+        schema="public",
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        "ix_public_user_name_search_vector", table_name="user", schema="public"
+    )
+    op.drop_column("user", "name_search_vector", schema="public")
+    op.drop_index(
+        "ix_public_schedule_search_vector", table_name="schedule", schema="public"
+    )
+    op.drop_column("schedule", "search_vector", schema="public")
+    op.execute("DROP FUNCTION public.immutable_array_to_string(text[], text)")
@@ -0,0 +1,48 @@
+"""add partial indexes on schedule start and end
+
+Revision ID: 5e0a3c7f19b2
+Revises: b71e2d9c4a55
+Create Date: 2026-10-17 17:45:03.228419
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "5e0a3c7f19b2"
+down_revision: Union[str, None] = "b71e2d9c4a55"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Every list query filters out deleted schedules, leave them out of the
+    # indexes the date filter and the ordering by start use
+    op.create_index(
+        "ix_public_schedule_start_active",
+        "schedule",
+        ["start"],
+        schema="public",
+        postgresql_where=sa.text("deleted_at IS NULL"),
+    )
+    op.create_index(
+        "ix_public_schedule_end_active",
+        "schedule",
+        ["end"],
+        schema="public",
+        postgresql_where=sa.text("deleted_at IS NULL"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        "ix_public_schedule_end_active", table_name="schedule", schema="public"
+    )
+    op.drop_index(
+        "ix_public_schedule_start_active", table_name="schedule", schema="public"
+    )
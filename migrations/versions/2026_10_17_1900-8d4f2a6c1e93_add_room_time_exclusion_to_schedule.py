@@ -0,0 +1,64 @@
+"""add time_range and a room/time exclusion constraint to schedule
+
+Revision ID: 8d4f2a6c1e93
+Revises: 5e0a3c7f19b2
+Create Date: 2026-10-17 19:00:41.518302
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "8d4f2a6c1e93"
+down_revision: Union[str, None] = "5e0a3c7f19b2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Keep in sync with models.Schedule.TIME_RANGE
+TIME_RANGE = 'CASE WHEN start <= "end" THEN tstzrange(start, "end") END'
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # GiST has no operator class for = on uuid without btree_gist
+    op.execute("CREATE EXTENSION IF NOT EXISTS btree_gist")
+    op.add_column(
+        "schedule",
+        sa.Column(
+            "time_range",
+            postgresql.TSTZRANGE(),
+            sa.Computed(TIME_RANGE, persisted=True),
+        ),
+        schema="public",
+    )
+    # The constraint can't be added while active schedules overlap in a room,
+    # name them so they can be resolved first, e.g. with POST /schedule/validate
+    overlapping = op.get_bind().execute(
+        sa.text(
+            "SELECT a.id, b.id FROM public.schedule a "
+            "JOIN public.schedule b ON a.room_id = b.room_id AND a.id < b.id "
+            "AND a.time_range && b.time_range "
+            "WHERE a.deleted_at IS NULL AND b.deleted_at IS NULL "
+            "ORDER BY a.id, b.id"
+        )
+    )
+    pairs = [f"{a} and {b}" for a, b in overlapping]
+    if pairs:
+        raise RuntimeError(
+            "Active schedules overlap in the same room: " + ", ".join(pairs)
+        )
+    op.execute(
+        "ALTER TABLE public.schedule ADD CONSTRAINT ex_public_schedule_room_time "
+        "EXCLUDE USING gist (room_id WITH =, time_range WITH &&) "
+        "WHERE (deleted_at IS NULL)"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint("ex_public_schedule_room_time", "schedule", schema="public")
+    op.drop_column("schedule", "time_range", schema="public")
@@ -0,0 +1,19 @@
+from sqlalchemy import BigInteger, DateTime, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from models import Base
+
+
+class RateLimitCounter(Base):
+    __tablename__ = "rate_limit_counter"
+
+    key: Mapped[str] = mapped_column("key", String, primary_key=True)
+    window: Mapped[int] = mapped_column("window", Integer, nullable=False)
+    bucket: Mapped[int] = mapped_column("bucket", BigInteger, nullable=False)
+    previous_count: Mapped[int] = mapped_column(
+        "previous_count", Integer, nullable=False, default=0
+    )
+    current_count: Mapped[int] = mapped_column(
+        "current_count", Integer, nullable=False, default=0
+    )
+    updated_at = mapped_column("updated_at", DateTime(timezone=True), nullable=False)
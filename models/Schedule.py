@@ -2,15 +2,55 @@ import datetime
 import uuid
 from typing import List
 
-from sqlalchemy import UUID, DateTime, ForeignKey, String
-from sqlalchemy.dialects.postgresql import ARRAY
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy import UUID, Computed, DateTime, ForeignKey, Index, String, text
+from sqlalchemy.dialects.postgresql import ARRAY, TSTZRANGE, TSVECTOR, ExcludeConstraint
+from sqlalchemy.orm import Mapped, deferred, mapped_column, relationship
 
 from models import Base
 
+# Title weighs most, then tags, then description. 'simple' doesn't stem, talks
+# are in English and Indonesian, prefix queries cover most inflections
+SEARCH_VECTOR = (
+    "setweight(to_tsvector('simple', coalesce(title, '')), 'A')"
+    " || setweight(to_tsvector('simple',"
+    " public.immutable_array_to_string(tags, ' ')), 'B')"
+    " || setweight(to_tsvector('simple', coalesce(description, '')), 'C')"
+)
+# NULL without both ends, [start, end) otherwise. start == end is an empty
+# range, which overlaps nothing
+TIME_RANGE = 'CASE WHEN start <= "end" THEN tstzrange(start, "end") END'
+ROOM_TIME_CONSTRAINT = "ex_public_schedule_room_time"
+
 
 class Schedule(Base):
     __tablename__ = "schedule"
+    __table_args__ = (
+        Index(
+            "ix_public_schedule_search_vector", "search_vector", postgresql_using="gin"
+        ),
+        # Only schedules that aren't deleted are listed and filtered by date
+        Index(
+            "ix_public_schedule_start_active",
+            "start",
+            postgresql_where=text("deleted_at IS NULL"),
+        ),
+        Index(
+            "ix_public_schedule_end_active",
+            "end",
+            postgresql_where=text("deleted_at IS NULL"),
+        ),
+        # Two active schedules can't share a room at the same time
+        ExcludeConstraint(
+            ("room_id", "="),
+            ("time_range", "&&"),
+            name=ROOM_TIME_CONSTRAINT,
+            using="gist",
+            where=text("deleted_at IS NULL"),
+        ),
+    )
+    # Nothing reads search_vector or time_range off a new schedule, skip
+    # returning them on insert
+    __mapper_args__ = {"eager_defaults": False}
 
     id: Mapped[str] = mapped_column(
         "id", UUID(as_uuid=True), primary_key=True, index=True, default=uuid.uuid4
@@ -57,6 +97,15 @@ class Schedule(Base):
         default=datetime.datetime.now(datetime.timezone.utc),
     )
     deleted_at = mapped_column("deleted_at", DateTime(timezone=True))
+    # Generated by Postgres, deferred so they aren't loaded with every schedule
+    search_vector = deferred(
+        mapped_column(
+            "search_vector", TSVECTOR, Computed(SEARCH_VECTOR, persisted=True)
+        )
+    )
+    time_range = deferred(
+        mapped_column("time_range", TSTZRANGE, Computed(TIME_RANGE, persisted=True))
+    )
 
     # Relationships
     speaker = relationship("Speaker", backref="schedules")
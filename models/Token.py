@@ -1,9 +1,19 @@
+import hashlib
 import uuid
 from models import Base
 from sqlalchemy import UUID, DateTime, ForeignKey, String
 from sqlalchemy.orm import mapped_column, Mapped, relationship
 
 
+def hash_token(token: str) -> str:
+    """SHA-256 hex digest of a token, the indexed column tokens are looked up by"""
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+def _default_token_hash(context) -> str:
+    return hash_token(context.get_current_parameters()["token"])
+
+
 class Token(Base):
     __tablename__ = "token"
 
@@ -14,6 +24,14 @@ class Token(Base):
         "user_id", ForeignKey("user.id"), index=True, nullable=False
     )
     token: Mapped[str] = mapped_column("token", String, nullable=False)
+    token_hash: Mapped[str] = mapped_column(
+        "token_hash",
+        String(64),
+        unique=True,
+        index=True,
+        nullable=False,
+        default=_default_token_hash,
+    )
     expired_at = mapped_column("expired_at", DateTime(timezone=True), nullable=False)
 
     # Many to One
@@ -1,14 +1,40 @@
 import uuid
 from models import Base
-from sqlalchemy import UUID, DateTime, String, Boolean, Integer, ForeignKey
-from sqlalchemy.orm import mapped_column, Mapped, relationship
+from sqlalchemy import (
+    UUID,
+    Computed,
+    DateTime,
+    Index,
+    String,
+    Boolean,
+    Integer,
+    ForeignKey,
+)
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.orm import deferred, mapped_column, Mapped, relationship
 
 VOLUNTEER_PARTICIPANT = "Volunteer"
 MANAGEMENT_PARTICIPANT = "Management"
 
+# Speaker names for the schedule search
+NAME_SEARCH_VECTOR = (
+    "to_tsvector('simple', coalesce(first_name, '') || ' '"
+    " || coalesce(last_name, '') || ' ' || coalesce(username, ''))"
+)
+
 
 class User(Base):
     __tablename__ = "user"
+    __table_args__ = (
+        Index(
+            "ix_public_user_name_search_vector",
+            "name_search_vector",
+            postgresql_using="gin",
+        ),
+    )
+    # name_search_vector is only used by the schedule search, an insert
+    # doesn't need it back
+    __mapper_args__ = {"eager_defaults": False}
 
     id: Mapped[str] = mapped_column(
         "id", UUID(as_uuid=True), primary_key=True, index=True, default=uuid.uuid4
@@ -129,6 +155,14 @@ class User(Base):
     created_at = mapped_column("created_at", DateTime(timezone=True))
     updated_at = mapped_column("updated_at", DateTime(timezone=True))
     deleted_at = mapped_column("deleted_at", DateTime(timezone=True))
+    # Generated by Postgres, deferred so it isn't loaded with every user
+    name_search_vector = deferred(
+        mapped_column(
+            "name_search_vector",
+            TSVECTOR,
+            Computed(NAME_SEARCH_VECTOR, persisted=True),
+        )
+    )
 
     # One to Many
     tokens = relationship("Token", back_populates="user")
@@ -7,7 +7,14 @@ from sqlalchemy.orm import (
 )
 
 
+from core.db_pool import InstrumentedQueuePool, instrument
 from settings import (
+    DB_MAX_OVERFLOW,
+    DB_POOL_PRE_PING,
+    DB_POOL_RECYCLE,
+    DB_POOL_SIZE,
+    DB_POOL_TIMEOUT,
+    DB_PREPARE_THRESHOLD,
     POSTGRES_DATABASE,
     POSTGRES_HOST,
     POSTGRES_PASSWORD,
@@ -16,12 +23,25 @@ from settings import (
 )
 
 
+DATABASE_URL = f"postgresql+psycopg://{POSTGRES_USER}:{POSTGRES_PASSWORD}@{POSTGRES_HOST}:{POSTGRES_PORT}/{POSTGRES_DATABASE}"
+
+POOL_OPTIONS = {
+    "pool_size": DB_POOL_SIZE,
+    "max_overflow": DB_MAX_OVERFLOW,
+    "pool_timeout": DB_POOL_TIMEOUT,
+    "pool_recycle": DB_POOL_RECYCLE,
+    "pool_pre_ping": DB_POOL_PRE_PING,
+}
+# Passed to psycopg.connect, hot statements become server side prepared
+CONNECT_ARGS = {"prepare_threshold": DB_PREPARE_THRESHOLD}
+
 engine = create_engine(
-    f"postgresql+psycopg://{POSTGRES_USER}:{POSTGRES_PASSWORD}@{POSTGRES_HOST}:{POSTGRES_PORT}/{POSTGRES_DATABASE}",
-    pool_size=20,
-    max_overflow=0,
-    pool_timeout=300,
+    DATABASE_URL,
+    poolclass=InstrumentedQueuePool,
+    connect_args=CONNECT_ARGS,
+    **POOL_OPTIONS,
 )
+pool_metrics = instrument(engine)
 db = sessionmaker(engine, future=True)
 factory_session = scoped_session(db)
 
@@ -70,3 +90,4 @@ from models.Voucher import Voucher  # NOQA
 from models.Stream import Stream  # NOQA
 from models.SpeakerType import SpeakerType  # NOQA
 from models.Volunteer import Volunteer  # NOQA
+from models.RateLimitCounter import RateLimitCounter  # NOQA
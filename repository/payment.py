@@ -1,6 +1,6 @@
 from typing import Optional, List
 from pytz import timezone
-from sqlalchemy import select
+from sqlalchemy import lambda_stmt, select
 from sqlalchemy.orm import Session, joinedload
 from datetime import datetime
 
@@ -50,12 +50,11 @@ def get_payment_by_id(db: Session, payment_id: str) -> Optional[Payment]:
     return payment
 
 
-def get_payments_by_user_id(
-    db: Session,
+def _payments_by_user_id_stmt(
     user_id: str,
     status: Optional[PaymentStatus] = None,
     exclude_payment_id: Optional[str] = None,
-) -> List[Payment]:
+):
     stmt = (
         select(Payment)
         .options(joinedload(Payment.ticket), joinedload(Payment.voucher))
@@ -70,6 +69,16 @@ def get_payments_by_user_id(
             if isinstance(status, PaymentStatus)
             else status
         )
+    return stmt
+
+
+def get_payments_by_user_id(
+    db: Session,
+    user_id: str,
+    status: Optional[PaymentStatus] = None,
+    exclude_payment_id: Optional[str] = None,
+) -> List[Payment]:
+    stmt = _payments_by_user_id_stmt(user_id, status, exclude_payment_id)
     payments = db.execute(stmt).scalars().all()
     return list(payments)
 
@@ -119,19 +128,23 @@ def get_payment_by_mayar_transaction_id(
     return payment
 
 
-def get_user_paid_payment(
-    db: Session,
-    user_id: str,
-) -> Optional[Payment]:
-    stmt = (
-        select(Payment)
+def _user_paid_payment_stmt(user_id: str):
+    # Built and compiled once, later calls only bind user_id
+    return lambda_stmt(
+        lambda: select(Payment)
         .options(joinedload(Payment.ticket), joinedload(Payment.voucher))
         .where(
             Payment.user_id == user_id,
             Payment.status == PaymentStatus.PAID.value,
         )
     )
-    payment = db.execute(stmt).scalar()
+
+
+def get_user_paid_payment(
+    db: Session,
+    user_id: str,
+) -> Optional[Payment]:
+    payment = db.execute(_user_paid_payment_stmt(user_id)).scalar()
     return payment
 
 
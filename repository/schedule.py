@@ -1,25 +1,99 @@
-from datetime import date, datetime
+import re
+from collections import defaultdict
+from datetime import date, datetime, time, timedelta
 from math import ceil
 from typing import List, Optional, Tuple, Union
 from uuid import UUID
 
-from sqlalchemy import func, select
+from sqlalchemy import UUID as SA_UUID, any_, cast, func, select
+from psycopg.errors import ExclusionViolation
+from pytz import timezone
+from sqlalchemy.dialects.postgresql import ARRAY, TSTZRANGE
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session, joinedload
 from sqlalchemy.sql import exists
 from sqlalchemy.sql.operators import or_
 
-from models.Schedule import Schedule
+from core.interval_tree import IntervalTree
+from models.Schedule import ROOM_TIME_CONSTRAINT, Schedule
 from models.Speaker import Speaker
-from schemas.schedule import ScheduleResponseItem
+from models.User import User
+from schemas.schedule import (
+    ScheduleConflict,
+    ScheduleResponseItem,
+    ScheduleSlot,
+    ValidateScheduleItem,
+)
+from settings import TZ
+
+
+def _date_term(schedule_date: Union[str, date]):
+    """
+    Schedules starting or ending on `schedule_date` in TZ, as half-open
+    ranges on the raw columns so the partial indexes on start and end are
+    used, date(start) would be evaluated for every row
+    """
+    if isinstance(schedule_date, str):
+        schedule_date = date.fromisoformat(schedule_date)
+    tz = timezone(TZ)
+    day_start = tz.localize(datetime.combine(schedule_date, time.min))
+    day_end = tz.localize(datetime.combine(schedule_date + timedelta(days=1), time.min))
+    return or_(
+        (Schedule.start >= day_start) & (Schedule.start < day_end),
+        (Schedule.end >= day_start) & (Schedule.end < day_end),
+    )
 
 
-def get_all_schedules(
-    db: Session,
+def _search_query(search: str) -> Optional[str]:
+    """
+    tsquery matching every word of `search` as a prefix, "dj bas" finds
+    "Django Basics". Only word characters reach to_tsquery, so any input
+    is a valid query
+    """
+    words = re.findall(r"\w+", search.lower())
+    if not words:
+        return None
+    return " & ".join(f"{word}:*" for word in words)
+
+
+def _search_terms(search: str):
+    """
+    Filter and rank for a schedule search over title, tags, description
+    (Schedule.search_vector) and speaker names (User.name_search_vector),
+    both GIN indexed. A generated column can't read the speaker's row, so
+    speakers are matched by a subquery on their own index
+    """
+    query_text = _search_query(search)
+    if query_text is None:
+        # Only punctuation, nothing to search for by words
+        return Schedule.title.ilike(f"%{search}%"), None
+    query = func.to_tsquery("simple", query_text)
+    speaker_rank = (
+        select(func.ts_rank(User.name_search_vector, query))
+        .join(Speaker, Speaker.user_id == User.id)
+        .where(Speaker.id == Schedule.speaker_id)
+        .scalar_subquery()
+    )
+    # An array from an uncorrelated subquery is computed once, up front, so
+    # both sides of the OR can be index scans combined by a BitmapOr
+    speaker_ids = (
+        select(func.array_agg(Speaker.id))
+        .join(User, Speaker.user_id == User.id)
+        .where(User.name_search_vector.op("@@")(query))
+        .scalar_subquery()
+    )
+    term = or_(
+        Schedule.search_vector.op("@@")(query),
+        Schedule.speaker_id == any_(cast(speaker_ids, ARRAY(SA_UUID))),
+    )
+    rank = func.ts_rank(Schedule.search_vector, query) + func.coalesce(speaker_rank, 0)
+    return term, rank
+
+
+def _public_schedules_stmt(
     search: Optional[str] = None,
     schedule_date: Optional[Union[str, date]] = None,
 ):
-    # Hitung offset (data mulai dari baris ke-berapa)
-
     # Query dasar
     stmt = (
         select(Schedule)
@@ -35,23 +109,39 @@ def get_all_schedules(
     )
 
     # Jika ada keyword pencarian
+    rank = None
     if search:
-        stmt = stmt.where(Schedule.title.ilike(f"%{search}%"))
+        search_term, rank = _search_terms(search)
+        stmt = stmt.where(search_term)
 
     if schedule_date:
-        stmt = stmt.where(
-            or_(
-                func.date(Schedule.start) == schedule_date,
-                func.date(Schedule.end) == schedule_date,
-            )
-        )
+        stmt = stmt.where(_date_term(schedule_date))
+
+    return stmt, rank
+
+
+def _order_by_rank(stmt, rank):
+    """Best matches first when searching, then by start time"""
+    if rank is not None:
+        return stmt.order_by(rank.desc(), Schedule.start.asc())
+    return stmt.order_by(Schedule.start.asc())
+
+
+def get_all_schedules(
+    db: Session,
+    search: Optional[str] = None,
+    schedule_date: Optional[Union[str, date]] = None,
+):
+    # Hitung offset (data mulai dari baris ke-berapa)
+
+    stmt, rank = _public_schedules_stmt(search, schedule_date)
 
     # Hitung total data sebelum pagination
     total_count = db.scalar(select(func.count()).select_from(stmt.subquery()))
     results_schema = []
     try:
         # Tambahkan pagination (offset + limit)
-        stmt = stmt.order_by(Schedule.start.asc())
+        stmt = _order_by_rank(stmt, rank)
 
         # Eksekusi query dan ambil hasilnya
         results = db.scalars(stmt).all()
@@ -80,38 +170,14 @@ def get_schedule_per_page_by_search(
     # Hitung offset (data mulai dari baris ke-berapa)
     offset = (page - 1) * page_size
 
-    # Query dasar
-    stmt = (
-        select(Schedule)
-        .options(
-            joinedload(Schedule.speaker).joinedload(Speaker.user),
-            joinedload(Schedule.speaker).joinedload(Speaker.speaker_type),
-            joinedload(Schedule.room),
-            joinedload(Schedule.schedule_type),
-        )
-        .where(
-            Schedule.deleted_at.is_(None),
-        )
-    )
-
-    # Jika ada keyword pencarian
-    if search:
-        stmt = stmt.where(Schedule.title.ilike(f"%{search}%"))
-
-    if schedule_date:
-        stmt = stmt.where(
-            or_(
-                func.date(Schedule.start) == schedule_date,
-                func.date(Schedule.end) == schedule_date,
-            )
-        )
+    stmt, rank = _public_schedules_stmt(search, schedule_date)
 
     # Hitung total data sebelum pagination
     total_count = db.scalar(select(func.count()).select_from(stmt.subquery()))
     results_schema = []
     try:
         # Tambahkan pagination (offset + limit)
-        stmt = stmt.offset(offset).limit(page_size).order_by(Schedule.start.asc())
+        stmt = _order_by_rank(stmt.offset(offset).limit(page_size), rank)
 
         # Eksekusi query dan ambil hasilnya
         results = db.scalars(stmt).all()
@@ -158,16 +224,14 @@ def get_schedule_cms(
         Schedule.deleted_at.is_(None),
     )
 
+    rank = None
     if search is not None:
-        search_term = Schedule.title.ilike(f"%{search}%")
+        search_term, rank = _search_terms(search)
         stmt = stmt.where(search_term)
         stmt_count = stmt_count.where(search_term)
 
     if schedule_date is not None:
-        date_term = or_(
-            func.date(Schedule.start) == schedule_date,
-            func.date(Schedule.end) == schedule_date,
-        )
+        date_term = _date_term(schedule_date)
         stmt = stmt.where(date_term)
         stmt_count = stmt_count.where(date_term)
 
@@ -176,10 +240,10 @@ def get_schedule_cms(
     if not all and page is not None and page_size is not None:
         limit = page_size
         offset = (page - 1) * limit
-        stmt = stmt.order_by(Schedule.start.asc()).limit(limit).offset(offset)
+        stmt = _order_by_rank(stmt, rank).limit(limit).offset(offset)
         num_page = ceil(num_data / limit) if num_data > 0 else 1
     else:
-        stmt = stmt.order_by(Schedule.start.asc())
+        stmt = _order_by_rank(stmt, rank)
 
     results = db.execute(stmt).scalars().all()
 
@@ -223,9 +287,7 @@ def create_schedule(
     return schedule
 
 
-def get_schedule_by_id(
-    db: Session, schedule_id: Union[UUID, str], include_deleted: bool = False
-) -> Optional[Schedule]:
+def _schedule_by_id_stmt(schedule_id: Union[UUID, str], include_deleted: bool):
     stmt = (
         select(Schedule)
         .options(
@@ -241,6 +303,13 @@ def get_schedule_by_id(
     if not include_deleted:
         stmt = stmt.where(Schedule.deleted_at.is_(None))
 
+    return stmt
+
+
+def get_schedule_by_id(
+    db: Session, schedule_id: Union[UUID, str], include_deleted: bool = False
+) -> Optional[Schedule]:
+    stmt = _schedule_by_id_stmt(schedule_id, include_deleted)
     return db.execute(stmt).scalar_one_or_none()
 
 
@@ -279,6 +348,92 @@ def is_speaker_already_scheduled(
     return bool(result)
 
 
+def _overlaps(start: datetime, end: datetime):
+    return Schedule.time_range.overlaps(func.tstzrange(start, end, type_=TSTZRANGE))
+
+
+def get_room_conflict(
+    db: Session,
+    room_id: Union[UUID, str],
+    start: datetime,
+    end: datetime,
+    exclude_schedule_id: Optional[Union[UUID, str]] = None,
+) -> Optional[Schedule]:
+    """An active schedule in the room overlapping [start, end), if any"""
+    if not start < end:
+        return None
+    stmt = select(Schedule).where(
+        Schedule.room_id == room_id,
+        Schedule.deleted_at.is_(None),
+        _overlaps(start, end),
+    )
+    if exclude_schedule_id is not None:
+        stmt = stmt.where(Schedule.id != exclude_schedule_id)
+    return db.execute(stmt.limit(1)).scalar_one_or_none()
+
+
+def is_room_conflict(error: IntegrityError) -> bool:
+    """Whether `error` is the room/time exclusion constraint, i.e. lost a race"""
+    return (
+        isinstance(error.orig, ExclusionViolation)
+        and error.orig.diag.constraint_name == ROOM_TIME_CONSTRAINT
+    )
+
+
+def get_room_conflicts(
+    db: Session, schedules: List[ValidateScheduleItem]
+) -> List[ScheduleConflict]:
+    """
+    Overlaps in the same room among `schedules`, and between them and the
+    saved active schedules they don't move
+
+    One query loads the saved schedules in those rooms and the time span of
+    `schedules`, the overlaps are found with an interval tree per room.
+    """
+    # An item moved to an empty interval still frees its saved one
+    moved_ids = [item.id for item in schedules if item.id is not None]
+    items = [item for item in schedules if item.start < item.end]
+    if not items:
+        return []
+
+    stmt = select(
+        Schedule.id, Schedule.room_id, Schedule.title, Schedule.start, Schedule.end
+    ).where(
+        Schedule.room_id.in_({item.room_id for item in items}),
+        Schedule.deleted_at.is_(None),
+        _overlaps(min(item.start for item in items), max(item.end for item in items)),
+    )
+    if moved_ids:
+        stmt = stmt.where(Schedule.id.not_in(moved_ids))
+
+    slots = defaultdict(list)
+    for row in db.execute(stmt):
+        slot = ScheduleSlot(id=row.id, title=row.title, start=row.start, end=row.end)
+        slots[row.room_id].append((row.start, row.end, slot))
+    requested = [
+        ScheduleSlot(
+            index=index, id=item.id, title=item.title, start=item.start, end=item.end
+        )
+        for index, item in enumerate(schedules)
+    ]
+    for item, slot in zip(schedules, requested):
+        slots[item.room_id].append((item.start, item.end, slot))
+    trees = {room_id: IntervalTree(intervals) for room_id, intervals in slots.items()}
+
+    conflicts = []
+    for item, slot in zip(schedules, requested):
+        for other in trees[item.room_id].overlapping(item.start, item.end):
+            # Pairs within the request are reported once, by the first item
+            if other.index is not None and other.index <= slot.index:
+                continue
+            conflicts.append(
+                ScheduleConflict(
+                    room_id=item.room_id, schedule=slot, conflicts_with=other
+                )
+            )
+    return conflicts
+
+
 def update_schedule(
     db: Session,
     schedule: Schedule,
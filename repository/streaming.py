@@ -3,7 +3,7 @@ from typing import Optional, Union
 from uuid import UUID
 
 from sqlalchemy import select
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload
 
 from models.Schedule import Schedule
 from models.Stream import Stream, StreamStatus
@@ -38,7 +38,11 @@ def create_stream(
 
 
 def get_stream_by_id(db: Session, stream_id: Union[UUID, str]) -> Optional[Stream]:
-    stmt = select(Stream).where(Stream.id == stream_id)
+    stmt = (
+        select(Stream)
+        .options(joinedload(Stream.schedule))
+        .where(Stream.id == stream_id)
+    )
     return db.execute(stmt).scalar_one_or_none()
 
 
@@ -1,4 +1,4 @@
-from sqlalchemy import select
+from sqlalchemy import lambda_stmt, select
 from sqlalchemy.orm import Session
 from models.Ticket import Ticket
 
@@ -7,6 +7,12 @@ def get_active_tickets(db: Session):
     return db.query(Ticket).filter(Ticket.is_active).all()
 
 
+def _active_ticket_by_id_stmt(ticket_id: str):
+    # Built and compiled once, later calls only bind ticket_id
+    return lambda_stmt(
+        lambda: select(Ticket).where(Ticket.id == ticket_id, Ticket.is_active)
+    )
+
+
 def get_active_ticket_by_id(db: Session, ticket_id: str):
-    query = select(Ticket).where(Ticket.id == ticket_id, Ticket.is_active)
-    return db.execute(query).scalars().first()
+    return db.execute(_active_ticket_by_id_stmt(ticket_id)).scalars().first()
@@ -2,7 +2,7 @@ from datetime import datetime
 from typing import Literal, Optional
 from pytz import timezone
 from sqlalchemy import select
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload
 from models.Volunteer import Volunteer
 from models.User import User
 
@@ -11,7 +11,7 @@ def get_all_volunteers(
     db: Session, search: Optional[str] = None, order_dir: Literal["asc", "desc"] = "asc"
 ) -> list[Volunteer]:
     # Query dasar
-    stmt = select(Volunteer)
+    stmt = select(Volunteer).options(joinedload(Volunteer.user))
 
     if search:
         search_pattern = f"%{search}%"
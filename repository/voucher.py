@@ -1,5 +1,5 @@
 from typing import Optional
-from sqlalchemy import select, func
+from sqlalchemy import lambda_stmt, select, func
 from sqlalchemy.orm import Session
 from models.Voucher import Voucher
 from schemas.voucher import VoucherResponseItem
@@ -145,9 +145,13 @@ def get_vouchers_per_page(
     }
 
 
+def _voucher_by_code_stmt(code: str):
+    # Built and compiled once, later calls only bind code
+    return lambda_stmt(lambda: select(Voucher).where(func.upper(Voucher.code) == code))
+
+
 def get_voucher_by_code(db: Session, code: str) -> Optional[Voucher]:
-    stmt = select(Voucher).where(func.upper(Voucher.code) == code.strip().upper())
-    voucher = db.execute(stmt).scalar()
+    voucher = db.execute(_voucher_by_code_stmt(code.strip().upper())).scalar()
     return voucher
 
 
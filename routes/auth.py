@@ -18,11 +18,12 @@ from core.responses import (
     handle_http_exception,
 )
 from core.security import (
-    generate_hash_password,
+    generate_hash_password_async,
     generate_token_from_user,
-    get_user_from_token,
+    get_principal_from_token,
     invalidate_token,
-    validated_password,
+    password_needs_rehash,
+    validated_password_async,
     oauth2_scheme,
 )
 from models import get_db_sync
@@ -68,10 +69,14 @@ async def swagger_form_token(
     if not user.is_active:
         return common_response(BadRequest(message="Invalid Credentials"))
 
-    is_valid = validated_password(user.password, form_data.password)
+    is_valid = await validated_password_async(user.password, form_data.password)
     if not is_valid:
         return common_response(BadRequest(message="Invalid Credentials"))
 
+    if password_needs_rehash(user.password):
+        # Saved with the token below
+        user.password = await generate_hash_password_async(form_data.password)
+
     (token, refresh_token) = await generate_token_from_user(db=db, user=user)
 
     return {"access_token": token, "token_type": "bearer"}
@@ -86,7 +91,7 @@ async def swagger_form_token(
     },
 )
 async def me(db: Session = Depends(get_db_sync), token: str = Depends(oauth2_scheme)):
-    user = get_user_from_token(db=db, token=token)
+    user = get_principal_from_token(db=db, token=token)
     if user is None:
         return common_response(Unauthorized(message="Invalid Credentials"))
 
@@ -112,7 +117,7 @@ async def me(db: Session = Depends(get_db_sync), token: str = Depends(oauth2_sch
 async def logout(
     db: Session = Depends(get_db_sync), token: str = Depends(oauth2_scheme)
 ):
-    user = get_user_from_token(db=db, token=token)
+    user = get_principal_from_token(db=db, token=token)
     if user is None:
         return common_response(Unauthorized(message="Invalid Credentials"))
 
@@ -144,7 +149,7 @@ async def email_signup(request: SignUpRequest, db: Session = Depends(get_db_sync
             email_verification=existing_verification,
             email=request.email,
             username=request.username,
-            password=generate_hash_password(request.password),
+            password=await generate_hash_password_async(request.password),
             verification_code=verification_code,
             expired_at=expired_at,
             is_commit=False,
@@ -154,7 +159,7 @@ async def email_signup(request: SignUpRequest, db: Session = Depends(get_db_sync
             db=db,
             email=request.email,
             username=request.username,
-            password=generate_hash_password(request.password),
+            password=await generate_hash_password_async(request.password),
             verification_code=verification_code,
             expired_at=expired_at,
             is_commit=False,
@@ -240,10 +245,14 @@ async def email_signin(request: LoginEmailRequest, db: Session = Depends(get_db_
     if not user.is_active:
         return common_response(BadRequest(message="Invalid Credentials"))
 
-    is_valid = validated_password(user.password, request.password)
+    is_valid = await validated_password_async(user.password, request.password)
     if not is_valid:
         return common_response(BadRequest(message="Invalid Credentials"))
 
+    if password_needs_rehash(user.password):
+        # Saved with the token below
+        user.password = await generate_hash_password_async(request.password)
+
     (token, refresh_token) = await generate_token_from_user(db=db, user=user)
     return common_response(
         Ok(
@@ -326,7 +335,7 @@ async def reset_password(
     if not user:
         return common_response(BadRequest(message="User tidak ditemukan"))
 
-    user.password = generate_hash_password(request.new_password)
+    user.password = await generate_hash_password_async(request.new_password)
     user.updated_at = datetime.now().astimezone(timezone(TZ))
     db.add(user)
 
@@ -1,8 +1,9 @@
 import traceback
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request
 from sqlalchemy.orm import Session
 
-from core.responses import InternalServerError, Ok, common_response
+from core.responses import InternalServerError, common_response, json_body
+from core.snapshot_cache import cached_response, location_snapshot
 from models import get_db_sync
 from schemas.common import InternalServerErrorResponse
 from schemas.locations import (
@@ -26,27 +27,30 @@ router = APIRouter(prefix="/locations", tags=["Locations"])
     },
 )
 async def get_countries(
+    request: Request,
     query: CountryDropdownQuery = Depends(),
     db: Session = Depends(get_db_sync),
 ):
-    try:
-        countries = locationRepo.get_all_countries(
-            db=db, search=query.search, limit=query.limit
-        )
-        return common_response(
-            Ok(
-                data={
-                    "limit": query.limit,
-                    "results": [
-                        {"id": country.id, "name": country.name, "iso2": country.iso2}
-                        for country in countries
-                    ],
-                }
+    key = ("countries", query.search, query.limit)
+
+    def build():
+        try:
+            countries = locationRepo.get_all_countries(
+                db=db, search=query.search, limit=query.limit
             )
-        )
-    except Exception as e:
-        traceback.print_exc()
-        return common_response(InternalServerError(error=str(e)))
+            data = {
+                "limit": query.limit,
+                "results": [
+                    {"id": country.id, "name": country.name, "iso2": country.iso2}
+                    for country in countries
+                ],
+            }
+        except Exception as e:
+            traceback.print_exc()
+            return common_response(InternalServerError(error=str(e)))
+        return json_body(data)
+
+    return cached_response(location_snapshot, key, request, build)
 
 
 @router.get(
@@ -57,35 +61,37 @@ async def get_countries(
     },
 )
 async def get_states(
+    request: Request,
     query: StateDropdownQuery = Depends(),
     db: Session = Depends(get_db_sync),
 ):
-    try:
-        states = locationRepo.get_all_states(
-            db=db,
-            country_id=query.country_id,
-            search=query.search,
-            limit=query.limit,
-        )
+    key = ("states", query.country_id, query.search, query.limit)
 
-        return common_response(
-            Ok(
-                data={
-                    "limit": query.limit,
-                    "results": [
-                        {
-                            "id": state.id,
-                            "name": state.name,
-                            "country_id": state.country_id,
-                        }
-                        for state in states
-                    ],
-                }
+    def build():
+        try:
+            states = locationRepo.get_all_states(
+                db=db,
+                country_id=query.country_id,
+                search=query.search,
+                limit=query.limit,
             )
-        )
-    except Exception as e:
-        traceback.print_exc()
-        return common_response(InternalServerError(error=str(e)))
+            data = {
+                "limit": query.limit,
+                "results": [
+                    {
+                        "id": state.id,
+                        "name": state.name,
+                        "country_id": state.country_id,
+                    }
+                    for state in states
+                ],
+            }
+        except Exception as e:
+            traceback.print_exc()
+            return common_response(InternalServerError(error=str(e)))
+        return json_body(data)
+
+    return cached_response(location_snapshot, key, request, build)
 
 
 @router.get(
@@ -96,33 +102,35 @@ async def get_states(
     },
 )
 async def get_cities(
+    request: Request,
     query: CityDropdownQuery = Depends(),
     db: Session = Depends(get_db_sync),
 ):
-    try:
-        cities = locationRepo.get_all_cities(
-            db=db,
-            state_id=query.state_id,
-            search=query.search,
-            limit=query.limit,
-        )
+    key = ("cities", query.state_id, query.search, query.limit)
 
-        return common_response(
-            Ok(
-                data={
-                    "limit": query.limit,
-                    "results": [
-                        {
-                            "id": city.id,
-                            "name": city.name,
-                            "state_id": city.state_id,
-                            "country_id": city.country_id,
-                        }
-                        for city in cities
-                    ],
-                }
+    def build():
+        try:
+            cities = locationRepo.get_all_cities(
+                db=db,
+                state_id=query.state_id,
+                search=query.search,
+                limit=query.limit,
             )
-        )
-    except Exception as e:
-        traceback.print_exc()
-        return common_response(InternalServerError(error=str(e)))
+            data = {
+                "limit": query.limit,
+                "results": [
+                    {
+                        "id": city.id,
+                        "name": city.name,
+                        "state_id": city.state_id,
+                        "country_id": city.country_id,
+                    }
+                    for city in cities
+                ],
+            }
+        except Exception as e:
+            traceback.print_exc()
+            return common_response(InternalServerError(error=str(e)))
+        return json_body(data)
+
+    return cached_response(location_snapshot, key, request, build)
@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request
 from fastapi.responses import FileResponse
 from sqlalchemy.orm import Session
 from core.file import get_file
@@ -12,9 +12,11 @@ from core.responses import (
     Ok,
     Unauthorized,
     common_response,
+    json_body,
 )
 
 from core.security import check_permissions, get_current_user
+from core.snapshot_cache import cached_response, organizer_snapshot
 from models import get_db_sync
 from models.User import MANAGEMENT_PARTICIPANT, User
 from repository.organizer import (
@@ -98,20 +100,28 @@ def get_organizers_grouped_by_type(
     },
 )
 def get_organizers_public(
+    request: Request,
     db: Session = Depends(get_db_sync),
     query: OrganizerQuery = Depends(),
 ):
     logger.info("Fetching all organizers")
-    try:
-        data = get_all_organizers(db=db, search=query.search, order_dir=query.order_dir)
-        if data is None:
-            return common_response(NotFound(message="No organizers found"))
+    key = (query.search, query.order_dir)
 
-        model_data = organizer_detail_response_list_from_models(data)
-        return common_response(Ok(data=model_data.model_dump()))
-    except Exception as e:
-        logger.error(f"Error fetching organizers by type: {e}")
-        return common_response(InternalServerError(error=str(e)))
+    def build():
+        try:
+            data = get_all_organizers(
+                db=db, search=query.search, order_dir=query.order_dir
+            )
+            if data is None:
+                return common_response(NotFound(message="No organizers found"))
+
+            model_data = organizer_detail_response_list_from_models(data)
+        except Exception as e:
+            logger.error(f"Error fetching organizers by type: {e}")
+            return common_response(InternalServerError(error=str(e)))
+        return json_body(model_data.model_dump())
+
+    return cached_response(organizer_snapshot, key, request, build)
 
 
 @router.get(
@@ -1,7 +1,8 @@
 import traceback
 from uuid import UUID
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from core.log import logger
@@ -17,7 +18,8 @@ from core.responses import (
     Unauthorized,
     common_response,
 )
-from core.security import get_user_from_token, oauth2_scheme
+from core.security import get_principal_from_token, oauth2_scheme
+from core.snapshot_cache import cached_response, schedule_snapshot
 from models import get_db_sync
 from models.Stream import StreamStatus
 from models.User import MANAGEMENT_PARTICIPANT
@@ -57,6 +59,8 @@ from schemas.schedule import (
     ScheduleTypeInfo,
     SimplePublicSpeakerInfo,
     UpdateScheduleRequest,
+    ValidateScheduleRequest,
+    ValidateScheduleResponse,
 )
 
 router = APIRouter(prefix="/schedule", tags=["Schedule"])
@@ -79,7 +83,7 @@ async def create_schedule(
 ):
     mux_stream_id = None
     try:
-        current_user = get_user_from_token(db=db, token=token)
+        current_user = get_principal_from_token(db=db, token=token)
         if current_user is None:
             return common_response(Unauthorized(message="Unauthorized"))
 
@@ -112,6 +116,14 @@ async def create_schedule(
                     )
                 )
 
+        conflict = scheduleRepo.get_room_conflict(
+            db=db, room_id=request.room_id, start=request.start, end=request.end
+        )
+        if conflict is not None:
+            return common_response(
+                BadRequest(message=f"Room is already booked for {conflict.title}")
+            )
+
         # Create schedule
         schedule = scheduleRepo.create_schedule(
             db=db,
@@ -160,6 +172,13 @@ async def create_schedule(
             )
         )
 
+    except IntegrityError as e:
+        # Booked concurrently, after the conflict check
+        db.rollback()
+        if scheduleRepo.is_room_conflict(e):
+            return common_response(BadRequest(message="Room is already booked"))
+        logger.error(f"Failed to create schedule: {e}")
+        return common_response(InternalServerError(error=str(e)))
     except Exception as e:
         logger.error(f"Failed to create schedule: {e}")
         if mux_stream_id is not None:
@@ -167,6 +186,46 @@ async def create_schedule(
         return common_response(InternalServerError(error=str(e)))
 
 
+@router.post(
+    "/validate",
+    responses={
+        "200": {"model": ValidateScheduleResponse},
+        "401": {"model": UnauthorizedResponse},
+        "403": {"model": ForbiddenResponse},
+        "500": {"model": InternalServerErrorResponse},
+    },
+)
+async def validate_schedule(
+    request: ValidateScheduleRequest,
+    db: Session = Depends(get_db_sync),
+    token: str = Depends(oauth2_scheme),
+):
+    """
+    Room conflicts of a whole programme, among the given schedules and with
+    the saved ones, without saving anything
+    """
+    try:
+        current_user = get_principal_from_token(db=db, token=token)
+        if current_user is None:
+            return common_response(Unauthorized(message="Unauthorized"))
+
+        if current_user.participant_type != MANAGEMENT_PARTICIPANT:
+            return common_response(Forbidden())
+
+        conflicts = scheduleRepo.get_room_conflicts(db=db, schedules=request.schedules)
+
+        return common_response(
+            Ok(
+                data=ValidateScheduleResponse(conflicts=conflicts).model_dump(
+                    mode="json"
+                )
+            )
+        )
+    except Exception as e:
+        logger.error(f"Failed to validate schedule: {e}")
+        return common_response(InternalServerError(error=str(e)))
+
+
 @router.get(
     "/cms",
     responses={
@@ -181,7 +240,7 @@ async def get_schedule_cms(
     token: str = Depends(oauth2_scheme),
 ):
     try:
-        current_user = get_user_from_token(db=db, token=token)
+        current_user = get_principal_from_token(db=db, token=token)
         if current_user is None:
             return common_response(Unauthorized(message="Unauthorized"))
 
@@ -283,7 +342,7 @@ async def get_mux_stream_by_schedule_id(
     token: str = Depends(oauth2_scheme),
 ):
     try:
-        current_user = get_user_from_token(db=db, token=token)
+        current_user = get_principal_from_token(db=db, token=token)
         if current_user is None:
             return common_response(Unauthorized(message="Unauthorized"))
 
@@ -329,7 +388,7 @@ async def update_schedule(
     token: str = Depends(oauth2_scheme),
 ):
     try:
-        current_user = get_user_from_token(db=db, token=token)
+        current_user = get_principal_from_token(db=db, token=token)
         if current_user is None:
             return common_response(Unauthorized(message="Unauthorized"))
 
@@ -377,6 +436,18 @@ async def update_schedule(
                 BadRequest(message="End time must be after start time")
             )
 
+        conflict = scheduleRepo.get_room_conflict(
+            db=db,
+            room_id=request.room_id,
+            start=start_time,
+            end=request.end,
+            exclude_schedule_id=schedule.id,
+        )
+        if conflict is not None:
+            return common_response(
+                BadRequest(message=f"Room is already booked for {conflict.title}")
+            )
+
         updated_schedule = scheduleRepo.update_schedule(
             db=db,
             schedule=schedule,
@@ -400,6 +471,13 @@ async def update_schedule(
                 )
             )
         )
+    except IntegrityError as e:
+        # Booked concurrently, after the conflict check
+        db.rollback()
+        if scheduleRepo.is_room_conflict(e):
+            return common_response(BadRequest(message="Room is already booked"))
+        logger.error(f"Failed to update schedule by id {schedule_id}: {e}")
+        return common_response(InternalServerError(error=str(e)))
     except Exception as e:
         logger.error(f"Failed to update schedule by id {schedule_id}: {e}")
         return common_response(InternalServerError(error=str(e)))
@@ -424,7 +502,7 @@ async def recreate_stream(
     mux_stream_id = None
     old_mux_stream_id = None
     try:
-        current_user = get_user_from_token(db=db, token=token)
+        current_user = get_principal_from_token(db=db, token=token)
         if current_user is None:
             return common_response(Unauthorized(message="Unauthorized"))
 
@@ -503,7 +581,7 @@ async def delete_schedule(
     token: str = Depends(oauth2_scheme),
 ):
     try:
-        current_user = get_user_from_token(db=db, token=token)
+        current_user = get_principal_from_token(db=db, token=token)
         if current_user is None:
             return common_response(Unauthorized(message="Unauthorized"))
 
@@ -536,24 +614,37 @@ async def delete_schedule(
     },
 )
 async def get_schedule(
-    query: ScheduleQuery = Depends(), db: Session = Depends(get_db_sync)
+    request: Request,
+    query: ScheduleQuery = Depends(),
+    db: Session = Depends(get_db_sync),
 ):
-    try:
-        if query.all:
-            data = scheduleRepo.get_all_schedules(
-                db=db,
-                search=query.search,
-                schedule_date=query.schedule_date,
-            )
-        else:
-            data = scheduleRepo.get_schedule_per_page_by_search(
-                db=db,
-                page=query.page if query.page else 1,
-                page_size=query.page_size if query.page_size else 10,
-                search=query.search,
-                schedule_date=query.schedule_date,
-            )
-    except Exception as e:
-        logger.error(f"Failed to get schedule: {e}")
-        return common_response(InternalServerError(error=str(e)))
-    return ScheduleResponse.model_validate(data)
+    key = (
+        query.all,
+        query.page,
+        query.page_size,
+        query.search,
+        query.schedule_date,
+    )
+
+    def build():
+        try:
+            if query.all:
+                data = scheduleRepo.get_all_schedules(
+                    db=db,
+                    search=query.search,
+                    schedule_date=query.schedule_date,
+                )
+            else:
+                data = scheduleRepo.get_schedule_per_page_by_search(
+                    db=db,
+                    page=query.page if query.page else 1,
+                    page_size=query.page_size if query.page_size else 10,
+                    search=query.search,
+                    schedule_date=query.schedule_date,
+                )
+        except Exception as e:
+            logger.error(f"Failed to get schedule: {e}")
+            return common_response(InternalServerError(error=str(e)))
+        return ScheduleResponse.model_validate(data).model_dump_json().encode()
+
+    return cached_response(schedule_snapshot, key, request, build)
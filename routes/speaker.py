@@ -1,7 +1,7 @@
 from datetime import datetime
 from uuid import UUID
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request
 from fastapi.responses import FileResponse
 from pytz import timezone
 from sqlalchemy.orm import Session
@@ -17,8 +17,10 @@ from core.responses import (
     Ok,
     Unauthorized,
     common_response,
+    json_body,
 )
 from core.security import get_current_user
+from core.snapshot_cache import cached_response, speaker_snapshot
 from models import get_db_sync
 from models.User import MANAGEMENT_PARTICIPANT, User
 from repository import schedule as scheduleRepo
@@ -86,22 +88,23 @@ async def get_speaker(
         "500": {"model": InternalServerErrorResponse},
     },
 )
-async def get_speaker_public(db: Session = Depends(get_db_sync)):
-    try:
-        speakers = speakerRepo.get_all_speakers_public(db=db)
-
-        speaker_schemas: list[PublicSpeakerInfo] = [
-            PublicSpeakerInfo.model_validate(s) for s in speakers
-        ]
-
-        return common_response(
-            Ok(data=AllSpeakerResponse(results=speaker_schemas).model_dump(mode="json"))
-        )
-    except Exception as e:
-        import traceback
-
-        traceback.print_exc()
-        return common_response(InternalServerError(error=str(e)))
+async def get_speaker_public(request: Request, db: Session = Depends(get_db_sync)):
+    def build():
+        try:
+            speakers = speakerRepo.get_all_speakers_public(db=db)
+
+            speaker_schemas: list[PublicSpeakerInfo] = [
+                PublicSpeakerInfo.model_validate(s) for s in speakers
+            ]
+            data = AllSpeakerResponse(results=speaker_schemas).model_dump(mode="json")
+        except Exception as e:
+            import traceback
+
+            traceback.print_exc()
+            return common_response(InternalServerError(error=str(e)))
+        return json_body(data)
+
+    return cached_response(speaker_snapshot, "public", request, build)
 
 
 @router.get(
@@ -18,7 +18,7 @@ from core.responses import (
     common_response,
     handle_http_exception,
 )
-from core.security import get_user_from_token, oauth2_scheme
+from core.security import get_principal_from_token, oauth2_scheme
 from models import get_db_sync
 from models.Stream import StreamStatus
 from repository import streaming as streamingRepo
@@ -51,7 +51,7 @@ async def get_stream_playback(
     token: str = Depends(oauth2_scheme),
 ):
     try:
-        current_user = get_user_from_token(db=db, token=token)
+        current_user = get_principal_from_token(db=db, token=token)
         if current_user is None:
             return common_response(Unauthorized(message="Unauthorized"))
 
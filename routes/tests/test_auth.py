@@ -9,9 +9,14 @@ import pytz
 from fastapi.testclient import TestClient
 from sqlalchemy import select
 from core.oauth import github_service, google_service
-from core.security import generate_hash_password
+from core.password_hasher import PasswordHasher
+from core.security import (
+    generate_hash_password,
+    password_needs_rehash,
+    validated_password,
+)
 from models import engine, db, get_db_sync, get_db_sync_for_test
-from models.Token import Token
+from models.Token import Token, hash_token
 from models.User import User
 from main import app
 from settings import SECRET_KEY, ALGORITHM, FRONTEND_BASE_URL
@@ -114,6 +119,81 @@ class TestAuth(IsolatedAsyncioTestCase):
         # Expect 5
         self.assertEqual(response.status_code, 401)
 
+    async def test_signin_twice_stores_token_hashes(self):
+        # Given
+        new_user = User(
+            username="testuser",
+            email="testuser@example.com",
+            password=generate_hash_password("password"),
+            is_active=True,
+        )
+        self.db.add(new_user)
+        self.db.commit()
+        app.dependency_overrides[get_db_sync] = get_db_sync_for_test(db=self.db)
+        client = TestClient(app)
+
+        # When 1, two sessions within the same second
+        tokens = [
+            client.post(
+                "/auth/email/signin/",
+                json={"email": "testuser@example.com", "password": "password"},
+            ).json()["token"]
+            for _ in range(2)
+        ]
+
+        # Expect 1
+        self.assertNotEqual(tokens[0], tokens[1])
+        stmt = select(Token.token_hash).where(Token.user_id == new_user.id)
+        self.assertEqual(
+            set(self.db.execute(stmt).scalars()), {hash_token(t) for t in tokens}
+        )
+
+        # When 2
+        response = client.post(
+            "/auth/logout/",
+            headers={"Authorization": f"Bearer {tokens[0]}"},
+        )
+
+        # Expect 2, only the presented session ends
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            client.get(
+                "/auth/me/", headers={"Authorization": f"Bearer {tokens[0]}"}
+            ).status_code,
+            401,
+        )
+        self.assertEqual(
+            client.get(
+                "/auth/me/", headers={"Authorization": f"Bearer {tokens[1]}"}
+            ).status_code,
+            200,
+        )
+
+    async def test_signin_rehashes_password_with_other_rounds(self):
+        # Given
+        new_user = User(
+            username="testuser",
+            email="testuser@example.com",
+            password=PasswordHasher(rounds=4).hash("password"),
+            is_active=True,
+        )
+        self.db.add(new_user)
+        self.db.commit()
+        app.dependency_overrides[get_db_sync] = get_db_sync_for_test(db=self.db)
+        client = TestClient(app)
+
+        # When
+        response = client.post(
+            "/auth/email/signin/",
+            json={"email": "testuser@example.com", "password": "password"},
+        )
+
+        # Expect
+        self.assertEqual(response.status_code, 200)
+        self.db.refresh(new_user)
+        self.assertFalse(password_needs_rehash(new_user.password))
+        self.assertTrue(validated_password(new_user.password, "password"))
+
     # Oauth Github
     async def test_github_oauth_signin_endpoint(self):
         app.dependency_overrides[get_db_sync] = get_db_sync_for_test(db=self.db)
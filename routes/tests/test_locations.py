@@ -2,6 +2,8 @@ import alembic.config
 from unittest import IsolatedAsyncioTestCase
 
 from fastapi.testclient import TestClient
+from core.snapshot_cache import clear_snapshots
+from routes.tests.utils import assert_revalidates
 from models import engine, db, get_db_sync, get_db_sync_for_test
 from models.Country import Country
 from models.State import State
@@ -22,6 +24,7 @@ class TestLocations(IsolatedAsyncioTestCase):
         # bind an individual Session to the connection, selecting
         # "create_savepoint" join_transaction_mode
         self.db = db(bind=self.connection, join_transaction_mode="create_savepoint")
+        clear_snapshots()
 
         # Setup sample data
         self._setup_sample_data()
@@ -254,6 +257,23 @@ class TestLocations(IsolatedAsyncioTestCase):
             "Should find Jakarta Pusat",
         )
 
+    async def test_get_cities_not_modified(self):
+        # Given
+        client = TestClient(app)
+
+        def rename():
+            self.db.get(City, 38932).name = "Jakarta Central"
+            self.db.commit()
+
+        # When
+        changed = assert_revalidates(
+            client, "/locations/cities/?state_id=1836", rename, self.connection
+        )
+
+        # Expect
+        names = [city["name"] for city in changed.json()["results"]]
+        self.assertIn("Jakarta Central", names)
+
     def tearDown(self):
         self.db.close()
 
@@ -6,6 +6,8 @@ from unittest import IsolatedAsyncioTestCase
 from fastapi.testclient import TestClient
 from sqlalchemy import select
 from core.security import generate_token_from_user
+from core.snapshot_cache import clear_snapshots
+from routes.tests.utils import assert_revalidates
 from models import engine, db, get_db_sync, get_db_sync_for_test
 from models.Organizer import Organizer
 from models.OrganizerType import OrganizerType
@@ -27,6 +29,7 @@ class TestOrganizer(IsolatedAsyncioTestCase):
         # bind an individual Session to the connection, selecting
         # "create_savepoint" join_transaction_mode
         self.db = db(bind=self.connection, join_transaction_mode="create_savepoint")
+        clear_snapshots()
 
     async def test_get_all_organizers(self):
         # Given
@@ -521,6 +524,27 @@ class TestOrganizer(IsolatedAsyncioTestCase):
         # Expect
         self.assertEqual(response.status_code, 401)
 
+    async def test_get_organizers_public_not_modified(self):
+        # Given
+        organizer_type = OrganizerType(name="Core Team")
+        user = User(username="etag_organizer", first_name="John")
+        self.db.add(Organizer(user=user, organizer_type=organizer_type))
+        self.db.commit()
+        app.dependency_overrides[get_db_sync] = get_db_sync_for_test(db=self.db)
+        client = TestClient(app)
+
+        def rename():
+            user.first_name = "Johnny"
+            self.db.commit()
+
+        # When
+        changed = assert_revalidates(
+            client, "/organizer/public", rename, self.connection
+        )
+
+        # Expect
+        self.assertEqual(changed.json()["results"][0]["user"]["first_name"], "Johnny")
+
     def tearDown(self):
         self.db.close()
 
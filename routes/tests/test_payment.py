@@ -14,6 +14,8 @@ from models.Payment import PaymentStatus
 from models.Token import Token
 from models.Voucher import Voucher
 from core.security import generate_hash_password
+from routes.tests.utils import assert_max_queries
+from core.user_cache import user_principal_cache
 from repository import payment as paymentRepo
 from main import app
 from settings import TZ, SECRET_KEY, ALGORITHM, ACCESS_TOKEN_EXPIRE_MINUTES
@@ -315,6 +317,33 @@ class TestPayment(IsolatedAsyncioTestCase):
             any(p["status"] == PaymentStatus.PAID.value for p in data["results"])
         )
 
+    async def test_list_payments_query_count(self):
+        for i in range(5):
+            paymentRepo.create_payment(
+                db=self.db,
+                user_id=str(self.test_user.id),
+                ticket_id=str(self.test_ticket.id),
+                payment_link=f"https://mayar.id/pay/link{i}",
+                amount=500000,
+                description=f"Payment {i}",
+                status=PaymentStatus.UNPAID,
+                mayar_id=f"mayar-id-{i}",
+                mayar_transaction_id=f"mayar-tx-{i}",
+                voucher_id=self.test_voucher.id,
+            )
+        self.db.commit()
+        self.db.expunge_all()
+        user_principal_cache.clear()
+
+        with assert_max_queries(4, self.connection):
+            response = self.client.get(
+                "/payment/",
+                headers={"Authorization": f"Bearer {self.test_token}"},
+            )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.json()["results"]), 5)
+
     async def test_list_payments_unauthorized(self):
         response = self.client.get("/payment/")
 
@@ -5,7 +5,10 @@ from unittest.mock import patch
 
 import alembic.config
 from fastapi.testclient import TestClient
+from pytz import timezone
+from sqlalchemy import event
 
+from core.snapshot_cache import schedule_snapshot
 from core.security import generate_token_from_user
 from main import app
 from models import db, engine, get_db_sync, get_db_sync_for_test
@@ -16,7 +19,9 @@ from models.Speaker import Speaker
 from models.SpeakerType import SpeakerType
 from models.Stream import Stream, StreamStatus
 from models.User import MANAGEMENT_PARTICIPANT, User
+from routes.tests.utils import assert_max_queries, assert_revalidates
 from schemas.user_profile import ParticipantType
+from settings import TZ
 
 
 class TestSchedule(IsolatedAsyncioTestCase):
@@ -32,6 +37,7 @@ class TestSchedule(IsolatedAsyncioTestCase):
         # bind an individual Session to the connection, selecting
         # "create_savepoint" join_transaction_mode
         self.db = db(bind=self.connection, join_transaction_mode="create_savepoint")
+        schedule_snapshot.clear()
 
         # Create test data
         self.user_management = User(
@@ -457,6 +463,308 @@ class TestSchedule(IsolatedAsyncioTestCase):
         # Expect
         self.assertEqual(response.status_code, 404)
 
+    def _book_room(self, title, start, end, room=None):
+        schedule = Schedule(
+            title=title,
+            room_id=(room or self.room).id,
+            schedule_type_id=self.schedule_type.id,
+            start=start,
+            end=end,
+        )
+        self.db.add(schedule)
+        self.db.commit()
+        return schedule
+
+    def _schedule_payload(self, title, start, end):
+        return {
+            "title": title,
+            "room_id": str(self.room.id),
+            "schedule_type_id": str(self.schedule_type.id),
+            "start": start.isoformat(),
+            "end": end.isoformat(),
+        }
+
+    @patch("core.mux_service.mux_service.create_live_stream")
+    async def test_create_schedule_room_already_booked(self, mock_create_stream):
+        # Given
+        mock_create_stream.return_value = (
+            "mux_stream_123",
+            "stream_key_123",
+            "playback_id_123",
+        )
+        start_time = datetime.now(timezone(TZ)) + timedelta(hours=1)
+        self._book_room("Booked Talk", start_time, start_time + timedelta(hours=1))
+
+        token, _ = await generate_token_from_user(db=self.db, user=self.user_management)
+        app.dependency_overrides[get_db_sync] = get_db_sync_for_test(db=self.db)
+        client = TestClient(app)
+        headers = {"Authorization": f"Bearer {token}"}
+
+        # When
+        overlapping = client.post(
+            "/schedule/",
+            json=self._schedule_payload(
+                "Overlapping Talk",
+                start_time + timedelta(minutes=30),
+                start_time + timedelta(minutes=90),
+            ),
+            headers=headers,
+        )
+        back_to_back = client.post(
+            "/schedule/",
+            json=self._schedule_payload(
+                "Next Talk",
+                start_time + timedelta(hours=1),
+                start_time + timedelta(hours=2),
+            ),
+            headers=headers,
+        )
+
+        # Expect
+        self.assertEqual(overlapping.status_code, 400)
+        self.assertEqual(
+            overlapping.json()["message"], "Room is already booked for Booked Talk"
+        )
+        self.assertEqual(back_to_back.status_code, 201)
+        mock_create_stream.assert_called_once()
+
+    @patch("core.mux_service.mux_service.create_live_stream")
+    @patch("repository.schedule.get_room_conflict", return_value=None)
+    async def test_create_schedule_room_booked_concurrently(
+        self, mock_get_room_conflict, mock_create_stream
+    ):
+        # Given, booked after the conflict check, the constraint catches it
+        start_time = datetime.now(timezone(TZ)) + timedelta(hours=1)
+        self._book_room("Booked Talk", start_time, start_time + timedelta(hours=1))
+
+        token, _ = await generate_token_from_user(db=self.db, user=self.user_management)
+        app.dependency_overrides[get_db_sync] = get_db_sync_for_test(db=self.db)
+        client = TestClient(app)
+
+        # When
+        response = client.post(
+            "/schedule/",
+            json=self._schedule_payload(
+                "Overlapping Talk",
+                start_time + timedelta(minutes=30),
+                start_time + timedelta(minutes=90),
+            ),
+            headers={"Authorization": f"Bearer {token}"},
+        )
+
+        # Expect
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json()["message"], "Room is already booked")
+        mock_get_room_conflict.assert_called_once()
+        mock_create_stream.assert_not_called()
+        titles = self.db.query(Schedule.title).all()
+        self.assertEqual(titles, [("Booked Talk",)])
+
+    async def test_update_schedule_room_already_booked(self):
+        # Given
+        start_time = datetime.now(timezone(TZ)) + timedelta(hours=1)
+        self._book_room("Booked Talk", start_time, start_time + timedelta(hours=1))
+        schedule = self._book_room(
+            "Later Talk",
+            start_time + timedelta(hours=3),
+            start_time + timedelta(hours=4),
+        )
+
+        token, _ = await generate_token_from_user(db=self.db, user=self.user_management)
+        app.dependency_overrides[get_db_sync] = get_db_sync_for_test(db=self.db)
+        client = TestClient(app)
+        headers = {"Authorization": f"Bearer {token}"}
+
+        # When
+        overlapping = client.put(
+            f"/schedule/{schedule.id}",
+            json=self._schedule_payload(
+                "Later Talk",
+                start_time + timedelta(minutes=30),
+                start_time + timedelta(minutes=90),
+            ),
+            headers=headers,
+        )
+        # Overlapping its own old slot is fine
+        moved = client.put(
+            f"/schedule/{schedule.id}",
+            json=self._schedule_payload(
+                "Later Talk",
+                start_time + timedelta(hours=2, minutes=30),
+                start_time + timedelta(hours=3, minutes=30),
+            ),
+            headers=headers,
+        )
+
+        # Expect
+        self.assertEqual(overlapping.status_code, 400)
+        self.assertEqual(
+            overlapping.json()["message"], "Room is already booked for Booked Talk"
+        )
+        self.assertEqual(moved.status_code, 200)
+
+    async def test_validate_schedule(self):
+        # Given
+        start = timezone(TZ).localize(datetime(2026, 10, 20, 9))
+        side_room = Room(name="Side Hall")
+        self.db.add(side_room)
+        keynote = self._book_room("Keynote", start, start + timedelta(hours=1))
+        lunch = self._book_room(
+            "Lunch", start + timedelta(hours=3), start + timedelta(hours=4)
+        )
+        cancelled = self._book_room(
+            "Cancelled", start + timedelta(hours=1), start + timedelta(hours=2)
+        )
+        cancelled.deleted_at = datetime.now()
+        self.db.commit()
+
+        token, _ = await generate_token_from_user(db=self.db, user=self.user_management)
+        app.dependency_overrides[get_db_sync] = get_db_sync_for_test(db=self.db)
+        client = TestClient(app)
+
+        def item(title, minutes, room=None, id=None):
+            return {
+                "id": id and str(id),
+                "title": title,
+                "room_id": str((room or self.room).id),
+                "start": (start + timedelta(minutes=minutes)).isoformat(),
+                "end": (start + timedelta(minutes=minutes + 60)).isoformat(),
+            }
+
+        payload = {
+            "schedules": [
+                item("Talk A", 30),
+                # Touches the keynote, overlaps talk A and the cancelled slot
+                item("Talk B", 60),
+                item("Talk C", 30, room=side_room),
+                item("Lunch", 300, id=lunch.id),
+                # Where lunch was
+                item("Talk D", 180),
+            ]
+        }
+
+        # When
+        response = client.post(
+            "/schedule/validate",
+            json=payload,
+            headers={"Authorization": f"Bearer {token}"},
+        )
+        naive = client.post(
+            "/schedule/validate",
+            json={"schedules": [{**item("Talk A", 30), "start": "2026-10-20T09:00"}]},
+            headers={"Authorization": f"Bearer {token}"},
+        )
+
+        # Expect
+        self.assertEqual(response.status_code, 200)
+        conflicts = response.json()["conflicts"]
+        self.assertEqual(
+            [
+                (
+                    conflict["room_id"],
+                    conflict["schedule"]["index"],
+                    conflict["conflicts_with"]["index"],
+                    conflict["conflicts_with"]["id"],
+                    conflict["conflicts_with"]["title"],
+                )
+                for conflict in conflicts
+            ],
+            [
+                (str(self.room.id), 0, None, str(keynote.id), "Keynote"),
+                (str(self.room.id), 0, 1, None, "Talk B"),
+            ],
+        )
+        self.assertEqual(naive.status_code, 422)
+        # Nothing is saved
+        self.db.refresh(lunch)
+        self.assertEqual(lunch.start, start + timedelta(hours=3))
+
+    async def test_validate_schedule_moved_to_empty_interval(self):
+        # Given
+        start = timezone(TZ).localize(datetime(2026, 10, 20, 9))
+        lunch = self._book_room("Lunch", start, start + timedelta(hours=1))
+        self.db.commit()
+
+        token, _ = await generate_token_from_user(db=self.db, user=self.user_management)
+        app.dependency_overrides[get_db_sync] = get_db_sync_for_test(db=self.db)
+        client = TestClient(app)
+        later = (start + timedelta(hours=5)).isoformat()
+        payload = {
+            "schedules": [
+                {
+                    "id": str(lunch.id),
+                    "title": "Lunch",
+                    "room_id": str(self.room.id),
+                    "start": later,
+                    "end": later,
+                },
+                # Where lunch was
+                {
+                    "title": "Talk",
+                    "room_id": str(self.room.id),
+                    "start": start.isoformat(),
+                    "end": (start + timedelta(hours=1)).isoformat(),
+                },
+            ]
+        }
+
+        # When
+        response = client.post(
+            "/schedule/validate",
+            json=payload,
+            headers={"Authorization": f"Bearer {token}"},
+        )
+
+        # Expect
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["conflicts"], [])
+
+    async def test_validate_schedule_in_one_query(self):
+        # Given
+        start = timezone(TZ).localize(datetime(2026, 10, 20, 9))
+        for hour in range(0, 300, 2):
+            self._book_room(
+                f"Saved {hour}",
+                start + timedelta(hours=hour),
+                start + timedelta(hours=hour + 1),
+            )
+        schedules = [
+            {
+                "title": f"Talk {hour}",
+                "room_id": str(self.room.id),
+                "start": (start + timedelta(hours=hour)).isoformat(),
+                "end": (start + timedelta(hours=hour + 1)).isoformat(),
+            }
+            for hour in range(1, 300, 2)
+        ]
+        # Starts before the previous saved schedule ends
+        schedules[-1]["start"] = (start + timedelta(hours=298, minutes=30)).isoformat()
+
+        token, _ = await generate_token_from_user(db=self.db, user=self.user_management)
+        app.dependency_overrides[get_db_sync] = get_db_sync_for_test(db=self.db)
+        client = TestClient(app)
+        # Warms the token and user caches
+        client.post(
+            "/schedule/validate",
+            json={"schedules": []},
+            headers={"Authorization": f"Bearer {token}"},
+        )
+
+        # When
+        with assert_max_queries(2, self.connection):
+            response = client.post(
+                "/schedule/validate",
+                json={"schedules": schedules},
+                headers={"Authorization": f"Bearer {token}"},
+            )
+
+        # Expect
+        self.assertEqual(response.status_code, 200)
+        conflicts = response.json()["conflicts"]
+        self.assertEqual(len(conflicts), 1)
+        self.assertEqual(conflicts[0]["schedule"]["index"], 149)
+        self.assertEqual(conflicts[0]["conflicts_with"]["title"], "Saved 298")
+
     @patch("core.mux_service.mux_service.delete_live_stream")
     async def test_delete_schedule_success(self, mock_delete_stream):
         # Given
@@ -974,6 +1282,78 @@ class TestSchedule(IsolatedAsyncioTestCase):
         self.assertGreater(data["count"], 0)
         self.assertGreaterEqual(len(data["results"]), 2)
 
+    async def test_get_schedule_list_snapshot(self):
+        # Given
+        start_time = datetime.now() + timedelta(hours=1)
+        schedule = Schedule(
+            title="Snapshot Talk",
+            speaker_id=self.speaker.id,
+            room_id=self.room.id,
+            schedule_type_id=self.schedule_type.id,
+            tags=["python"],
+            start=start_time,
+            end=start_time + timedelta(hours=1),
+        )
+        self.db.add(schedule)
+        self.db.commit()
+
+        app.dependency_overrides[get_db_sync] = get_db_sync_for_test(db=self.db)
+        client = TestClient(app)
+        params = {"page_size": 10, "page": 1}
+        first = client.get("/schedule/", params=params)
+
+        # When
+        with assert_max_queries(0, self.connection):
+            cached = client.get("/schedule/", params=params)
+        self.room.name = "Renamed Hall"
+        self.db.commit()
+        renamed = client.get("/schedule/", params=params)
+
+        # Expect
+        self.assertEqual(cached.status_code, 200)
+        self.assertEqual(cached.json(), first.json())
+        snapshot_talk = next(
+            item
+            for item in renamed.json()["results"]
+            if item["title"] == "Snapshot Talk"
+        )
+        self.assertEqual(snapshot_talk["room"]["name"], "Renamed Hall")
+
+    async def test_get_schedule_list_not_modified(self):
+        # Given
+        start_time = datetime.now() + timedelta(hours=1)
+        schedule = Schedule(
+            title="ETag Talk",
+            speaker_id=self.speaker.id,
+            room_id=self.room.id,
+            schedule_type_id=self.schedule_type.id,
+            tags=["python"],
+            start=start_time,
+            end=start_time + timedelta(hours=1),
+        )
+        self.db.add(schedule)
+        self.db.commit()
+
+        app.dependency_overrides[get_db_sync] = get_db_sync_for_test(db=self.db)
+        client = TestClient(app)
+
+        def rename():
+            schedule.title = "Renamed ETag Talk"
+            self.db.commit()
+
+        # When
+        changed = assert_revalidates(
+            client,
+            "/schedule/",
+            rename,
+            self.connection,
+            params={"page_size": 10, "page": 1},
+        )
+
+        # Expect
+        titles = [item["title"] for item in changed.json()["results"]]
+        self.assertIn("Renamed ETag Talk", titles)
+
     async def test_get_schedule_list_with_and_without_speaker(self):
         # Given
         start_time = datetime.now() + timedelta(hours=1)
@@ -1075,6 +1455,202 @@ class TestSchedule(IsolatedAsyncioTestCase):
         data = response.json()
         self.assertGreater(data["count"], 0)
 
+    def _add_search_schedules(self):
+        start_time = datetime.now() + timedelta(hours=1)
+        for title, description, tags, speaker_id in [
+            ("Serverless Patterns", "Running functions on Kubernetes", [], None),
+            ("Kubernetes Operators", "Writing controllers", [], None),
+            (
+                "Zanzibar Graphs",
+                "Authorization at scale",
+                ["quokkadb"],
+                self.speaker.id,
+            ),
+        ]:
+            self.db.add(
+                Schedule(
+                    title=title,
+                    description=description,
+                    tags=tags,
+                    speaker_id=speaker_id,
+                    room_id=self.room.id,
+                    schedule_type_id=self.schedule_type.id,
+                    start=start_time,
+                    end=start_time + timedelta(hours=1),
+                )
+            )
+            start_time += timedelta(hours=1)
+        self.db.commit()
+
+    async def test_get_schedule_list_full_text_search(self):
+        # Given
+        self._add_search_schedules()
+        app.dependency_overrides[get_db_sync] = get_db_sync_for_test(db=self.db)
+        client = TestClient(app)
+
+        def titles(search):
+            response = client.get(
+                "/schedule/", params={"page_size": 10, "page": 1, "search": search}
+            )
+            self.assertEqual(response.status_code, 200)
+            return [item["title"] for item in response.json()["results"]]
+
+        # When / Expect: a title match ranks above a description match
+        self.assertEqual(
+            titles("kuber"), ["Kubernetes Operators", "Serverless Patterns"]
+        )
+        # Tags, speaker names and several prefixes
+        self.assertEqual(titles("quokkadb"), ["Zanzibar Graphs"])
+        self.assertEqual(titles("jane do"), ["Zanzibar Graphs"])
+        self.assertEqual(titles("serverless kube"), ["Serverless Patterns"])
+        self.assertEqual(titles("kubernetes quokkadb"), [])
+        self.assertNotIn("Zanzibar Graphs", titles("!!!"))
+
+    async def test_get_schedule_cms_full_text_search(self):
+        # Given
+        self._add_search_schedules()
+        token, _ = await generate_token_from_user(db=self.db, user=self.user_management)
+        app.dependency_overrides[get_db_sync] = get_db_sync_for_test(db=self.db)
+        client = TestClient(app)
+
+        # When
+        response = client.get(
+            "/schedule/cms",
+            params={"page": 1, "page_size": 10, "search": "kuber"},
+            headers={"Authorization": f"Bearer {token}"},
+        )
+
+        # Expect
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual(data["count"], 2)
+        self.assertEqual(
+            [item["title"] for item in data["results"]],
+            ["Kubernetes Operators", "Serverless Patterns"],
+        )
+
+    def _add_schedules_around_midnight(self):
+        tz = timezone(TZ)
+        for title, start in [
+            ("Late Talk", tz.localize(datetime(2026, 10, 20, 23, 0))),
+            ("Midnight Talk", tz.localize(datetime(2026, 10, 21, 0, 30))),
+        ]:
+            self.db.add(
+                Schedule(
+                    title=title,
+                    room_id=self.room.id,
+                    schedule_type_id=self.schedule_type.id,
+                    start=start,
+                    end=start + timedelta(minutes=45),
+                )
+            )
+        self.db.commit()
+
+    def _schedule_plans(self, request):
+        """EXPLAIN of every query on the schedule table `request` runs"""
+        statements = []
+
+        def capture(conn, cursor, statement, parameters, context, executemany):
+            if "FROM public.schedule" in statement:
+                statements.append((statement, parameters))
+
+        event.listen(self.connection, "before_cursor_execute", capture)
+        try:
+            response = request()
+        finally:
+            event.remove(self.connection, "before_cursor_execute", capture)
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(statements)
+        return [
+            "\n".join(
+                self.connection.exec_driver_sql(f"EXPLAIN {statement}", parameters)
+                .scalars()
+                .all()
+            )
+            for statement, parameters in statements
+        ]
+
+    def _add_schedule_year(self):
+        # Plans for a handful of rows scan everything, with a couple of
+        # thousand schedules over 200 days an index has to be worth it
+        self.connection.exec_driver_sql(
+            'INSERT INTO public.schedule (id, title, start, "end") '
+            "SELECT gen_random_uuid(), 'Filler ' || i, "
+            "timestamptz '2026-04-01' + i * interval '2 hours 24 minutes', "
+            "timestamptz '2026-04-01' + i * interval '2 hours 24 minutes' "
+            "+ interval '45 minutes' FROM generate_series(1, 2000) i"
+        )
+        self.connection.exec_driver_sql("ANALYZE public.schedule")
+
+    def _assert_date_index_scans(self, plans):
+        for plan in plans:
+            self.assertNotIn("Seq Scan on schedule ", plan)
+            self.assertIn("Bitmap Index Scan on ix_public_schedule_start_active", plan)
+            self.assertIn("Bitmap Index Scan on ix_public_schedule_end_active", plan)
+            self.assertIn("Index Cond: ((start >=", plan)
+            self.assertIn('Index Cond: (("end" >=', plan)
+
+    async def test_get_schedule_list_by_date_in_tz(self):
+        # Given
+        self._add_schedules_around_midnight()
+        app.dependency_overrides[get_db_sync] = get_db_sync_for_test(db=self.db)
+        client = TestClient(app)
+
+        def titles(schedule_date):
+            response = client.get(
+                "/schedule/", params={"all": True, "schedule_date": schedule_date}
+            )
+            self.assertEqual(response.status_code, 200)
+            return [item["title"] for item in response.json()["results"]]
+
+        # When
+        day_1 = titles("2026-10-20")
+        day_2 = titles("2026-10-21")
+
+        # Expect: days are TZ days, Midnight Talk is on the 20th in UTC
+        self.assertIn("Late Talk", day_1)
+        self.assertNotIn("Midnight Talk", day_1)
+        self.assertIn("Midnight Talk", day_2)
+        self.assertNotIn("Late Talk", day_2)
+
+    async def test_get_schedule_list_by_date_uses_index(self):
+        # Given
+        self._add_schedules_around_midnight()
+        app.dependency_overrides[get_db_sync] = get_db_sync_for_test(db=self.db)
+        client = TestClient(app)
+        self._add_schedule_year()
+
+        # When
+        plans = self._schedule_plans(
+            lambda: client.get(
+                "/schedule/",
+                params={"page": 1, "page_size": 10, "schedule_date": "2026-10-20"},
+            )
+        )
+
+        # Expect
+        self._assert_date_index_scans(plans)
+
+    async def test_get_schedule_cms_by_date_uses_index(self):
+        # Given
+        self._add_schedules_around_midnight()
+        token, _ = await generate_token_from_user(db=self.db, user=self.user_management)
+        app.dependency_overrides[get_db_sync] = get_db_sync_for_test(db=self.db)
+        client = TestClient(app)
+        self._add_schedule_year()
+
+        # When
+        plans = self._schedule_plans(
+            lambda: client.get(
+                "/schedule/cms",
+                params={"page": 1, "page_size": 10, "schedule_date": "2026-10-20"},
+                headers={"Authorization": f"Bearer {token}"},
+            )
+        )
+
+        # Expect
+        self._assert_date_index_scans(plans)
+
     def tearDown(self) -> None:
         self.db.close()
 
@@ -8,6 +8,8 @@ from fastapi.testclient import TestClient
 from sqlalchemy import select
 
 from core.security import generate_token_from_user
+from core.snapshot_cache import clear_snapshots
+from routes.tests.utils import assert_revalidates
 from main import app
 from models import db, engine, get_db_sync, get_db_sync_for_test
 from models.Room import Room
@@ -33,6 +35,7 @@ class TestSpeaker(IsolatedAsyncioTestCase):
         # bind an individual Session to the connection, selecting
         # "create_savepoint" join_transaction_mode
         self.db = db(bind=self.connection, join_transaction_mode="create_savepoint")
+        clear_snapshots()
 
     async def test_get_all_speaker(self):
         # Given
@@ -455,6 +458,26 @@ class TestSpeaker(IsolatedAsyncioTestCase):
         usernames = {s["user"]["first_name"] for s in body["results"]}
         self.assertSetEqual(usernames, {"Alice", "Bob"})
 
+    async def test_get_speaker_public_not_modified(self):
+        # Given
+        st = SpeakerType(name="Public Speaker")
+        user = User(username="etag_user", first_name="Alice")
+        self.db.add(Speaker(user=user, speaker_type=st))
+        self.db.commit()
+
+        app.dependency_overrides[get_db_sync] = get_db_sync_for_test(db=self.db)
+        client = TestClient(app)
+
+        def rename():
+            user.first_name = "Alicia"
+            self.db.commit()
+
+        # When
+        changed = assert_revalidates(client, "/speaker/public", rename, self.connection)
+
+        # Expect
+        self.assertEqual(changed.json()["results"][0]["user"]["first_name"], "Alicia")
+
     async def test_get_schedule_by_speaker(self):
         # Given
         st = SpeakerType(name="Schedule Speaker")
@@ -7,6 +7,7 @@ import alembic.config
 from fastapi.testclient import TestClient
 
 from core.security import generate_token_from_user
+from core.user_cache import user_principal_cache
 from main import app
 from models import db, engine, get_db_sync, get_db_sync_for_test
 from models.Room import Room
@@ -16,6 +17,7 @@ from models.Speaker import Speaker
 from models.SpeakerType import SpeakerType
 from models.Stream import Stream, StreamStatus
 from models.User import MANAGEMENT_PARTICIPANT, User
+from routes.tests.utils import assert_max_queries
 from schemas.user_profile import ParticipantType
 
 
@@ -144,6 +146,62 @@ class TestStreaming(IsolatedAsyncioTestCase):
         mock_get_playback.assert_called_once_with("playback_123")
         mock_get_thumbnail.assert_called_once_with("playback_123")
 
+    @patch("core.mux_service.mux_service.get_public_playback_url")
+    @patch("core.mux_service.mux_service.get_public_thumbnail_url")
+    async def test_get_stream_playback_query_count(
+        self, mock_get_thumbnail, mock_get_playback
+    ):
+        # Given
+        mock_get_playback.return_value = "https://stream.mux.com/playback_123.m3u8"
+        mock_get_thumbnail.return_value = (
+            "https://image.mux.com/playback_123/thumbnail.jpg"
+        )
+
+        start_time = datetime.now() + timedelta(hours=1)
+        schedule = Schedule(
+            title="Test Schedule",
+            speaker_id=self.speaker.id,
+            room_id=self.room.id,
+            schedule_type_id=self.schedule_type.id,
+            tags=["python"],
+            start=start_time,
+            end=start_time + timedelta(hours=1),
+        )
+        self.db.add(schedule)
+        self.db.commit()
+
+        stream = Stream(
+            schedule_id=schedule.id,
+            is_public=True,
+            mux_live_stream_id="mux_stream_123",
+            mux_playback_id="playback_123",
+            mux_stream_key="stream_key_123",
+            status=StreamStatus.STREAMING,
+            created_at=datetime.now(),
+            updated_at=datetime.now(),
+        )
+        self.db.add(stream)
+        self.db.commit()
+
+        token, _ = await generate_token_from_user(
+            db=self.db, user=self.user_participant
+        )
+        stream_id = stream.id
+        self.db.expunge_all()
+        user_principal_cache.clear()
+        app.dependency_overrides[get_db_sync] = get_db_sync_for_test(db=self.db)
+        client = TestClient(app)
+
+        # When
+        with assert_max_queries(2, self.connection):
+            response = client.get(
+                f"/streaming/{stream_id}",
+                headers={"Authorization": f"Bearer {token}"},
+            )
+
+        # Expect
+        self.assertEqual(response.status_code, 200)
+
     @patch("core.mux_service.mux_service.get_public_playback_url")
     @patch("core.mux_service.mux_service.get_public_thumbnail_url")
     async def test_get_stream_playback_public_ready(
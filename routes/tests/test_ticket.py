@@ -12,6 +12,8 @@ from unittest import TestCase
 from datetime import datetime, timedelta
 from pytz import timezone
 from core.security import generate_hash_password
+from core.snapshot_cache import clear_snapshots
+from routes.tests.utils import assert_revalidates
 from settings import TZ, SECRET_KEY, ALGORITHM, ACCESS_TOKEN_EXPIRE_MINUTES
 import jwt
 
@@ -28,6 +30,7 @@ class TestTicket(TestCase):
         self.session = db(
             bind=self.connection, join_transaction_mode="create_savepoint"
         )
+        clear_snapshots()
 
         # Create test ticket
         self.ticket = Ticket(
@@ -92,6 +95,18 @@ class TestTicket(TestCase):
             for t in data["results"]
         )
 
+    def test_list_ticket_not_modified(self):
+        def change_price():
+            self.ticket.price = 654321
+            self.session.commit()
+
+        changed = assert_revalidates(
+            self.client, "/ticket/", change_price, self.connection
+        )
+
+        assert changed.headers["Cache-Control"] == "public, no-cache"
+        assert any(t["price"] == 654321 for t in changed.json()["results"])
+
     def test_get_my_ticket_without_payment(self):
         response = self.client.get(
             "/ticket/me", headers={"Authorization": f"Bearer {self.test_token}"}
@@ -6,6 +6,8 @@ from unittest import IsolatedAsyncioTestCase
 from fastapi.testclient import TestClient
 from sqlalchemy import select
 from core.security import generate_token_from_user
+from core.snapshot_cache import clear_snapshots
+from routes.tests.utils import assert_max_queries, assert_revalidates
 from models import engine, db, get_db_sync, get_db_sync_for_test
 from models.Volunteer import Volunteer
 from models.User import MANAGEMENT_PARTICIPANT, VOLUNTEER_PARTICIPANT, User
@@ -27,6 +29,7 @@ class TestVolunteer(IsolatedAsyncioTestCase):
         # bind an individual Session to the connection, selecting
         # "create_savepoint" join_transaction_mode
         self.db = db(bind=self.connection, join_transaction_mode="create_savepoint")
+        clear_snapshots()
 
     async def test_get_all_volunteer_public(self):
         # Given
@@ -512,6 +515,44 @@ class TestVolunteer(IsolatedAsyncioTestCase):
             ).model_dump(),
         )
 
+    async def test_get_volunteer_public_query_count(self):
+        # Given
+        for i in range(5):
+            user = User(username=f"volunteer-{i}", share_my_public_social_media=True)
+            self.db.add(Volunteer(user=user))
+        self.db.commit()
+        self.db.expunge_all()
+        app.dependency_overrides[get_db_sync] = get_db_sync_for_test(db=self.db)
+        client = TestClient(app)
+
+        # When
+        with assert_max_queries(2, self.connection):
+            response = client.get("/volunteer/public/")
+
+        # Expect
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.json()["results"]), 5)
+
+    async def test_get_volunteer_public_not_modified(self):
+        # Given
+        volunteer = Volunteer(user=User(username="etag_volunteer"))
+        self.db.add(volunteer)
+        self.db.commit()
+        app.dependency_overrides[get_db_sync] = get_db_sync_for_test(db=self.db)
+        client = TestClient(app)
+
+        def remove():
+            self.db.delete(volunteer)
+            self.db.commit()
+
+        # When
+        changed = assert_revalidates(
+            client, "/volunteer/public/", remove, self.connection
+        )
+
+        # Expect
+        self.assertEqual(changed.json()["results"], [])
+
     def tearDown(self):
         self.db.close()
 
@@ -0,0 +1,57 @@
+from contextlib import contextmanager
+from typing import Callable, Iterator, Optional
+
+from sqlalchemy.engine import Engine
+
+from core.query_counter import QueryListener, QueryStats
+
+
+@contextmanager
+def assert_max_queries(max_queries: int, target=Engine) -> Iterator[QueryStats]:
+    """
+    Fail the test when more than `max_queries` statements run on `target`
+    inside the block, by default on any engine
+
+        with assert_max_queries(4, self.connection):
+            client.get("/volunteer/public/")
+    """
+    stats = QueryStats()
+    listener = QueryListener(target, lambda: stats)
+    listener.listen()
+    try:
+        yield stats
+    finally:
+        listener.remove()
+
+    if stats.count > max_queries:
+        raise AssertionError(
+            f"{stats.count} queries, expected at most {max_queries}\n{stats.summary()}"
+        )
+
+
+def assert_revalidates(
+    client,
+    url: str,
+    change: Callable[[], None],
+    target=Engine,
+    params: Optional[dict] = None,
+):
+    """
+    Fail the test unless `url` answers its own ETag with 304 without a
+    query on `target`, and with a new ETag once `change` committed a change
+    to what it shows. Returns the response after the change.
+
+        changed = assert_revalidates(client, "/ticket/", rename, self.connection)
+    """
+    first = client.get(url, params=params)
+    etag = first.headers["ETag"]
+    with assert_max_queries(0, target):
+        cached = client.get(url, params=params, headers={"If-None-Match": etag})
+    change()
+    changed = client.get(url, params=params, headers={"If-None-Match": etag})
+
+    if cached.status_code != 304 or cached.headers["ETag"] != etag:
+        raise AssertionError(f"{url} answered its own ETag with {cached.status_code}")
+    if changed.status_code != 200 or changed.headers["ETag"] == etag:
+        raise AssertionError(f"{url} kept ETag {etag} after the change")
+    return changed
@@ -12,8 +12,14 @@ from core.responses import (
     PaymentRequired,
     Unauthorized,
     common_response,
+    json_body,
 )
-from core.security import get_user_from_token, oauth2_scheme
+from core.security import (
+    get_principal_from_token,
+    get_user_from_token,
+    oauth2_scheme,
+)
+from core.snapshot_cache import cached_response, ticket_snapshot
 from models import get_db_sync
 from models.Payment import PaymentStatus
 from models.User import MANAGEMENT_PARTICIPANT, VOLUNTEER_PARTICIPANT
@@ -51,23 +57,27 @@ router = APIRouter(prefix="/ticket", tags=["Ticket"])
 
 
 @router.get("/", response_model=TicketListResponse)
-def list_ticket(db: Session = Depends(get_db_sync)):
-    try:
-        tickets = get_active_tickets(db)
-        results = [
-            TicketResponse(
-                id=str(t.id),
-                name=t.name,
-                price=t.price,
-                user_participant_type=t.user_participant_type,
-                is_sold_out=t.is_sold_out,
-                description=t.description,
-            )
-            for t in tickets
-        ]
-        return TicketListResponse(results=results)
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Internal Server Error: {e}")
+def list_ticket(request: Request, db: Session = Depends(get_db_sync)):
+    def build():
+        try:
+            tickets = get_active_tickets(db)
+            results = [
+                TicketResponse(
+                    id=str(t.id),
+                    name=t.name,
+                    price=t.price,
+                    user_participant_type=t.user_participant_type,
+                    is_sold_out=t.is_sold_out,
+                    description=t.description,
+                )
+                for t in tickets
+            ]
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=f"Internal Server Error: {e}")
+        data = TicketListResponse(results=results).model_dump(mode="json")
+        return json_body(data)
+
+    return cached_response(ticket_snapshot, "active", request, build)
 
 
 @router.get(
@@ -209,7 +219,7 @@ async def checkin_user(
 ):
     logger.info(f"Checkin request received: {payload}")
     try:
-        checkin_staff_user = get_user_from_token(db=db, token=token)
+        checkin_staff_user = get_principal_from_token(db=db, token=token)
         if checkin_staff_user is None:
             logger.error("Unauthorized check-in attempt")
             return common_response(Unauthorized(message="Unauthorized"))
@@ -286,7 +296,7 @@ async def checkin_user_reset(
 ):
     logger.info(f"Checkin Reset request received: {payload}")
     try:
-        checkin_staff_user = get_user_from_token(db=db, token=token)
+        checkin_staff_user = get_principal_from_token(db=db, token=token)
         if checkin_staff_user is None:
             logger.error("Unauthorized check-in reset attempt")
             return common_response(Unauthorized(message="Unauthorized"))
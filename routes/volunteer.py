@@ -1,10 +1,11 @@
 from datetime import datetime
 from typing import Optional
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request
 from fastapi.responses import FileResponse
 from pytz import timezone
 from core.file import get_file
 from core.security import get_current_user
+from core.snapshot_cache import cached_response, volunteer_snapshot
 from models.User import MANAGEMENT_PARTICIPANT, User
 from schemas.volunteer import (
     CreateVolunteerRequest,
@@ -28,6 +29,7 @@ from core.responses import (
     Ok,
     Unauthorized,
     common_response,
+    json_body,
 )
 from models import get_db_sync
 from schemas.common import (
@@ -52,52 +54,56 @@ router = APIRouter(prefix="/volunteer", tags=["Volunteer"])
     },
 )
 async def get_volunteer_public(
-    query: VolunteerQuery = Depends(), db: Session = Depends(get_db_sync)
+    request: Request,
+    query: VolunteerQuery = Depends(),
+    db: Session = Depends(get_db_sync),
 ):
-    try:
-        data = volunteerRepo.get_all_volunteers(
-            db=db, order_dir=query.order_dir, search=query.search
-        )
-        return common_response(
-            Ok(
-                data=VolunteerResponse(
-                    results=[
-                        VolunteerResponseItem(
-                            id=str(volunteer.id),
-                            user=UserInVolunteerResponse(
-                                id=str(volunteer.user.id),
-                                username=volunteer.user.username,
-                                first_name=volunteer.user.first_name,
-                                last_name=volunteer.user.last_name,
-                                email=volunteer.user.email,
-                                website=volunteer.user.website
-                                if volunteer.user.share_my_public_social_media
-                                else None,
-                                facebook_username=volunteer.user.facebook_username
-                                if volunteer.user.share_my_public_social_media
-                                else None,
-                                linkedin_username=volunteer.user.linkedin_username
-                                if volunteer.user.share_my_public_social_media
-                                else None,
-                                twitter_username=volunteer.user.twitter_username
-                                if volunteer.user.share_my_public_social_media
-                                else None,
-                                instagram_username=volunteer.user.instagram_username
-                                if volunteer.user.share_my_public_social_media
-                                else None,
-                                profile_picture=volunteer.user.profile_picture,
-                            ),
-                        )
-                        for volunteer in data
-                    ]
-                ).model_dump()
+    key = (query.search, query.order_dir)
+
+    def build():
+        try:
+            volunteers = volunteerRepo.get_all_volunteers(
+                db=db, order_dir=query.order_dir, search=query.search
             )
-        )
-    except Exception as e:
-        import traceback
+            data = VolunteerResponse(
+                results=[
+                    VolunteerResponseItem(
+                        id=str(volunteer.id),
+                        user=UserInVolunteerResponse(
+                            id=str(volunteer.user.id),
+                            username=volunteer.user.username,
+                            first_name=volunteer.user.first_name,
+                            last_name=volunteer.user.last_name,
+                            email=volunteer.user.email,
+                            website=volunteer.user.website
+                            if volunteer.user.share_my_public_social_media
+                            else None,
+                            facebook_username=volunteer.user.facebook_username
+                            if volunteer.user.share_my_public_social_media
+                            else None,
+                            linkedin_username=volunteer.user.linkedin_username
+                            if volunteer.user.share_my_public_social_media
+                            else None,
+                            twitter_username=volunteer.user.twitter_username
+                            if volunteer.user.share_my_public_social_media
+                            else None,
+                            instagram_username=volunteer.user.instagram_username
+                            if volunteer.user.share_my_public_social_media
+                            else None,
+                            profile_picture=volunteer.user.profile_picture,
+                        ),
+                    )
+                    for volunteer in volunteers
+                ]
+            ).model_dump()
+        except Exception as e:
+            import traceback
 
-        traceback.print_exc()
-        return common_response(InternalServerError(error=str(e)))
+            traceback.print_exc()
+            return common_response(InternalServerError(error=str(e)))
+        return json_body(data)
+
+    return cached_response(volunteer_snapshot, key, request, build)
 
 
 @router.get(
@@ -1,9 +1,10 @@
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
 from core.responses import Forbidden, Unauthorized, common_response
-from core.security import get_current_user
+from core.security import get_current_principal
+from core.user_cache import UserPrincipal
 from models import get_db_sync
-from models.User import MANAGEMENT_PARTICIPANT, User
+from models.User import MANAGEMENT_PARTICIPANT
 from repository.voucher import (
     get_voucher_by_id,
     insert_voucher,
@@ -35,7 +36,7 @@ router = APIRouter(prefix="/voucher", tags=["Voucher"])
 def list_vouchers(
     query: VoucherQuery = Depends(),
     db: Session = Depends(get_db_sync),
-    user: User = Depends(get_current_user),
+    user: UserPrincipal = Depends(get_current_principal),
 ):
     try:
         if user is None:
@@ -63,7 +64,7 @@ def list_vouchers(
 def create_voucher(
     request: VoucherCreateRequest,
     db: Session = Depends(get_db_sync),
-    user: User = Depends(get_current_user),
+    user: UserPrincipal = Depends(get_current_principal),
 ):
     try:
         if user is None:
@@ -101,7 +102,7 @@ def create_voucher(
 def get_voucher(
     voucher_id: str,
     db: Session = Depends(get_db_sync),
-    user: User = Depends(get_current_user),
+    user: UserPrincipal = Depends(get_current_principal),
 ):
     if user is None:
         return common_response(Unauthorized(message="Unauthorized"))
@@ -129,7 +130,7 @@ def update_voucher_whole(
     voucher_id: str,
     request: VoucherUpdateRequest,
     db: Session = Depends(get_db_sync),
-    user: User = Depends(get_current_user),
+    user: UserPrincipal = Depends(get_current_principal),
 ):
     if user is None:
         return common_response(Unauthorized(message="Unauthorized"))
@@ -168,7 +169,7 @@ def update_voucher_status(
     voucher_id: str,
     request: VoucherUpdateStatusRequest,
     db: Session = Depends(get_db_sync),
-    user: User = Depends(get_current_user),
+    user: UserPrincipal = Depends(get_current_principal),
 ):
     try:
         if user is None:
@@ -203,7 +204,7 @@ def update_voucher_whitelist(
     voucher_id: str,
     request: VoucherUpdateWhitelistRequest,
     db: Session = Depends(get_db_sync),
-    user: User = Depends(get_current_user),
+    user: UserPrincipal = Depends(get_current_principal),
 ):
     try:
         if user is None:
@@ -238,7 +239,7 @@ def update_voucher_quota(
     voucher_id: str,
     request: VoucherUpdateQuotaRequest,
     db: Session = Depends(get_db_sync),
-    user: User = Depends(get_current_user),
+    user: UserPrincipal = Depends(get_current_principal),
 ):
     try:
         if user is None:
@@ -273,7 +274,7 @@ def update_voucher_value(
     voucher_id: str,
     request: VoucherUpdateValueRequest,
     db: Session = Depends(get_db_sync),
-    user: User = Depends(get_current_user),
+    user: UserPrincipal = Depends(get_current_principal),
 ):
     try:
         if user is None:
@@ -308,7 +309,7 @@ def update_voucher_type(
     voucher_id: str,
     request: VoucherUpdateTypeRequest,
     db: Session = Depends(get_db_sync),
-    user: User = Depends(get_current_user),
+    user: UserPrincipal = Depends(get_current_principal),
 ):
     try:
         if user is None:
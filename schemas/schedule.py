@@ -4,7 +4,13 @@ from typing import List, Optional
 from uuid import UUID
 
 from fastapi import Query
-from pydantic import BaseModel, Field, model_serializer, model_validator
+from pydantic import (
+    AwareDatetime,
+    BaseModel,
+    Field,
+    model_serializer,
+    model_validator,
+)
 
 from models.Stream import StreamStatus
 from schemas.speaker_type import DetailSpeakerResponse
@@ -19,7 +25,9 @@ class ScheduleQuery(BaseModel):
     page: Optional[int] = Query(1, description="Page Number")
     page_size: Optional[int] = Query(1, description="Page Size")
     schedule_date: Optional[date] = Query(None, description="Schedule Date")
-    search: Optional[str] = Query(None, description="Search by title name")
+    search: Optional[str] = Query(
+        None, description="Search by title, description, tags or speaker name"
+    )
     all: Optional[bool] = Query(None, description="Return all schedule data if true")
 
 
@@ -241,3 +249,41 @@ class ScheduleCMSResponse(BaseModel):
     count: int
     page_count: int
     results: List[ScheduleCMSResponseItem]
+
+
+class ValidateScheduleItem(BaseModel):
+    # A saved schedule this item moves, it's checked in its new slot only
+    id: Optional[UUID] = None
+    title: str
+    room_id: UUID
+    start: AwareDatetime
+    end: AwareDatetime
+
+    @model_validator(mode="after")
+    def check_dates(self):
+        if self.end < self.start:
+            raise ValueError("End time must be not be less than start time")
+        return self
+
+
+class ValidateScheduleRequest(BaseModel):
+    schedules: List[ValidateScheduleItem]
+
+
+class ScheduleSlot(BaseModel):
+    # Position in the request, None for a saved schedule
+    index: Optional[int] = None
+    id: Optional[UUID] = None
+    title: str
+    start: datetime
+    end: datetime
+
+
+class ScheduleConflict(BaseModel):
+    room_id: UUID
+    schedule: ScheduleSlot
+    conflicts_with: ScheduleSlot
+
+
+class ValidateScheduleResponse(BaseModel):
+    conflicts: List[ScheduleConflict]
@@ -0,0 +1,53 @@
+import re
+import statistics
+import subprocess
+import sys
+
+# Dependencies kept out of the startup import graph, see main.create_app
+LAZY_MODULES = ("pgeocode", "pandas", "numpy", "mux_python", "authlib", "fastapi_mail")
+
+# import time: <self us> | <cumulative us> | <indent><module>
+_IMPORTTIME_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|( +)(\S+)")
+
+
+def _import_times(module: str) -> dict[str, tuple[int, int]]:
+    """Cumulative microseconds and nesting depth per module imported"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if match:
+            depth = (len(match.group(3)) - 1) // 2
+            times[match.group(4)] = (int(match.group(2)), depth)
+    return times
+
+
+def benchmark_import_time(module: str = "main", runs: int = 5, top: int = 15):
+    """
+    Cold start import time of `module`, each run in a new interpreter as in
+    a new container
+
+    Prints the median total, the slowest modules `module` imports directly
+    and which of the lazily imported dependencies were loaded anyway.
+    """
+    samples = [_import_times(module) for _ in range(runs)]
+
+    def median_ms(name: str) -> float:
+        return statistics.median(s[name][0] for s in samples if name in s) / 1000
+
+    print(f"import {module}: {median_ms(module):.0f}ms (median of {runs} runs)")
+
+    direct = {name for name, (_, depth) in samples[0].items() if depth == 1}
+    print(f"\n{'direct import':<40}{'ms':>8}")
+    for name in sorted(direct, key=median_ms, reverse=True)[:top]:
+        print(f"{name:<40}{median_ms(name):>8.0f}")
+
+    print(f"\n{'lazy dependency':<40}{'ms':>8}")
+    for name in LAZY_MODULES:
+        loaded = f"{median_ms(name):>8.0f}" if name in samples[0] else " not loaded"
+        print(f"{name:<40}{loaded}")
@@ -0,0 +1,96 @@
+import asyncio
+import time
+
+
+def _create_app(middleware):
+    from fastapi import FastAPI
+
+    from core.rate_limiter.memory import InMemoryRateLimiter
+
+    app = FastAPI()
+
+    @app.get("/health")
+    def health():
+        return {"status": "ok"}
+
+    @app.get("/items")
+    async def items():
+        return [
+            {"id": i, "title": f"Talk {i}", "description": "x" * 200} for i in range(50)
+        ]
+
+    if middleware is not None:
+        app.add_middleware(
+            middleware,
+            backend=InMemoryRateLimiter(),
+            limit=1_000_000,
+            window=60,
+            use_fingerprint=False,
+        )
+    return app
+
+
+async def _requests_per_second(app, path: str, requests: int, concurrency: int):
+    """Call the ASGI app directly, an HTTP client would dominate the timing"""
+
+    async def call():
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": "GET",
+            "scheme": "http",
+            "path": path,
+            "raw_path": path.encode(),
+            "root_path": "",
+            "query_string": b"",
+            "headers": [(b"host", b"bench"), (b"user-agent", b"bench")],
+            "client": ("127.0.0.1", 50000),
+            "server": ("bench", 80),
+        }
+
+        async def receive():
+            return {"type": "http.request", "body": b"", "more_body": False}
+
+        status = None
+
+        async def send(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+
+        await app(scope, receive, send)
+        assert status == 200, status
+
+    async def worker(count: int):
+        for _ in range(count):
+            await call()
+
+    # Warm up
+    await worker(100)
+    start = time.perf_counter()
+    await asyncio.gather(*[worker(requests // concurrency) for _ in range(concurrency)])
+    return requests / (time.perf_counter() - start)
+
+
+def benchmark_middleware(requests: int = 5000, concurrency: int = 20):
+    """Requests per second without, with the old and with the ASGI middleware"""
+    from core.rate_limiter.middleware import (
+        ASGIRateLimitMiddleware,
+        RateLimitMiddleware,
+    )
+
+    variants = {
+        "none": None,
+        "BaseHTTPMiddleware": RateLimitMiddleware,
+        "ASGI": ASGIRateLimitMiddleware,
+    }
+    print(f"{requests} requests, {concurrency} concurrent clients")
+    print(f"{'middleware':<20}{'/health req/s':>16}{'/items req/s':>16}")
+    for name, middleware in variants.items():
+        app = _create_app(middleware)
+        health, items = [
+            asyncio.run(_requests_per_second(app, path, requests, concurrency))
+            for path in ["/health", "/items"]
+        ]
+        print(f"{name:<20}{health:>16.0f}{items:>16.0f}")
@@ -0,0 +1,116 @@
+import asyncio
+import os
+import tempfile
+import time
+
+from core.rate_limiter.base import BaseRateLimiter
+
+
+async def _measure(limiter: BaseRateLimiter, requests: int, keys: int) -> float:
+    """Average microseconds per hit, the one call the middleware makes"""
+    start = time.perf_counter()
+    for i in range(requests):
+        await limiter.hit(f"bench:{i % keys}", 1_000_000, 60)
+    return (time.perf_counter() - start) / requests * 1_000_000
+
+
+def benchmark_rate_limiter(
+    requests: int = 20000, keys: int = 1000, with_postgres: bool = False
+):
+    from core.rate_limiter.memory import InMemoryRateLimiter
+    from core.rate_limiter.shared_memory import SharedMemoryRateLimiter
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        backends = {
+            "memory": InMemoryRateLimiter(),
+            "shared_memory": SharedMemoryRateLimiter(
+                path=os.path.join(tmp_dir, "rate_limit"), slots=keys * 2
+            ),
+        }
+        if with_postgres:
+            from core.rate_limiter.postgres import PostgresRateLimiter
+
+            # Round trips dominate, a smaller sample is enough
+            backends["postgres"] = PostgresRateLimiter()
+
+        print(f"{'backend':<15}{'requests':>10}{'us/request':>14}")
+        for name, limiter in backends.items():
+            count = requests if name != "postgres" else min(requests, 1000)
+            per_request = asyncio.run(_measure(limiter, count, keys))
+            print(f"{name:<15}{count:>10}{per_request:>14.1f}")
+
+            for i in range(keys):
+                asyncio.run(limiter.reset(f"bench:{i}"))
+
+
+def benchmark_rate_limiter_algorithms(
+    keys: int = 100_000, limit: int = 100, requests_per_key: int = 20
+):
+    """Time per request and memory of each in-memory algorithm with many keys"""
+    import tracemalloc
+
+    from core.rate_limiter.memory import ALGORITHMS, InMemoryRateLimiter
+
+    async def fill(limiter: InMemoryRateLimiter) -> float:
+        start = time.perf_counter()
+        for _ in range(requests_per_key):
+            for i in range(keys):
+                await limiter.is_allowed(f"bench:{i}", limit, 60)
+        return (time.perf_counter() - start) / (keys * requests_per_key) * 1_000_000
+
+    print(f"{keys} active keys, {requests_per_key} requests per key, limit {limit}")
+    print(f"{'algorithm':<25}{'us/request':>12}{'memory MB':>12}")
+    for algorithm in ALGORITHMS:
+        per_request = asyncio.run(fill(InMemoryRateLimiter(algorithm=algorithm)))
+
+        # Separate run, tracemalloc slows down every allocation
+        tracemalloc.start()
+        limiter = InMemoryRateLimiter(algorithm=algorithm)
+        asyncio.run(fill(limiter))
+        memory, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del limiter
+
+        print(f"{algorithm:<25}{per_request:>12.2f}{memory / 1024 / 1024:>12.1f}")
+
+
+def benchmark_path_matcher(patterns: int = 300, paths: int = 10000):
+    """Exclusion check per request, pattern loop against the compiled matcher"""
+    import random
+    from fnmatch import fnmatch
+
+    from core.rate_limiter.path_matcher import PathMatcher
+
+    def loop_should_exclude(path: str) -> bool:
+        normalized_path = path.rstrip("/") or "/"
+        for exclude_path in exclude_paths:
+            pattern = exclude_path.rstrip("/") or "/"
+            if any(ch in pattern for ch in ["*", "?", "["]):
+                if fnmatch(normalized_path, pattern):
+                    return True
+            elif normalized_path.startswith(pattern):
+                return True
+        return False
+
+    rng = random.Random(0)
+    exclude_paths = [
+        f"/service-{i}/" if i % 3 else f"/service-{i}/*/picture/"
+        for i in range(patterns)
+    ]
+    # Mostly paths that are rate limited, those check every pattern
+    requests = [
+        f"/schedule/{rng.randint(1, 1000)}"
+        if rng.random() < 0.9
+        else f"/service-{rng.randrange(patterns)}/1/picture/"
+        for _ in range(paths)
+    ]
+    matcher = PathMatcher(exclude_paths)
+
+    print(f"{patterns} patterns, {paths} paths")
+    print(f"{'matcher':<12}{'us/path':>10}")
+    for name, check in [("loop", loop_should_exclude), ("compiled", matcher.matches)]:
+        start = time.perf_counter()
+        for path in requests:
+            check(path)
+        per_path = (time.perf_counter() - start) / paths * 1_000_000
+        print(f"{name:<12}{per_path:>10.2f}")
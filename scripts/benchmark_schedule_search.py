@@ -0,0 +1,147 @@
+import time
+
+from sqlalchemy import func, or_, select, text
+
+# Each title has one of these common words, and like description, tags
+# and speaker a rare one, e.g. "Python with lib42"
+_WORDS = [
+    "python",
+    "django",
+    "fastapi",
+    "asyncio",
+    "pandas",
+    "kubernetes",
+    "testing",
+    "typing",
+    "packaging",
+    "security",
+    "observability",
+    "postgres",
+    "machine",
+    "learning",
+    "education",
+    "community",
+]
+# Common word, prefix of a common word, rare title, description, tag and
+# speaker words
+SEARCHES = ["python", "kuber", "lib42", "tool77", "tag12", "speaker42"]
+
+
+def _average_ms(connection, stmt, runs: int) -> float:
+    connection.execute(stmt).all()
+    start = time.perf_counter()
+    for _ in range(runs):
+        connection.execute(stmt).all()
+    return (time.perf_counter() - start) / runs * 1000
+
+
+def _scan(connection, stmt) -> str:
+    """Scan nodes of the plan that ran, Seq Scan or Bitmap Index Scan on ..."""
+    compiled = stmt.compile(connection)
+    plan = connection.exec_driver_sql(
+        f"EXPLAIN (ANALYZE, COSTS OFF, TIMING OFF) {compiled}", compiled.params
+    )
+    nodes = [line.strip().removeprefix("-> ") for line in plan.scalars()]
+    return ", ".join(
+        dict.fromkeys(
+            node for node in nodes if " on schedule" in node and "Scan" in node
+        )
+    )
+
+
+def benchmark_schedule_search(schedules: int = 10_000, runs: int = 20):
+    """
+    Schedule search with ILIKE on the title (the old search), ILIKE over
+    every field the full-text search covers, and the full-text search
+
+    The rows are inserted in a transaction that is rolled back at the end.
+    """
+    from models import engine
+    from models.Schedule import Schedule
+    from models.Speaker import Speaker
+    from models.User import User
+    from repository.schedule import _search_terms
+
+    words = "(ARRAY[" + ", ".join(f"'{word}'" for word in _WORDS) + "])"
+    with engine.connect() as connection:
+        transaction = connection.begin()
+        try:
+            start = time.perf_counter()
+            speakers = max(schedules // 20, 1)
+            connection.execute(
+                text(
+                    'INSERT INTO public."user" (id, username, first_name, last_name) '
+                    "SELECT gen_random_uuid(), 'search-benchmark-' || i, "
+                    "(ARRAY['Jane', 'John', 'Budi', 'Siti'])[1 + i % 4], "
+                    "'Speaker' || i FROM generate_series(0, :speakers - 1) i"
+                ),
+                {"speakers": speakers},
+            )
+            connection.execute(
+                text(
+                    "INSERT INTO public.speaker (id, user_id) "
+                    'SELECT gen_random_uuid(), id FROM public."user" '
+                    "WHERE username LIKE 'search-benchmark-%'"
+                )
+            )
+            connection.execute(
+                text(
+                    "INSERT INTO public.schedule "
+                    '(id, speaker_id, title, description, tags, start, "end") '
+                    "SELECT gen_random_uuid(), s.id, "
+                    f"initcap({words}[1 + i % 16]) || ' with lib' || i % 1000, "
+                    "'How tool' || i * 7 % 1000 || ' helps ' "
+                    f"|| {words}[1 + i / 16 % 16], "
+                    "ARRAY['tag' || i % 300], "
+                    "now() + i * interval '1 minute', "
+                    "now() + i * interval '1 minute' + interval '30 minutes' "
+                    "FROM generate_series(1, :schedules) i "
+                    'JOIN public."user" u '
+                    "ON u.username = 'search-benchmark-' || i % :speakers "
+                    "JOIN public.speaker s ON s.user_id = u.id"
+                ),
+                {"schedules": schedules, "speakers": speakers},
+            )
+            connection.execute(text('ANALYZE public.schedule, public."user"'))
+            print(
+                f"inserted {schedules} schedules in {time.perf_counter() - start:.1f}s"
+            )
+
+            print(f"{'search':<20}{'query':<14}{'rows':>6}{'ms':>9}  scans")
+            for search in SEARCHES:
+                pattern = f"%{search}%"
+                speaker_ids = (
+                    select(Speaker.id)
+                    .join(User, Speaker.user_id == User.id)
+                    .where(
+                        or_(
+                            User.first_name.ilike(pattern),
+                            User.last_name.ilike(pattern),
+                        )
+                    )
+                )
+                term, rank = _search_terms(search)
+                queries = {
+                    "ilike title": select(Schedule.id).where(
+                        Schedule.title.ilike(pattern)
+                    ),
+                    "ilike all": select(Schedule.id).where(
+                        or_(
+                            Schedule.title.ilike(pattern),
+                            Schedule.description.ilike(pattern),
+                            func.array_to_string(Schedule.tags, " ").ilike(pattern),
+                            Schedule.speaker_id.in_(speaker_ids),
+                        )
+                    ),
+                    "full text": select(Schedule.id).where(term).order_by(rank.desc()),
+                }
+                for label, stmt in queries.items():
+                    stmt = stmt.where(Schedule.deleted_at.is_(None))
+                    rows = len(connection.execute(stmt).all())
+                    ms = _average_ms(connection, stmt, runs)
+                    print(
+                        f"{search:<20}{label:<14}{rows:>6}{ms:>9.2f}"
+                        f"  {_scan(connection, stmt)}"
+                    )
+        finally:
+            transaction.rollback()
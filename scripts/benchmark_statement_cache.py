@@ -0,0 +1,100 @@
+import time
+import uuid
+from typing import Callable
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import joinedload
+
+
+def _per_call_us(call: Callable, calls: int) -> float:
+    call()
+    start = time.perf_counter()
+    for _ in range(calls):
+        call()
+    return (time.perf_counter() - start) / calls * 1_000_000
+
+
+def benchmark_statement_cache(calls: int = 2000):
+    """
+    Per call cost of the hot lookups built with select() on every call
+    versus as lambda statements, and of running them with and without
+    server side prepared statements
+
+    `build` is constructing the statement and its cache key, the Python
+    work repeated on every call before the compiled SQL is found in the
+    cache. `execute` is the whole Session.execute round trip.
+    """
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import Session
+
+    from core.security import _principal_stmt
+    from models import DATABASE_URL
+    from models.Payment import Payment, PaymentStatus
+    from models.Ticket import Ticket
+    from models.Token import Token, hash_token
+    from models.User import User
+    from models.Voucher import Voucher
+    from repository.payment import _user_paid_payment_stmt
+    from repository.ticket import _active_ticket_by_id_stmt
+    from repository.voucher import _voucher_by_code_stmt
+
+    user_id = str(uuid.uuid4())
+    ticket_id = str(uuid.uuid4())
+    token = f"benchmark.{'x' * 200}"
+    code = "BENCHMARK"
+
+    queries = {
+        "ticket by id": (
+            lambda: select(Ticket).where(Ticket.id == ticket_id, Ticket.is_active),
+            lambda: _active_ticket_by_id_stmt(ticket_id),
+        ),
+        "voucher by code": (
+            lambda: select(Voucher).where(func.upper(Voucher.code) == code),
+            lambda: _voucher_by_code_stmt(code),
+        ),
+        "paid payment": (
+            lambda: select(Payment)
+            .options(joinedload(Payment.ticket), joinedload(Payment.voucher))
+            .where(
+                Payment.user_id == user_id,
+                Payment.status == PaymentStatus.PAID.value,
+            ),
+            lambda: _user_paid_payment_stmt(user_id),
+        ),
+        "token lookup": (
+            lambda: select(
+                Token.expired_at, User.id, User.username, User.participant_type
+            )
+            .join(User, Token.user_id == User.id)
+            .where(Token.token_hash == hash_token(token), Token.user_id == user_id),
+            lambda: _principal_stmt(token, user_id),
+        ),
+    }
+
+    engines = {
+        "unprepared": create_engine(
+            DATABASE_URL, connect_args={"prepare_threshold": None}
+        ),
+        "prepared": create_engine(DATABASE_URL, connect_args={"prepare_threshold": 1}),
+    }
+
+    print(
+        f"{'query':<18}{'statement':<11}{'build us':>10}"
+        f"{'unprepared us':>15}{'prepared us':>13}"
+    )
+    for name, builders in queries.items():
+        for label, build in zip(("select", "lambda"), builders):
+            build_us = _per_call_us(lambda: build()._generate_cache_key(), calls)
+            execute_us = {}
+            for mode, engine in engines.items():
+                with Session(engine) as session:
+                    execute_us[mode] = _per_call_us(
+                        lambda: session.execute(build()).first(), calls
+                    )
+            print(
+                f"{name:<18}{label:<11}{build_us:>10.1f}"
+                f"{execute_us['unprepared']:>15.1f}{execute_us['prepared']:>13.1f}"
+            )
+
+    for engine in engines.values():
+        engine.dispose()
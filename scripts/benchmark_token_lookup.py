@@ -0,0 +1,66 @@
+import time
+
+from sqlalchemy import text
+
+
+def _average_ms(connection, statement: str, params: list[dict]) -> float:
+    start = time.perf_counter()
+    for p in params:
+        connection.execute(text(statement), p).first()
+    return (time.perf_counter() - start) / len(params) * 1000
+
+
+def benchmark_token_lookup(rows: int = 1_000_000, lookups: int = 200):
+    """
+    Token lookup by full JWT versus by its indexed hash
+
+    The rows are inserted in a transaction that is rolled back at the end.
+    """
+    from models import engine
+    from models.Token import hash_token
+
+    with engine.connect() as connection:
+        transaction = connection.begin()
+        try:
+            user_id = connection.execute(
+                text(
+                    'INSERT INTO public."user" (id, username) '
+                    "VALUES (gen_random_uuid(), 'token-benchmark') RETURNING id"
+                )
+            ).scalar_one()
+
+            start = time.perf_counter()
+            connection.execute(
+                text(
+                    "INSERT INTO public.token (id, user_id, token, token_hash, expired_at) "
+                    "SELECT gen_random_uuid(), :user_id, t, "
+                    "encode(sha256(convert_to(t, 'UTF8')), 'hex'), "
+                    "now() + interval '1 day' "
+                    "FROM (SELECT 'benchmark.' || repeat('x', 200) || '.' || i AS t "
+                    "FROM generate_series(1, :rows) i) s"
+                ),
+                {"user_id": user_id, "rows": rows},
+            )
+            connection.execute(text("ANALYZE public.token"))
+            print(f"inserted {rows} tokens in {time.perf_counter() - start:.1f}s")
+
+            step = max(rows // lookups, 1)
+            tokens = [f"benchmark.{'x' * 200}.{i}" for i in range(1, rows + 1, step)][
+                :lookups
+            ]
+
+            by_token = _average_ms(
+                connection,
+                "SELECT id FROM public.token WHERE token = :token",
+                [{"token": t} for t in tokens[:20]],
+            )
+            by_hash = _average_ms(
+                connection,
+                "SELECT id FROM public.token WHERE token_hash = :token_hash",
+                [{"token_hash": hash_token(t)} for t in tokens],
+            )
+            print(f"{'lookup':<12}{'ms/lookup':>12}")
+            print(f"{'token':<12}{by_token:>12.3f}")
+            print(f"{'token_hash':<12}{by_hash:>12.3f}")
+        finally:
+            transaction.rollback()
@@ -34,6 +34,30 @@ if ACCESS_TOKEN_EXPIRE_MINUTES is not None:
 REFRESH_TOKEN_EXPIRE_MINUTES = os.environ.get("REFRESH_TOKEN_EXPIRE_MINUTES", 60)
 if REFRESH_TOKEN_EXPIRE_MINUTES is not None:
     REFRESH_TOKEN_EXPIRE_MINUTES = int(REFRESH_TOKEN_EXPIRE_MINUTES)
+# Verified tokens kept in memory, so a token is verified once per lifetime
+JWT_CACHE_SIZE = int(os.environ.get("JWT_CACHE_SIZE", "10000"))
+# Seconds a verified token is kept at most, also for tokens without exp
+JWT_CACHE_MAX_TTL = int(os.environ.get("JWT_CACHE_MAX_TTL", "300"))
+# bcrypt work factor of new hashes, older hashes are rehashed on login
+BCRYPT_ROUNDS = int(os.environ.get("BCRYPT_ROUNDS", "12"))
+# Passwords hashed or checked at once per worker, more requests wait
+BCRYPT_MAX_THREADS = int(os.environ.get("BCRYPT_MAX_THREADS", "4"))
+# Authenticated users kept in memory per token, other workers see logouts
+# and profile changes after at most USER_CACHE_TTL seconds
+USER_CACHE_SIZE = int(os.environ.get("USER_CACHE_SIZE", "10000"))
+USER_CACHE_TTL = int(os.environ.get("USER_CACHE_TTL", "5"))
+# Serialised public responses (schedule, speakers, tickets, ...) per worker
+# and endpoint, dropped when the data they show changes, other workers catch
+# up within SNAPSHOT_CACHE_TTL
+SNAPSHOT_CACHE_SIZE = int(os.environ.get("SNAPSHOT_CACHE_SIZE", "256"))
+SNAPSHOT_CACHE_TTL = int(os.environ.get("SNAPSHOT_CACHE_TTL", "30"))
+# Background deletion of expired tokens, email verifications and reset
+# password requests, kept EXPIRED_ROW_RETENTION seconds after they expire
+EXPIRED_ROW_REAPER_INTERVAL = int(os.environ.get("EXPIRED_ROW_REAPER_INTERVAL", "300"))
+EXPIRED_ROW_REAPER_BATCH_SIZE = int(
+    os.environ.get("EXPIRED_ROW_REAPER_BATCH_SIZE", "1000")
+)
+EXPIRED_ROW_RETENTION = int(os.environ.get("EXPIRED_ROW_RETENTION", "86400"))
 
 # Timezone
 TZ = os.environ.get("TZ", "Asia/Jakarta")
@@ -44,6 +68,20 @@ POSTGRES_PASSWORD = os.environ.get("POSTGRES_PASSWORD")
 POSTGRES_HOST = os.environ.get("POSTGRES_HOST")
 POSTGRES_PORT = os.environ.get("POSTGRES_PORT")
 POSTGRES_DATABASE = os.environ.get("POSTGRES_DATABASE")
+# Connection pool of each engine per worker
+DB_POOL_SIZE = int(os.environ.get("DB_POOL_SIZE", "20"))
+DB_MAX_OVERFLOW = int(os.environ.get("DB_MAX_OVERFLOW", "0"))
+# Seconds a request waits for a free connection before failing
+DB_POOL_TIMEOUT = float(os.environ.get("DB_POOL_TIMEOUT", "30"))
+# Seconds after which a connection is replaced, -1 keeps them forever
+DB_POOL_RECYCLE = int(os.environ.get("DB_POOL_RECYCLE", "1800"))
+DB_POOL_PRE_PING = str_to_bool(os.environ.get("DB_POOL_PRE_PING", "True"))
+# psycopg prepares a statement on the server once it ran this many times on
+# a connection, empty disables it (required behind pgbouncer in transaction
+# pooling mode)
+DB_PREPARE_THRESHOLD = os.environ.get("DB_PREPARE_THRESHOLD", "2") or None
+if DB_PREPARE_THRESHOLD is not None:
+    DB_PREPARE_THRESHOLD = int(DB_PREPARE_THRESHOLD)
 
 FRONTEND_BASE_URL = os.environ.get("FRONTEND_BASE_URL")
 
@@ -73,6 +111,29 @@ RATE_LIMIT_WINDOW = int(os.environ.get("RATE_LIMIT_WINDOW", "60"))
 RATE_LIMIT_EXCLUDED_PATHS = os.environ.get(
     "RATE_LIMIT_EXCLUDED_PATHS", "/docs,/openapi.json"
 ).split(",")
+# memory, shared_memory (all workers on one host) or postgres (all nodes)
+RATE_LIMIT_BACKEND = os.environ.get("RATE_LIMIT_BACKEND", "memory")
+# memory backend only: sliding_log or sliding_window_counter
+RATE_LIMIT_ALGORITHM = os.environ.get("RATE_LIMIT_ALGORITHM", "sliding_log")
+RATE_LIMIT_SHARED_MEMORY_PATH = os.environ.get(
+    "RATE_LIMIT_SHARED_MEMORY_PATH", "/dev/shm/pyconid25_rate_limit"
+)
+RATE_LIMIT_SHARED_MEMORY_SLOTS = int(
+    os.environ.get("RATE_LIMIT_SHARED_MEMORY_SLOTS", "65536")
+)
+# memory backend only: least recently used keys are dropped above this
+RATE_LIMIT_MAX_KEYS = int(os.environ.get("RATE_LIMIT_MAX_KEYS", "100000"))
+# Seconds between background sweeps of idle rate limit keys
+RATE_LIMIT_CLEANUP_INTERVAL = int(os.environ.get("RATE_LIMIT_CLEANUP_INTERVAL", "60"))
+
+# Event loop lag monitor, logs the route and stack of anything blocking the
+# loop longer than the threshold, see /metrics/event-loop
+LOOP_MONITOR_ENABLED = str_to_bool(os.environ.get("LOOP_MONITOR_ENABLED", "False"))
+LOOP_MONITOR_THRESHOLD_MS = int(os.environ.get("LOOP_MONITOR_THRESHOLD_MS", "100"))
+# Count the queries of every request, send them in a Server-Timing header
+# and log statements repeated QUERY_REPEAT_THRESHOLD times (N+1), for dev
+QUERY_STATS_ENABLED = str_to_bool(os.environ.get("QUERY_STATS_ENABLED", "False"))
+QUERY_REPEAT_THRESHOLD = int(os.environ.get("QUERY_REPEAT_THRESHOLD", "5"))
 
 # Mayar Payment Gateway conf
 MAYAR_API_KEY = os.environ.get("MAYAR_API_KEY", "")
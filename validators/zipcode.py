@@ -1,5 +1,4 @@
 import traceback
-import pgeocode
 from typing import Optional, Tuple
 
 
@@ -10,6 +9,10 @@ class ZipCodeValidator:
     def _get_nominatim(self, country_code: str):
         """Get or create Nominatim instance for country"""
         if country_code not in self._nominatim_cache:
+            # pgeocode pulls in pandas, imported on first validation instead
+            # of at startup
+            import pgeocode
+
             try:
                 self._nominatim_cache[country_code] = pgeocode.Nominatim(country_code)
             except Exception: